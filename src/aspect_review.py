@@ -0,0 +1,228 @@
+"""Aspect Review - Fan a file out into concurrent, narrowly focused review prompts"""
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, List, Optional, Tuple
+from .change_analyzer import hints_section
+from .findings import findings_from_text
+from .config import config
+from .source_collector import SourceFile
+from .symbol_index import context_section
+from .usage import current_scope, use_scope
+
+if TYPE_CHECKING:
+    from .llm_client import LLMClient
+
+
+# Aspect name -> what its reviewer looks for
+ASPECTS = {
+    "bugs": "bugs and potential errors: wrong logic or conditions, off-by-one errors, "
+            "unhandled edge cases and exceptions, resource leaks, race conditions",
+    "security": "security vulnerabilities: injection, unsafe deserialization or file access, "
+                "hard-coded secrets, missing input validation, weak cryptography",
+    "performance": "performance issues: needless work in loops, poor algorithmic complexity, "
+                   "repeated I/O or allocations, blocking calls, missing caching",
+    "quality": "code quality and best practice violations: duplication, confusing structure, "
+               "poor error handling, misuse of language or library APIs",
+    "language": "language issues in comments, strings and names: typos, grammar, unclear wording",
+}
+
+# Reply asked of an aspect reviewer that found nothing
+NO_FINDINGS = "NONE"
+
+# Word-overlap ratio above which two findings on the same line are one issue
+SIMILARITY_THRESHOLD = 0.5
+
+# Short and very common words ignored when comparing findings
+STOP_WORDS = frozenset(
+    "the and for are but not you this that with from have has was were will can may "
+    "should could would into when then than use used using line code".split()
+)
+
+
+@dataclass
+class AspectFinding:
+    """Issue reported by one or more aspect reviewers"""
+    line: Optional[int]
+    message: str
+    aspects: List[str] = field(default_factory=list)
+    
+    def format(self) -> str:
+        """Render the finding as review text"""
+        tag = f"[{', '.join(self.aspects)}]"
+        if self.line is None:
+            return f"{tag} {self.message}"
+        return f"Line {self.line}: {tag} {self.message}"
+
+
+def parse_aspects(spec: str) -> List[str]:
+    """
+    Parse a comma-separated aspect list.
+    
+    Args:
+        spec: Aspect names, or "all"
+    
+    Returns:
+        Aspect names in the order given, without duplicates
+    
+    Raises:
+        ValueError: If an aspect is unknown or none is given
+    """
+    if spec.strip().lower() == "all":
+        return list(ASPECTS)
+    aspects = []
+    for name in (part.strip().lower() for part in spec.split(",")):
+        if not name:
+            continue
+        if name not in ASPECTS:
+            raise ValueError(f"Unknown review aspect '{name}' - use {', '.join(ASPECTS)} or all")
+        if name not in aspects:
+            aspects.append(name)
+    if not aspects:
+        raise ValueError("No review aspects given")
+    return aspects
+
+
+def configured_aspects() -> Optional[List[str]]:
+    """
+    Return the aspects configured by CODER_REVIEW_ASPECTS.
+    
+    Returns:
+        Aspect names, or None for a single combined review prompt
+    
+    Raises:
+        ValueError: If the configuration names an unknown aspect
+    """
+    spec = config.get_review_aspects()
+    return parse_aspects(spec) if spec.strip() else None
+
+
+def aspects_label(aspects: Optional[List[str]]) -> str:
+    """Suffix distinguishing stored results and journals of aspect reviews"""
+    return f"+aspects:{','.join(aspects)}" if aspects else ""
+
+
+def build_aspect_prompt(aspect: str, source_file: SourceFile) -> Tuple[str, str]:
+    """
+    Build the prompts of one aspect reviewer.
+    
+    Args:
+        aspect: Aspect name
+        source_file: File or diff to review
+    
+    Returns:
+        Tuple of (system_prompt, user_message)
+    """
+    scope = "the ADDED LINES (marked with +) of these git changes" if source_file.is_diff else "this code"
+    system_prompt = f"""You are an expert code reviewer specialized in ONE aspect: {ASPECTS[aspect]}.
+
+Report ONLY issues of this kind in {scope}. Other reviewers cover every other aspect, so ignore anything else.
+
+IMPORTANT:
+- One issue per line, in "Line X: description" format
+- Be concise and actionable
+- Skip positive feedback entirely
+- If there is nothing to report, reply with exactly: {NO_FINDINGS}"""
+    
+    user_message = f"""File: {source_file.path}
+
+```
+{source_file.content}
+```{context_section(source_file.context)}{hints_section(source_file.hints)}"""
+    return system_prompt, user_message
+
+
+def review_aspects(llm_client: "LLMClient", source_file: SourceFile, aspects: List[str]) -> Tuple[str, bool]:
+    """
+    Review a file with one concurrent request per aspect and merge the findings.
+    
+    Usage of every request is attributed to the calling thread's file scope.
+    
+    Args:
+        llm_client: Client sending the requests
+        source_file: File or diff to review
+        aspects: Aspect names
+    
+    Returns:
+        Tuple of (merged review text, whether every response came from cache)
+    
+    Raises:
+        Exception: The first aspect request that failed
+    """
+    scope = current_scope()
+    
+    def review(aspect: str) -> Tuple[str, bool]:
+        system_prompt, user_message = build_aspect_prompt(aspect, source_file)
+        with use_scope(scope):
+            response = llm_client.send_message(user_message, system_prompt)
+            return response, llm_client.last_call_cached()
+    
+    with ThreadPoolExecutor(max_workers=len(aspects), thread_name_prefix="aspect") as executor:
+        outcomes = list(executor.map(review, aspects))
+    
+    findings = merge_findings([(aspect, response) for aspect, (response, _) in zip(aspects, outcomes)])
+    return "\n".join(finding.format() for finding in findings), all(cached for _, cached in outcomes)
+
+
+def merge_findings(responses: List[Tuple[str, str]]) -> List[AspectFinding]:
+    """
+    Merge aspect responses, folding duplicate findings together.
+    
+    Findings are duplicates when they refer to the same line (or both to no
+    line) and share most of their significant words; the merged finding keeps
+    the more detailed message and is tagged with every aspect that reported it.
+    
+    Args:
+        responses: (aspect, response text) pairs
+    
+    Returns:
+        Findings ordered by line, general findings last
+    """
+    merged: List[AspectFinding] = []
+    for aspect, response in responses:
+        for line, message in _split_findings(response):
+            duplicate = next(
+                (finding for finding in merged
+                 if finding.line == line and _similarity(finding.message, message) >= SIMILARITY_THRESHOLD),
+                None
+            )
+            if duplicate is None:
+                merged.append(AspectFinding(line, message, [aspect]))
+                continue
+            if aspect not in duplicate.aspects:
+                duplicate.aspects.append(aspect)
+            if len(message) > len(duplicate.message):
+                duplicate.message = message
+    return sorted(merged, key=lambda finding: (finding.line is None, finding.line or 0))
+
+
+def _split_findings(response: str) -> List[Tuple[Optional[int], str]]:
+    """Extract (line, message) findings, keeping findings without a line number"""
+    if response.strip().upper().strip(".") == NO_FINDINGS:
+        return []
+    findings: List[Tuple[Optional[int], str]] = []
+    for text in response.splitlines():
+        text = text.strip().lstrip("-*• ").strip()
+        if not text or text.upper().strip(".") == NO_FINDINGS:
+            continue
+        parsed = findings_from_text(text)
+        if parsed:
+            findings.extend((finding.line, finding.message) for finding in parsed)
+        elif not text.startswith("```"):
+            findings.append((None, text))
+    return findings
+
+
+def _significant_words(text: str) -> set:
+    """Lowercased words of a message that carry meaning"""
+    return {word for word in re.findall(r"[a-z0-9_]+", text.lower())
+            if len(word) > 2 and word not in STOP_WORDS}
+
+
+def _similarity(first: str, second: str) -> float:
+    """Share of significant words the shorter message has in common with the other"""
+    first_words, second_words = _significant_words(first), _significant_words(second)
+    if not first_words or not second_words:
+        return 1.0 if first.strip().lower() == second.strip().lower() else 0.0
+    return len(first_words & second_words) / min(len(first_words), len(second_words))
@@ -0,0 +1,219 @@
+"""Batch Runner - Review many repositories or refs from a JSONL job file"""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Set
+from .aspect_review import configured_aspects
+from .config import config
+from .input_parser import InputParser
+from .review_orchestrator import ReviewOrchestrator
+from .review_server import ReviewService
+from .source_collector import SourceCollector
+from .tool_ops import append_jsonl, read_jsonl
+
+
+BATCH_MODES = ("file", "diff", "commit", "branch")
+
+
+@dataclass
+class BatchJob:
+    """Single review specification from a batch job file"""
+    job_id: str
+    repo: str
+    mode: str
+    ref: Optional[str] = None
+    model: Optional[str] = None
+
+
+@dataclass
+class BatchSummary:
+    """Outcome counts for a batch run"""
+    completed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    files_reviewed: int = 0
+
+
+def load_jobs(jobs_path: str) -> List[BatchJob]:
+    """
+    Load review jobs from a JSONL file.
+    
+    Each line is an object with "repo", "mode" (file, diff, commit or branch),
+    an optional "ref" (file path, commit hash or branch name), an optional
+    "model" and an optional "id". Jobs without an id are identified by their spec.
+    
+    Args:
+        jobs_path: Path to the job file
+    
+    Returns:
+        List of parsed jobs
+    
+    Raises:
+        ValueError: If a line is not a JSON object or a job is invalid
+    """
+    jobs = []
+    with open(jobs_path, encoding="utf-8") as f:
+        lines = f.readlines()
+    for line_number, text in enumerate(lines, 1):
+        if not text.strip():
+            continue
+        # Parsed strictly: unlike result files, a job file is written by hand
+        # and a bad line must not silently drop a job
+        try:
+            spec = json.loads(text)
+        except ValueError as e:
+            raise ValueError(f"Job {line_number}: invalid JSON ({e})")
+        if not isinstance(spec, dict):
+            raise ValueError(f"Job {line_number}: expected a JSON object")
+        mode = spec.get("mode", "diff")
+        if mode not in BATCH_MODES:
+            raise ValueError(f"Job {line_number}: unsupported mode '{mode}'")
+        if "repo" not in spec:
+            raise ValueError(f"Job {line_number}: missing 'repo'")
+        if mode != "diff" and not spec.get("ref"):
+            raise ValueError(f"Job {line_number}: mode '{mode}' requires 'ref'")
+        
+        job_id = spec.get("id") or ":".join(
+            str(part) for part in (spec["repo"], mode, spec.get("ref"), spec.get("model")) if part
+        )
+        jobs.append(BatchJob(
+            job_id=str(job_id),
+            repo=spec["repo"],
+            mode=mode,
+            ref=spec.get("ref"),
+            model=spec.get("model")
+        ))
+    return jobs
+
+
+class BatchRunner:
+    """Run batch review jobs on a worker pool sharing caches and rate limits"""
+    
+    def __init__(self, output_path: str, max_workers: Optional[int] = None,
+                 service: Optional[ReviewService] = None,
+                 on_job_done: Optional[Callable[[BatchJob, str], None]] = None):
+        """
+        Initialize batch runner.
+        
+        Args:
+            output_path: JSONL file receiving results as they complete
+            max_workers: Number of jobs run concurrently (default: from config)
+            service: Shared LLM clients, response cache and rate limiter
+            on_job_done: Optional callback receiving (job, status) per finished job
+        """
+        self.output_path = output_path
+        self.max_workers = max_workers or max(1, config.get_max_concurrency())
+        self.service = service or ReviewService()
+        self.on_job_done = on_job_done
+        self._write_lock = threading.Lock()
+    
+    def run(self, jobs: List[BatchJob]) -> BatchSummary:
+        """
+        Run all jobs not already completed in the output file.
+        
+        Args:
+            jobs: Jobs to run
+        
+        Returns:
+            Summary of the run
+        """
+        finished_jobs, reviewed_files = self._load_progress()
+        summary = BatchSummary()
+        pending = []
+        for job in jobs:
+            if job.job_id in finished_jobs:
+                summary.skipped += 1
+            else:
+                pending.append(job)
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._run_job, job, reviewed_files.get(job.job_id, set())): job
+                for job in pending
+            }
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    summary.files_reviewed += future.result()
+                    status = "done"
+                    summary.completed += 1
+                except Exception as e:
+                    status = "failed"
+                    summary.failed += 1
+                    self._write({"job_id": job.job_id, "status": status, "error": str(e)})
+                if self.on_job_done:
+                    self.on_job_done(job, status)
+        
+        return summary
+    
+    def _run_job(self, job: BatchJob, already_reviewed: Set[str]) -> int:
+        """
+        Collect and review one job, writing each result as it completes.
+        
+        Args:
+            job: Job to run
+            already_reviewed: Paths reviewed successfully before a crash
+        
+        Returns:
+            Number of files reviewed in this run
+        """
+        review_input = self._parse_job(job)
+        source_files = SourceCollector(job.repo).collect(review_input)
+        source_files = [f for f in source_files if f.path not in already_reviewed]
+        
+        orchestrator = ReviewOrchestrator(
+            self.service.get_client(job.model),
+            circuit_breaker=self.service.get_breaker(job.model),
+            fallback_client=self.service.get_fallback_client(job.model),
+            aspects=configured_aspects(),
+            duplicate_threshold=config.get_duplicate_threshold(),
+            structured=config.get_structured_findings()
+        )
+        reviewed = failed = 0
+        for result in orchestrator.iter_review(source_files):
+            self._write({"job_id": job.job_id, "result": result.to_dict()})
+            reviewed += 1
+            failed += not result.success
+        problems = []
+        if failed:
+            problems.append(f"{failed} file reviews failed")
+        if orchestrator.skipped:
+            problems.append(f"{len(orchestrator.skipped)} files skipped: provider unavailable")
+        if problems:
+            # Not marked done, so a re-run reviews the failed and skipped files
+            raise RuntimeError("; ".join(problems))
+        
+        self._write({"job_id": job.job_id, "status": "done"})
+        return reviewed
+    
+    @staticmethod
+    def _parse_job(job: BatchJob):
+        """Convert a batch job into a ReviewInput"""
+        parser = InputParser()
+        if job.mode == "file":
+            return parser.parse(os.path.join(job.repo, job.ref))
+        return parser.parse(
+            job.repo,
+            diff=job.mode == "diff",
+            commit=job.ref if job.mode == "commit" else None,
+            branch=job.ref if job.mode == "branch" else None
+        )
+    
+    def _load_progress(self):
+        """Read finished job ids and successfully reviewed paths from the output file"""
+        finished_jobs: Set[str] = set()
+        reviewed_files: Dict[str, Set[str]] = {}
+        for record in read_jsonl(self.output_path):
+            if record.get("status") == "done":
+                finished_jobs.add(record["job_id"])
+            elif "result" in record and record["result"].get("success"):
+                reviewed_files.setdefault(record["job_id"], set()).add(record["result"]["file_path"])
+        return finished_jobs, reviewed_files
+    
+    def _write(self, record: dict) -> None:
+        """Append a record to the output file from any worker thread"""
+        with self._write_lock:
+            append_jsonl(self.output_path, record)
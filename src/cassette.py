@@ -0,0 +1,137 @@
+"""Cassette - Record LLM traffic and replay it offline"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List
+from .tool_ops import append_jsonl, read_jsonl
+
+
+CASSETTE_FILE = "interactions.jsonl"
+
+
+def make_request_key(messages: List[Dict[str, str]], params: Dict[str, Any]) -> str:
+    """
+    Build the key identifying a normalized request.
+    
+    The model and endpoint are left out so a session recorded against one
+    deployment can be replayed with any model configuration.
+    
+    Args:
+        messages: Chat messages sent to the model
+        params: Sampling parameters
+    
+    Returns:
+        Hex digest identifying the request
+    """
+    normalized = [{"role": m["role"], "content": m["content"]} for m in messages]
+    payload = json.dumps({"messages": normalized, "params": params}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class Cassette:
+    """Directory of recorded LLM request/response pairs"""
+    
+    def __init__(self, directory: str, mode: str = "replay", realtime: bool = False):
+        """
+        Open a cassette.
+        
+        Args:
+            directory: Directory holding the recording
+            mode: "record" to append new interactions, "replay" to serve them
+            realtime: When replaying, wait for each interaction's recorded latency
+        
+        Raises:
+            ValueError: If the mode is unknown or there is nothing to replay
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode '{mode}' - use record or replay")
+        self.directory = directory
+        self.path = os.path.join(directory, CASSETTE_FILE)
+        self.mode = mode
+        self.realtime = realtime
+        self.recorded = 0
+        self.replayed = 0
+        self._interactions: Dict[str, List[dict]] = {}
+        self._cursors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        
+        if mode == "replay":
+            for interaction in read_jsonl(self.path):
+                self._interactions.setdefault(interaction["key"], []).append(interaction)
+            if not self._interactions:
+                raise ValueError(f"No recorded interactions in {self.path}")
+    
+    @property
+    def replaying(self) -> bool:
+        """Whether requests are served from the recording"""
+        return self.mode == "replay"
+    
+    def record(self, model: str, messages: List[Dict[str, str]], params: Dict[str, Any],
+               response, latency: float) -> None:
+        """
+        Append a completed request and its response.
+        
+        Args:
+            model: Model that served the request
+            messages: Chat messages sent
+            params: Sampling parameters
+            response: litellm response
+            latency: Seconds the request took
+        """
+        usage = getattr(response, "usage", None)
+        interaction = {
+            "key": make_request_key(messages, params),
+            "model": model,
+            "messages": messages,
+            "params": params,
+            "content": response.choices[0].message.content,
+            "prompt_tokens": getattr(usage, "prompt_tokens", 0) or 0,
+            "completion_tokens": getattr(usage, "completion_tokens", 0) or 0,
+            "latency": latency,
+            "recorded_at": time.time()
+        }
+        with self._lock:
+            append_jsonl(self.path, interaction)
+            self.recorded += 1
+    
+    def play(self, messages: List[Dict[str, str]], params: Dict[str, Any]):
+        """
+        Serve the recorded response for a request.
+        
+        Identical requests recorded several times are served in recording
+        order; once exhausted, the last recording is repeated.
+        
+        Args:
+            messages: Chat messages sent
+            params: Sampling parameters
+        
+        Returns:
+            Response object shaped like a litellm response
+        
+        Raises:
+            LookupError: If the request was never recorded
+        """
+        key = make_request_key(messages, params)
+        with self._lock:
+            recordings = self._interactions.get(key)
+            if not recordings:
+                raise LookupError(f"No recorded response for request {key[:12]} in {self.path}")
+            cursor = self._cursors.get(key, 0)
+            interaction = recordings[min(cursor, len(recordings) - 1)]
+            self._cursors[key] = cursor + 1
+            self.replayed += 1
+        
+        if self.realtime:
+            time.sleep(interaction["latency"])
+        return SimpleNamespace(
+            model=interaction["model"],
+            choices=[SimpleNamespace(message=SimpleNamespace(content=interaction["content"]))],
+            usage=SimpleNamespace(
+                prompt_tokens=interaction["prompt_tokens"],
+                completion_tokens=interaction["completion_tokens"]
+            )
+        )
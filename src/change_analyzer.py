@@ -0,0 +1,372 @@
+"""Change Analyzer - Classify changes locally so only substantive ones reach the LLM"""
+
+import ast
+import copy
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Callable, List, Optional, Tuple
+from .config import config
+from .git_operations import GitOperations
+from .input_parser import ReviewInput, ReviewType
+from .source_collector import SourceFile
+
+
+class ChangeClass(Enum):
+    """How much a change can affect behavior"""
+    NOOP = "noop"  # Formatting, whitespace or comments only
+    TRIVIAL = "trivial"  # Docstrings, import order or version numbers only
+    SUBSTANTIVE = "substantive"
+
+
+# Version numbers such as 1.2, v2.0.1 or 1.4.0-rc.1
+VERSION = r"v?\d+(?:\.\d+){1,3}(?:[-+][0-9A-Za-z.]+)?"
+
+# Version tokens; unquoted ones need a "v" or three parts so decimals like 1.5 don't count
+VERSION_RE = re.compile(rf"^(?:(['\"]){VERSION}\1|v{VERSION}|\d+(?:\.\d+){{2,3}}(?:[-+][0-9A-Za-z.]+)?)$")
+
+# (line comment, block comment start, block comment end) per file extension
+C_COMMENTS = ("//", "/*", "*/")
+HASH_COMMENTS = ("#", None, None)
+COMMENT_STYLES = {
+    **dict.fromkeys([".js", ".jsx", ".mjs", ".ts", ".tsx", ".go", ".rs", ".java", ".kt", ".scala", ".swift",
+                     ".cs", ".c", ".h", ".cpp", ".hpp", ".cc", ".php", ".css", ".scss"], C_COMMENTS),
+    **dict.fromkeys([".rb", ".sh", ".bash", ".pl", ".r", ".yaml", ".yml", ".toml", ".cfg", ".ini"], HASH_COMMENTS),
+    **dict.fromkeys([".sql", ".lua", ".hs"], ("--", None, None)),
+}
+
+# Files where indentation is syntax, so whitespace changes are not no-ops
+INDENT_SENSITIVE = {".yaml", ".yml", ".hs", ".mk"}
+INDENT_SENSITIVE_NAMES = {"Makefile", "makefile", "GNUmakefile"}
+
+IMPORT_RE = re.compile(r"^(?:import\b|from\s+\S+\s+import\b|#include\b|use\s|using\s|require\b|"
+                       r"(?:const|let|var)\s+\w+\s*=\s*require\()")
+
+STRING = r"\"(?:\\.|[^\"\\\n])*\"|'(?:\\.|[^'\\\n])*'|`[^`]*`"
+
+
+@dataclass
+class ChangeAnalysis:
+    """Local verdict on one reviewed file"""
+    path: str
+    change_class: ChangeClass
+    reason: str = ""
+    hints: List[str] = field(default_factory=list)
+    
+    @property
+    def needs_review(self) -> bool:
+        """Whether the file should be sent to the LLM"""
+        return self.change_class == ChangeClass.SUBSTANTIVE
+
+
+def classify_python(old: str, new: str) -> Tuple[ChangeClass, str]:
+    """
+    Classify a Python change by comparing syntax trees.
+    
+    Trees ignore comments, whitespace and formatting, so equal trees mean the
+    change cannot alter behavior.
+    
+    Args:
+        old: Content before the change
+        new: Content after the change
+    
+    Returns:
+        Tuple of (classification, reason)
+    """
+    try:
+        old_tree, new_tree = ast.parse(old), ast.parse(new)
+    except (SyntaxError, ValueError):
+        return ChangeClass.SUBSTANTIVE, ""
+    if ast.dump(old_tree) == ast.dump(new_tree):
+        return ChangeClass.NOOP, "formatting or comments only"
+    
+    def equal(*normalizers: Callable[[ast.AST], None]) -> bool:
+        trees = [copy.deepcopy(old_tree), copy.deepcopy(new_tree)]
+        for tree in trees:
+            for normalize in normalizers:
+                normalize(tree)
+        return ast.dump(trees[0]) == ast.dump(trees[1])
+    
+    for reason, normalize in PYTHON_NORMALIZERS:
+        if equal(normalize):
+            return ChangeClass.TRIVIAL, reason
+    if equal(*(normalize for _, normalize in PYTHON_NORMALIZERS)):
+        return ChangeClass.TRIVIAL, "docstrings, import order or versions only"
+    return ChangeClass.SUBSTANTIVE, ""
+
+
+def _strip_docstrings(tree: ast.AST) -> None:
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)) and node.body:
+            first = node.body[0]
+            if isinstance(first, ast.Expr) and isinstance(first.value, ast.Constant) \
+                    and isinstance(first.value.value, str):
+                node.body = node.body[1:]
+
+
+def _sort_imports(tree: ast.AST) -> None:
+    for node in ast.walk(tree):
+        body = getattr(node, "body", None)
+        if not isinstance(body, list):
+            continue
+        sorted_body, run = [], []
+        for statement in body + [None]:
+            if isinstance(statement, (ast.Import, ast.ImportFrom)):
+                statement.names.sort(key=lambda alias: (alias.name, alias.asname or ""))
+                run.append(statement)
+                continue
+            sorted_body.extend(sorted(run, key=ast.dump))
+            run = []
+            if statement is not None:
+                sorted_body.append(statement)
+        node.body = sorted_body
+
+
+def _mask_versions(tree: ast.AST) -> None:
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Constant) and isinstance(node.value, str) and re.fullmatch(VERSION, node.value):
+            node.value = "<version>"
+
+
+PYTHON_NORMALIZERS = [
+    ("docstrings only", _strip_docstrings),
+    ("imports reordered", _sort_imports),
+    ("version bump", _mask_versions),
+]
+
+
+def classify_text(path: str, old: str, new: str) -> Tuple[ChangeClass, str]:
+    """
+    Classify a change in any language by comparing tokens.
+    
+    Comments are dropped for languages with known comment syntax, and
+    whitespace is ignored except for indentation where it is syntax.
+    
+    Args:
+        path: File path, selecting the comment syntax
+        old: Content before the change
+        new: Content after the change
+    
+    Returns:
+        Tuple of (classification, reason)
+    """
+    old_tokens, new_tokens = _tokens(path, old), _tokens(path, new)
+    if old_tokens == new_tokens:
+        has_comments = os.path.splitext(path)[1].lower() in COMMENT_STYLES
+        return ChangeClass.NOOP, "whitespace or comments only" if has_comments else "whitespace only"
+    if _mask_version_tokens(old_tokens) == _mask_version_tokens(new_tokens):
+        return ChangeClass.TRIVIAL, "version bump"
+    if _imports_reordered(old, new):
+        return ChangeClass.TRIVIAL, "imports reordered"
+    return ChangeClass.SUBSTANTIVE, ""
+
+
+def _tokens(path: str, text: str) -> List[str]:
+    """Tokens of a file without comments and insignificant whitespace"""
+    extension = os.path.splitext(path)[1].lower()
+    line_comment, block_start, block_end = COMMENT_STYLES.get(extension, (None, None, None))
+    comments = []
+    if block_start:
+        comments.append(re.escape(block_start) + r"[\s\S]*?" + re.escape(block_end))
+    if line_comment:
+        comments.append(re.escape(line_comment) + r"[^\n]*")
+    comment = "|".join(comments) or r"(?!)"
+    token_re = re.compile(rf"(?P<comment>{comment})|{STRING}|{VERSION}|\w+|\S")
+    
+    if extension not in INDENT_SENSITIVE and os.path.basename(path) not in INDENT_SENSITIVE_NAMES:
+        return [m.group() for m in token_re.finditer(text) if not m.group("comment")]
+    tokens = []
+    for line in text.splitlines():
+        line_tokens = [m.group() for m in token_re.finditer(line) if not m.group("comment")]
+        if line_tokens:
+            tokens.append(line[:len(line) - len(line.lstrip())])
+            tokens.extend(line_tokens)
+    return tokens
+
+
+def _mask_version_tokens(tokens: List[str]) -> List[str]:
+    return ["<version>" if VERSION_RE.match(token) else token for token in tokens]
+
+
+def _imports_reordered(old: str, new: str) -> bool:
+    """Check whether only the order of import lines differs (other lines must match exactly)"""
+    def split(text: str) -> Tuple[List[str], Counter]:
+        lines = [line.rstrip() for line in text.splitlines() if line.strip()]
+        imports = Counter(line.strip() for line in lines if IMPORT_RE.match(line.strip()))
+        return [line for line in lines if not IMPORT_RE.match(line.strip())], imports
+    
+    return split(old) == split(new)
+
+
+def lint_python(content: str, path: str = "") -> List[Tuple[int, str]]:
+    """
+    Find likely mistakes with cheap syntax-tree checks.
+    
+    Args:
+        content: Python source
+        path: File path (unused imports are not reported for __init__.py)
+    
+    Returns:
+        (line, message) pairs
+    """
+    try:
+        tree = ast.parse(content)
+    except SyntaxError as e:
+        return [(e.lineno or 1, f"Syntax error: {e.msg}")]
+    except ValueError:
+        return []
+    
+    hits = []
+    used = {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
+    used.update(node.value for node in ast.walk(tree)
+                if isinstance(node, ast.Constant) and isinstance(node.value, str))
+    if os.path.basename(path) != "__init__.py":
+        for node in tree.body:
+            if isinstance(node, ast.ImportFrom) and node.module == "__future__":
+                continue
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                for alias in node.names:
+                    name = alias.asname or alias.name.split(".")[0]
+                    if name != "*" and name not in used:
+                        hits.append((node.lineno, f"'{alias.name}' imported but unused"))
+    
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ExceptHandler) and node.type is None:
+            hits.append((node.lineno, "Bare except also catches KeyboardInterrupt and SystemExit"))
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+            for default in node.args.defaults + [d for d in node.args.kw_defaults if d is not None]:
+                if isinstance(default, (ast.List, ast.Dict, ast.Set)) or (
+                        isinstance(default, ast.Call) and isinstance(default.func, ast.Name)
+                        and default.func.id in ("list", "dict", "set")):
+                    hits.append((default.lineno, "Mutable default argument is shared between calls"))
+        elif isinstance(node, ast.Compare):
+            for op, right in zip(node.ops, node.comparators):
+                if isinstance(op, (ast.Eq, ast.NotEq)) and isinstance(right, ast.Constant) and right.value is None:
+                    hits.append((node.lineno, "Comparison to None should use 'is' / 'is not'"))
+                elif isinstance(op, (ast.Is, ast.IsNot)) and isinstance(right, ast.Constant) \
+                        and right.value not in (None, True, False, ...):
+                    hits.append((node.lineno, "Identity comparison with a literal; use == / !="))
+    return sorted(set(hits))
+
+
+def hints_section(hints: Optional[List[str]]) -> str:
+    """Prompt section presenting local lint hits (empty without hints)"""
+    if not hints:
+        return ""
+    listed = "\n".join(f"- {hint}" for hint in hints)
+    return f"""
+
+Local static analysis flagged these lines (confirm each before reporting it):
+{listed}"""
+
+
+def version_refs(review_input: ReviewInput, git_ops: GitOperations) -> Optional[Tuple[str, str]]:
+    """
+    Describe the (before, after) revisions a git review compares.
+    
+    Returns:
+        Revisions for git object names ("" is the index), or None for
+        reviews of files outside git
+    """
+    if review_input.review_type == ReviewType.GIT_DIFF:
+        return "HEAD", ""
+    if review_input.review_type == ReviewType.GIT_COMMIT:
+        return f"{review_input.target}^", review_input.target
+    if review_input.review_type == ReviewType.GIT_BRANCH:
+        return git_ops.get_merge_base(review_input.target), review_input.target
+    return None
+
+
+class ChangeAnalyzer:
+    """Local stage between collection and review that drops no-op and trivial changes"""
+    
+    def __init__(self, git_ops: GitOperations, refs: Optional[Tuple[str, str]] = None,
+                 lint: Optional[bool] = None):
+        """
+        Initialize change analyzer.
+        
+        Args:
+            git_ops: Git operations for the reviewed repository
+            refs: (before, after) revisions of diff reviews, see version_refs
+            lint: Attach local lint hits to substantive files (default: CODER_LINT_HINTS)
+        """
+        self.git_ops = git_ops
+        self.refs = refs
+        self.lint = config.get_lint_hints() if lint is None else lint
+    
+    @classmethod
+    def for_input(cls, review_input: ReviewInput, git_ops: GitOperations,
+                  lint: Optional[bool] = None) -> "ChangeAnalyzer":
+        """Create an analyzer comparing the revisions of a review input"""
+        try:
+            refs = version_refs(review_input, git_ops)
+        except ValueError:
+            # Without a base revision every change counts as substantive
+            refs = None
+        return cls(git_ops, refs, lint)
+    
+    def analyze(self, source_files: List[SourceFile]) -> List[ChangeAnalysis]:
+        """
+        Classify files and attach lint hints to the ones needing review.
+        
+        Versions that cannot be read (new, deleted or renamed files) make a
+        change substantive.
+        
+        Args:
+            source_files: Collected files or diffs
+        
+        Returns:
+            One analysis per file, in the same order
+        """
+        versions = {}
+        diffs = [source_file for source_file in source_files if source_file.is_diff]
+        if self.refs is not None and diffs:
+            before, after = self.refs
+            specs = [f"{ref}:{source_file.path}" for source_file in diffs for ref in (before, after)]
+            try:
+                versions = self.git_ops.read_blobs(specs)
+            except ValueError:
+                versions = {}
+        
+        analyses = []
+        for source_file in source_files:
+            if source_file.is_diff and self.refs is not None:
+                old = versions.get(f"{self.refs[0]}:{source_file.path}")
+                new = versions.get(f"{self.refs[1]}:{source_file.path}")
+            else:
+                old, new = None, source_file.content
+            analysis = self._classify(source_file.path, old, new)
+            if analysis.needs_review and self.lint and new is not None and source_file.path.endswith(".py"):
+                lines = _added_lines(source_file) if source_file.is_diff else None
+                analysis.hints = [f"Line {line}: {message}" for line, message in lint_python(new, source_file.path)
+                                  if lines is None or line in lines]
+                source_file.hints = analysis.hints or None
+            analyses.append(analysis)
+        return analyses
+    
+    def split(self, source_files: List[SourceFile]) -> Tuple[List[SourceFile], List[ChangeAnalysis]]:
+        """
+        Separate files needing review from no-op and trivial changes.
+        
+        Returns:
+            Tuple of (files to review, analyses of skipped files)
+        """
+        analyses = self.analyze(source_files)
+        to_review = [f for f, analysis in zip(source_files, analyses) if analysis.needs_review]
+        return to_review, [analysis for analysis in analyses if not analysis.needs_review]
+    
+    def _classify(self, path: str, old: Optional[str], new: Optional[str]) -> ChangeAnalysis:
+        if old is None or new is None:
+            return ChangeAnalysis(path, ChangeClass.SUBSTANTIVE)
+        if path.endswith(".py"):
+            change_class, reason = classify_python(old, new)
+        else:
+            change_class, reason = classify_text(path, old, new)
+        return ChangeAnalysis(path, change_class, reason)
+
+
+def _added_lines(source_file: SourceFile) -> set:
+    """Line numbers of added lines in diff content built by SourceCollector"""
+    return {int(number) for number in re.findall(r"^\+ (\d+): ", source_file.content, re.MULTILINE)}
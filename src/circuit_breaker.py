@@ -0,0 +1,90 @@
+"""Circuit Breaker - Stop calling an unhealthy LLM provider and probe for recovery"""
+
+import threading
+import time
+from enum import Enum
+from typing import Callable, Optional
+from .config import config
+
+
+class CircuitState(Enum):
+    """Circuit breaker states"""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Thread-safe consecutive-failure circuit breaker"""
+    
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize circuit breaker.
+        
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_seconds: Time the circuit stays open before a probe is allowed
+            clock: Monotonic clock
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_seconds = reset_seconds
+        self.clock = clock
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_config(cls) -> Optional["CircuitBreaker"]:
+        """Return a breaker configured by CODER_BREAKER_*, or None if disabled"""
+        threshold = config.get_breaker_threshold()
+        if threshold <= 0:
+            return None
+        return cls(threshold, config.get_breaker_reset_seconds())
+    
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may be sent now.
+        
+        While open, requests are refused until reset_seconds have passed; then
+        a single probe is let through (half-open) and its outcome closes or
+        re-opens the circuit.
+        
+        Returns:
+            True if the request may be sent
+        """
+        with self._lock:
+            if self.state == CircuitState.CLOSED:
+                return True
+            if self.state == CircuitState.OPEN:
+                if self.clock() - self.opened_at < self.reset_seconds:
+                    return False
+                self.state = CircuitState.HALF_OPEN
+                self._probe_in_flight = False
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+    
+    def release(self) -> None:
+        """Give back a permitted request that was never sent (e.g. served from a cache)"""
+        with self._lock:
+            self._probe_in_flight = False
+    
+    def record_success(self) -> None:
+        """Close the circuit after a successful request"""
+        with self._lock:
+            self.state = CircuitState.CLOSED
+            self.consecutive_failures = 0
+            self._probe_in_flight = False
+    
+    def record_failure(self) -> None:
+        """Count a failed request, opening the circuit at the threshold or after a failed probe"""
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == CircuitState.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                self.state = CircuitState.OPEN
+                self.opened_at = self.clock()
+            self._probe_in_flight = False
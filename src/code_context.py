@@ -1,28 +1,16 @@
 """Code Context Display - Parse feedback and show code snippets with line numbers"""
 
-import re
-from typing import List, Tuple, Dict
+from typing import List, Optional, Tuple
 from rich.console import Console
 from rich.syntax import Syntax
 from rich.panel import Panel
 from rich.columns import Columns
 from rich.text import Text
+from .findings import Finding, findings_from_text
 
 
-def parse_line_references(review_text: str) -> List[int]:
-    """
-    Extract line numbers from review text.
-    
-    Args:
-        review_text: LLM review response
-        
-    Returns:
-        List of line numbers referenced in the review
-    """
-    # Find all "Line X:" patterns
-    pattern = r'Line (\d+):'
-    matches = re.findall(pattern, review_text, re.IGNORECASE)
-    return [int(match) for match in matches]
+# Colors of severity tags of structured findings
+SEVERITY_STYLES = {"error": "bold red", "warning": "yellow", "info": "cyan"}
 
 
 def get_code_context(file_content: str, line_number: int, context_lines: int = 3) -> Tuple[str, int, int]:
@@ -54,7 +42,8 @@ def get_code_context(file_content: str, line_number: int, context_lines: int = 3
     return context_code, start_idx + 1, end_idx
 
 
-def display_code_with_feedback(console: Console, file_content: str, review_text: str, file_path: str):
+def display_code_with_feedback(console: Console, file_content: str, review_text: str, file_path: str,
+                               findings: Optional[List[Finding]] = None):
     """
     Display code snippets with associated feedback.
     
@@ -63,18 +52,27 @@ def display_code_with_feedback(console: Console, file_content: str, review_text:
         file_content: Full file content
         review_text: LLM review response
         file_path: Path to the file
+        findings: Findings of the review (default: parsed from review_text)
     """
-    line_refs = parse_line_references(review_text)
+    if findings is None:
+        findings = findings_from_text(review_text)
+    line_findings = [finding for finding in findings if finding.line is not None]
     
-    if not line_refs:
+    if not line_findings:
         # No line references found, check if there are any issues at all
+        console.print("\n")
         if len(review_text.strip()) < 50 or "no issues" in review_text.lower():
-            console.print("\n")
             console.print(Panel(
                 "✅ No specific issues found that require code changes",
                 title="📍 Code Analysis",
                 border_style="green"
             ))
+        else:
+            console.print(Panel(
+                Text(review_text.strip()),
+                title="📍 Issues Without Line References",
+                border_style="yellow"
+            ))
         return
     
     # Get file extension for syntax highlighting
@@ -82,14 +80,16 @@ def display_code_with_feedback(console: Console, file_content: str, review_text:
     
     console.print("\n")
     console.print(Panel(
-        f"Found {len(line_refs)} issues requiring attention",
+        f"Found {len(line_findings)} issues requiring attention",
         title="⚠️  Issues Found",
         border_style="red"
     ))
     
-    # Display each referenced line with context
-    for line_num in sorted(set(line_refs)):  # Remove duplicates and sort
-        context_code, start_line, end_line = get_code_context(file_content, line_num)
+    # Display each referenced line with context, in line order
+    for finding in sorted(line_findings, key=lambda finding: finding.line):
+        line_num = finding.line
+        last_line = finding.end_line or line_num
+        context_code, start_line, end_line = get_code_context(file_content, line_num, 3 + last_line - line_num)
         
         # Create syntax highlighted code
         syntax = Syntax(
@@ -97,42 +97,19 @@ def display_code_with_feedback(console: Console, file_content: str, review_text:
             file_ext,
             line_numbers=True,
             start_line=start_line,
-            highlight_lines={line_num}
+            highlight_lines=set(range(line_num, last_line + 1))
         )
         
-        # Extract feedback for this line
-        feedback = extract_line_feedback(review_text, line_num)
-        
         # Create feedback text
+        location = f"Lines {line_num}-{last_line}" if last_line > line_num else f"Line {line_num}"
         feedback_text = Text()
-        feedback_text.append(f"Line {line_num}: ", style="bold red")
-        feedback_text.append(feedback, style="white")
+        feedback_text.append(f"{location}: ", style="bold red")
+        if finding.severity:
+            feedback_text.append(f"[{finding.severity}{'/' + finding.category if finding.category else ''}] ",
+                                 style=SEVERITY_STYLES.get(finding.severity, "yellow"))
+        feedback_text.append(finding.message, style="white")
         
         # Display code and feedback
-        console.print(f"\n[bold red]Issue at Line {line_num}:[/bold red]")
+        console.print(f"\n[bold red]Issue at {location}:[/bold red]")
         console.print(syntax)
         console.print(Panel(feedback_text, border_style="red", padding=(0, 1)))
-
-
-def extract_line_feedback(review_text: str, line_number: int) -> str:
-    """
-    Extract feedback text for a specific line number.
-    
-    Args:
-        review_text: Full review text
-        line_number: Target line number
-        
-    Returns:
-        Feedback text for the line
-    """
-    # Find the line reference and extract following text
-    pattern = rf'Line {line_number}:\s*([^\n]*(?:\n(?!Line \d+:)[^\n]*)*)'
-    match = re.search(pattern, review_text, re.IGNORECASE | re.MULTILINE)
-    
-    if match:
-        feedback = match.group(1).strip()
-        # Clean up the feedback (remove excessive whitespace)
-        feedback = re.sub(r'\n\s*\n', '\n', feedback)
-        return feedback
-    
-    return f"Referenced in review (line {line_number})"
@@ -16,6 +16,23 @@ class Config:
         self.api_timeout = int(os.getenv("CODER_API_TIMEOUT", "30"))
         self.max_tokens = int(os.getenv("CODER_MAX_TOKENS", "2000"))
         self.temperature = float(os.getenv("CODER_TEMPERATURE", "0.1"))
+        self.max_concurrency = int(os.getenv("CODER_MAX_CONCURRENCY", "1"))
+        self.requests_per_minute = int(os.getenv("CODER_REQUESTS_PER_MINUTE", "0"))
+        self.cache_size = int(os.getenv("CODER_CACHE_SIZE", "512"))
+        self.daemon_host = os.getenv("CODER_DAEMON_HOST", "127.0.0.1")
+        self.daemon_port = int(os.getenv("CODER_DAEMON_PORT", "8765"))
+        self.state_dir = os.getenv("CODER_STATE_DIR", ".coder")
+        self.deployments = os.getenv("CODER_DEPLOYMENTS", "")
+        self.routing_strategy = os.getenv("CODER_ROUTING", "least-outstanding")
+        self.hedge_percentile = float(os.getenv("CODER_HEDGE_PERCENTILE", "0"))
+        self.breaker_threshold = int(os.getenv("CODER_BREAKER_THRESHOLD", "5"))
+        self.breaker_reset_seconds = float(os.getenv("CODER_BREAKER_RESET_SECONDS", "30"))
+        self.fallback_model = os.getenv("CODER_FALLBACK_MODEL", "")
+        self.review_aspects = os.getenv("CODER_REVIEW_ASPECTS", "")
+        self.symbol_context_tokens = int(os.getenv("CODER_SYMBOL_CONTEXT_TOKENS", "1500"))
+        self.lint_hints = os.getenv("CODER_LINT_HINTS", "true").lower() in ("1", "true", "yes", "on")
+        self.duplicate_threshold = float(os.getenv("CODER_DUPLICATE_THRESHOLD", "1.0"))
+        self.structured_findings = os.getenv("CODER_STRUCTURED_FINDINGS", "false").lower() in ("1", "true", "yes", "on")
 
     def get_llm_model(self) -> str:
         """Get configured LLM model"""
@@ -37,6 +54,70 @@ class Config:
         """Get temperature for LLM responses"""
         return self.temperature
 
+    def get_max_concurrency(self) -> int:
+        """Get maximum number of concurrent LLM review requests"""
+        return self.max_concurrency
+
+    def get_requests_per_minute(self) -> int:
+        """Get shared LLM request rate limit (0 means unlimited)"""
+        return self.requests_per_minute
+
+    def get_cache_size(self) -> int:
+        """Get maximum number of cached LLM responses"""
+        return self.cache_size
+
+    def get_daemon_address(self) -> tuple:
+        """Get (host, port) of the review daemon"""
+        return self.daemon_host, self.daemon_port
+
+    def get_state_dir(self) -> str:
+        """Get directory for journals and other local review state"""
+        return self.state_dir
+
+    def get_deployments(self) -> str:
+        """Get deployment pool specification (JSON list or file path; empty for none)"""
+        return self.deployments
+
+    def get_routing_strategy(self) -> str:
+        """Get deployment routing strategy"""
+        return self.routing_strategy
+
+    def get_hedge_percentile(self) -> float:
+        """Get latency percentile after which requests are hedged (0 disables hedging)"""
+        return self.hedge_percentile
+
+    def get_breaker_threshold(self) -> int:
+        """Get consecutive failures that open the circuit breaker (0 disables it)"""
+        return self.breaker_threshold
+
+    def get_breaker_reset_seconds(self) -> float:
+        """Get seconds the circuit stays open before probing the provider again"""
+        return self.breaker_reset_seconds
+
+    def get_fallback_model(self) -> str:
+        """Get model used while the circuit is open (empty to skip files instead)"""
+        return self.fallback_model
+
+    def get_review_aspects(self) -> str:
+        """Get comma-separated review aspects (empty for a single combined prompt)"""
+        return self.review_aspects
+
+    def get_symbol_context_tokens(self) -> int:
+        """Get token budget for definitions from other files added to each prompt (0 disables it)"""
+        return self.symbol_context_tokens
+
+    def get_lint_hints(self) -> bool:
+        """Get whether local lint hits are added to prompts as hints"""
+        return self.lint_hints
+
+    def get_duplicate_threshold(self) -> float:
+        """Get similarity at which files share one review (1 identical only, 0 disables)"""
+        return self.duplicate_threshold
+
+    def get_structured_findings(self) -> bool:
+        """Get whether reviews ask the LLM for findings as JSON instead of free-form text"""
+        return self.structured_findings
+
 
 # Global configuration instance
 config = Config()
@@ -0,0 +1,273 @@
+"""Deployment Pool - Route LLM requests across several models, keys and endpoints"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional, Set, TypeVar
+from .config import config
+from .rate_limiter import RateLimiter
+
+
+ROUTING_STRATEGIES = ("least-outstanding", "latency")
+
+# Weight of the newest sample in the moving latency average
+LATENCY_SMOOTHING = 0.3
+
+T = TypeVar("T")
+
+
+@dataclass
+class Deployment:
+    """One model endpoint and its credentials"""
+    name: str
+    model: str
+    api_key: Optional[str] = None
+    api_base: Optional[str] = None
+    weight: float = 1.0
+    requests_per_minute: int = 0
+
+
+@dataclass
+class DeploymentState:
+    """Live routing statistics of a deployment"""
+    rate_limiter: RateLimiter
+    outstanding: int = 0
+    latency: Optional[float] = None
+    consecutive_failures: int = 0
+    unhealthy_until: float = 0.0
+    requests: int = 0
+    failures: int = 0
+
+
+def parse_deployments(spec: str) -> List[Deployment]:
+    """
+    Parse deployments from JSON or a JSON file.
+    
+    Each entry has "model" and optionally "name", "api_key", "api_key_env"
+    (name of the environment variable holding the key), "api_base",
+    "weight" and "rpm" (per-deployment requests per minute).
+    
+    Args:
+        spec: JSON list, or path to a file containing one
+    
+    Returns:
+        Parsed deployments
+    
+    Raises:
+        ValueError: If the specification is invalid
+    """
+    try:
+        if os.path.isfile(spec):
+            with open(spec, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        else:
+            entries = json.loads(spec)
+    except (OSError, json.JSONDecodeError) as e:
+        raise ValueError(f"Invalid deployments: {e}")
+    if not isinstance(entries, list) or not entries:
+        raise ValueError("Deployments must be a non-empty JSON list")
+    
+    deployments = []
+    for index, entry in enumerate(entries, 1):
+        if not isinstance(entry, dict) or not entry.get("model"):
+            raise ValueError(f"Deployment {index}: missing 'model'")
+        api_key = entry.get("api_key")
+        if entry.get("api_key_env"):
+            api_key = os.getenv(entry["api_key_env"])
+            if not api_key:
+                raise ValueError(f"Deployment {index}: environment variable {entry['api_key_env']} is not set")
+        weight = float(entry.get("weight", 1.0))
+        if weight <= 0:
+            raise ValueError(f"Deployment {index}: weight must be positive")
+        deployments.append(Deployment(
+            name=str(entry.get("name") or f"{entry['model']}#{index}"),
+            model=entry["model"],
+            api_key=api_key,
+            api_base=entry.get("api_base"),
+            weight=weight,
+            requests_per_minute=int(entry.get("rpm", 0))
+        ))
+    return deployments
+
+
+class DeploymentPool:
+    """Load balancer with health tracking and failover across deployments"""
+    
+    def __init__(self, deployments: List[Deployment], strategy: str = "least-outstanding",
+                 failure_threshold: int = 3, cooldown_seconds: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize deployment pool.
+        
+        Args:
+            deployments: Deployments to route between
+            strategy: "least-outstanding" (fewest in-flight requests per unit
+                of weight) or "latency" (lowest recent latency per unit of weight)
+            failure_threshold: Consecutive errors that take a deployment out of rotation
+            cooldown_seconds: How long an unhealthy deployment is avoided
+            clock: Monotonic clock
+        
+        Raises:
+            ValueError: If no deployments are given or the strategy is unknown
+        """
+        if not deployments:
+            raise ValueError("Deployment pool needs at least one deployment")
+        if strategy not in ROUTING_STRATEGIES:
+            raise ValueError(f"Unknown routing strategy '{strategy}' - use one of {', '.join(ROUTING_STRATEGIES)}")
+        self.deployments = deployments
+        self.strategy = strategy
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.clock = clock
+        self.states = {
+            deployment.name: DeploymentState(RateLimiter(deployment.requests_per_minute))
+            for deployment in deployments
+        }
+        self._lock = threading.Lock()
+    
+    def select(self, exclude: Optional[Set[str]] = None) -> Optional[Deployment]:
+        """
+        Pick the best deployment for the next request.
+        
+        Healthy deployments are preferred; if all are cooling down, the one
+        that recovers first is used rather than failing outright.
+        
+        Args:
+            exclude: Names of deployments not to use (e.g. already tried)
+        
+        Returns:
+            Chosen deployment, or None if every deployment is excluded
+        """
+        exclude = exclude or set()
+        now = self.clock()
+        with self._lock:
+            candidates = [d for d in self.deployments if d.name not in exclude]
+            if not candidates:
+                return None
+            healthy = [d for d in candidates if self.states[d.name].unhealthy_until <= now]
+            if not healthy:
+                return min(candidates, key=lambda d: self.states[d.name].unhealthy_until)
+            return min(healthy, key=self._score)
+    
+    @contextmanager
+    def lease(self, deployment: Deployment) -> Iterator[Deployment]:
+        """
+        Track one request on a deployment, waiting for its rate limit first.
+        
+        Records latency on success and health on failure.
+        
+        Args:
+            deployment: Deployment returned by select()
+        
+        Yields:
+            The deployment
+        """
+        state = self.states[deployment.name]
+        state.rate_limiter.acquire()
+        with self._lock:
+            state.outstanding += 1
+            state.requests += 1
+        started = self.clock()
+        try:
+            yield deployment
+        except BaseException:
+            with self._lock:
+                state.outstanding -= 1
+            raise
+        else:
+            self.record_success(deployment, self.clock() - started, release=True)
+    
+    def record_success(self, deployment: Deployment, latency: float, release: bool = False) -> None:
+        """Update latency and mark the deployment healthy"""
+        state = self.states[deployment.name]
+        with self._lock:
+            if release:
+                state.outstanding -= 1
+            state.consecutive_failures = 0
+            state.unhealthy_until = 0.0
+            if state.latency is None:
+                state.latency = latency
+            else:
+                state.latency += LATENCY_SMOOTHING * (latency - state.latency)
+    
+    def record_failure(self, deployment: Deployment, immediate: bool = False) -> None:
+        """
+        Count an error, taking the deployment out of rotation when needed.
+        
+        Args:
+            deployment: Deployment that failed
+            immediate: Cool down right away (e.g. the provider returned 429)
+        """
+        state = self.states[deployment.name]
+        with self._lock:
+            state.failures += 1
+            state.consecutive_failures += 1
+            if immediate or state.consecutive_failures >= self.failure_threshold:
+                state.unhealthy_until = self.clock() + self.cooldown_seconds
+    
+    def call(self, request: Callable[[Deployment], T],
+             is_overloaded: Callable[[Exception], bool] = lambda e: False,
+             exclude: Optional[Set[str]] = None) -> T:
+        """
+        Run a request, failing over to other deployments on errors.
+        
+        Args:
+            request: Function sending the request to a deployment
+            is_overloaded: Predicate for errors that should cool the
+                deployment down immediately (rate limits, quota)
+            exclude: Deployments to avoid; ignored if it covers the whole pool
+        
+        Returns:
+            The request's return value
+        
+        Raises:
+            Exception: The last error if every deployment failed
+        """
+        tried: Set[str] = set(exclude or ())
+        if len(tried) >= len(self.deployments):
+            tried = set()
+        while True:
+            deployment = self.select(exclude=tried)
+            if deployment is None:
+                raise last_error
+            tried.add(deployment.name)
+            try:
+                with self.lease(deployment):
+                    return request(deployment)
+            except Exception as e:
+                last_error = e
+                self.record_failure(deployment, immediate=is_overloaded(e))
+    
+    def healthy(self) -> List[str]:
+        """Names of deployments currently in rotation"""
+        now = self.clock()
+        with self._lock:
+            return [d.name for d in self.deployments if self.states[d.name].unhealthy_until <= now]
+    
+    def _score(self, deployment: Deployment) -> tuple:
+        state = self.states[deployment.name]
+        if self.strategy == "latency":
+            # Untried deployments go first so every deployment gets measured
+            load = state.latency if state.latency is not None else 0.0
+        else:
+            load = state.outstanding
+        return load / deployment.weight, state.outstanding, -deployment.weight
+
+
+def load_pool() -> Optional[DeploymentPool]:
+    """
+    Build the deployment pool configured by CODER_DEPLOYMENTS.
+    
+    Returns:
+        Pool, or None when no deployments are configured
+    
+    Raises:
+        ValueError: If the configuration is invalid
+    """
+    spec = config.get_deployments()
+    if not spec:
+        return None
+    return DeploymentPool(parse_deployments(spec), strategy=config.get_routing_strategy())
@@ -0,0 +1,216 @@
+"""Duplicates - Find files in a review whose content was already sent, so it is reviewed once"""
+
+import difflib
+import hashlib
+import re
+import zlib
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from .source_collector import SourceFile
+
+
+# Lines of diff content built by SourceCollector: "+ 12: code", "- 3: code", "  7: code"
+DIFF_LINE_RE = re.compile(r"^([-+ ]) (\d+): ?(.*)$")
+
+# Line references rewritten when findings are copied to a duplicate
+LINE_REF_RE = re.compile(r"\b(Lines?\s+)(\d+)(?:(\s*(?:-|–|to)\s*)(\d+))?", re.IGNORECASE)
+
+# Tokens per shingle and MinHash signature shape (BANDS * ROWS bins)
+SHINGLE_SIZE = 5
+BANDS = 16
+ROWS = 4
+TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+# Files with fewer shingles are only matched exactly (near matches of tiny files are noise)
+MIN_SHINGLES = 50
+
+# One-permutation hashing: the top 6 bits of a mixed 64-bit shingle hash pick
+# one of the 64 bins, the remaining 58 bits are the value kept per bin
+_BIN_BITS = 6
+_VALUE_BITS = 64 - _BIN_BITS
+_MASK = (1 << 64) - 1
+_MIX = 0x9E3779B97F4A7C15
+
+
+@dataclass
+class Duplicate:
+    """A file whose review is copied from an earlier file in the same run"""
+    original: int  # Index of the reviewed file
+    line_map: Dict[int, int]  # Line of the original -> line of the duplicate
+    similarity: float = 1.0  # Estimated share of shingles in common
+    exact: bool = True  # Content equal up to whitespace, so every line has a counterpart
+
+
+def normalized_lines(source_file: SourceFile) -> List[Tuple[Optional[int], str]]:
+    """
+    Reduce a file to the lines that identify its content.
+    
+    Blank lines and trailing whitespace are dropped. Diff content keeps its
+    +/-/context marker but loses the file header and line-number prefixes.
+    
+    Args:
+        source_file: File or diff under review
+    
+    Returns:
+        (line number findings refer to, normalized text) pairs; the number is
+        None for removed diff lines, which findings don't point at
+    """
+    lines = []
+    if source_file.is_diff:
+        for text in source_file.content.splitlines():
+            match = DIFF_LINE_RE.match(text)
+            if match and match.group(3).strip():
+                marker = match.group(1)
+                number = None if marker == "-" else int(match.group(2))
+                lines.append((number, marker + match.group(3).rstrip()))
+        return lines
+    for number, text in enumerate(source_file.content.splitlines(), 1):
+        if text.strip():
+            lines.append((number, text.rstrip()))
+    return lines
+
+
+def minhash(texts: List[str]) -> Optional[List[int]]:
+    """
+    MinHash signature of the token shingles of a file.
+    
+    Uses one-permutation hashing: every shingle is hashed once and only
+    lowers the minimum of its bin, instead of being hashed once per
+    signature entry. Empty bins borrow the value of the next filled bin.
+    
+    Returns:
+        BANDS * ROWS bin minimums, or None if the file is too small
+    """
+    tokens = TOKEN_RE.findall("\n".join(texts))
+    codes = list(map(zlib.crc32, map(str.encode, tokens)))
+    # Hashes of int tuples do not depend on PYTHONHASHSEED, so signatures are stable
+    shingles = set(map(hash, zip(*(codes[offset:] for offset in range(SHINGLE_SIZE)))))
+    if len(shingles) < MIN_SHINGLES:
+        return None
+    size = BANDS * ROWS
+    bins: List[Optional[int]] = [None] * size
+    for shingle in shingles:
+        mixed = (shingle * _MIX) & _MASK
+        index, value = mixed >> _VALUE_BITS, mixed & ((1 << _VALUE_BITS) - 1)
+        if bins[index] is None or value < bins[index]:
+            bins[index] = value
+    signature = []
+    for index in range(size):
+        offset = next(offset for offset in range(size) if bins[(index + offset) % size] is not None)
+        # Borrowed values are tagged with the distance so they only match the same borrowing
+        signature.append(bins[(index + offset) % size] + (offset << _VALUE_BITS))
+    return signature
+
+
+def find_duplicates(source_files: List[SourceFile], threshold: float = 1.0) -> Dict[int, Duplicate]:
+    """
+    Find files repeating the content of an earlier file.
+    
+    Files equal after normalization are exact duplicates. With a threshold
+    below 1, files whose estimated shingle similarity reaches it are near
+    duplicates; candidates come from MinHash band buckets, so files are not
+    compared pairwise.
+    
+    Args:
+        source_files: Files in review order
+        threshold: Minimum similarity of duplicates (1.0 for exact copies only)
+    
+    Returns:
+        Duplicate per index of every file that need not be reviewed
+    """
+    duplicates: Dict[int, Duplicate] = {}
+    if len(source_files) < 2:
+        return duplicates
+    lines = [normalized_lines(source_file) for source_file in source_files]
+    first_with_hash: Dict[str, int] = {}
+    for index, file_lines in enumerate(lines):
+        if not file_lines:
+            continue
+        digest = hashlib.sha256("\n".join(text for _, text in file_lines).encode("utf-8")).hexdigest()
+        original = first_with_hash.setdefault(digest, index)
+        if original != index:
+            line_map = {
+                old: new for (old, _), (new, _) in zip(lines[original], file_lines)
+                if old is not None and new is not None
+            }
+            duplicates[index] = Duplicate(original, line_map)
+    
+    if threshold >= 1:
+        return duplicates
+    
+    signatures: Dict[int, List[int]] = {}
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+    for index, file_lines in enumerate(lines):
+        if index in duplicates or not file_lines:
+            continue
+        signature = minhash([text for _, text in file_lines])
+        if signature is None:
+            continue
+        bands = [(band, tuple(signature[band * ROWS:(band + 1) * ROWS])) for band in range(BANDS)]
+        candidates = {original for key in bands for original in buckets.get(key, [])}
+        best = max(
+            ((_estimated_similarity(signatures[original], signature), original) for original in candidates),
+            default=(0.0, None)
+        )
+        if best[1] is not None and best[0] >= threshold:
+            duplicates[index] = Duplicate(best[1], _align(lines[best[1]], file_lines), best[0], exact=False)
+            continue
+        # Only files that get reviewed can be the original of a near duplicate
+        signatures[index] = signature
+        for key in bands:
+            buckets.setdefault(key, []).append(index)
+    return duplicates
+
+
+def _estimated_similarity(first: List[int], second: List[int]) -> float:
+    return sum(a == b for a, b in zip(first, second)) / len(first)
+
+
+def _align(original: List[Tuple[Optional[int], str]], duplicate: List[Tuple[Optional[int], str]]) -> Dict[int, int]:
+    """Map lines of the original to identical lines of a near duplicate"""
+    matcher = difflib.SequenceMatcher(None, [t for _, t in original], [t for _, t in duplicate], autojunk=False)
+    line_map = {}
+    for block in matcher.get_matching_blocks():
+        for offset in range(block.size):
+            old, new = original[block.a + offset][0], duplicate[block.b + offset][0]
+            if old is not None and new is not None:
+                line_map[old] = new
+    return line_map
+
+
+def remap_review(review_text: str, duplicate: Duplicate) -> str:
+    """
+    Rewrite the line references of a review for a duplicate file.
+    
+    References without a counterpart are kept as they are for exact
+    duplicates; for near duplicates the lines mentioning them are dropped,
+    since that code differs in the duplicate.
+    
+    Args:
+        review_text: Review of the original file
+        duplicate: Duplicate receiving the review
+    
+    Returns:
+        Review text for the duplicate
+    """
+    remapped = []
+    for text in review_text.splitlines():
+        unmapped = False
+        
+        def replace(match: re.Match) -> str:
+            nonlocal unmapped
+            numbers = []
+            for group in (2, 4):
+                if match.group(group) is None:
+                    continue
+                line = int(match.group(group))
+                if line not in duplicate.line_map:
+                    unmapped = True
+                numbers.append(str(duplicate.line_map.get(line, line)))
+            return match.group(1) + numbers[0] + (match.group(3) + numbers[1] if len(numbers) > 1 else "")
+        
+        text = LINE_REF_RE.sub(replace, text)
+        if unmapped and not duplicate.exact:
+            continue
+        remapped.append(text)
+    return "\n".join(remapped)
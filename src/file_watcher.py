@@ -0,0 +1,411 @@
+"""File Watcher - Re-review files as they are saved"""
+
+import ctypes
+import ctypes.util
+import hashlib
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Dict, List, Optional, Set
+from .review_orchestrator import ReviewResult
+from .source_collector import SourceFile
+from .tool_ops import is_ignored_dir, is_text_file, read_file_content
+
+
+# inotify event flags (see inotify(7))
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_ISDIR = 0x40000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def watched_files(root: str) -> List[str]:
+    """
+    List the reviewable files under a path.
+    
+    Args:
+        root: File or directory to watch
+    
+    Returns:
+        Text file paths, skipping hidden and dependency directories
+    """
+    if os.path.isfile(root):
+        return [root]
+    files = []
+    for directory, subdirs, names in os.walk(root):
+        subdirs[:] = sorted(name for name in subdirs if not is_ignored_dir(name))
+        files.extend(os.path.join(directory, name) for name in sorted(names) if is_text_file(name))
+    return files
+
+
+class PollingWatcher:
+    """Detect changed files by comparing modification times"""
+    
+    def __init__(self, root: str, interval: float = 0.5):
+        """
+        Initialize polling watcher.
+        
+        Args:
+            root: File or directory to watch
+            interval: Seconds between scans
+        """
+        self.root = root
+        self.interval = interval
+        self._snapshot = self._scan()
+    
+    def poll(self, timeout: float) -> Set[str]:
+        """
+        Wait up to timeout seconds for changes.
+        
+        Returns:
+            Paths created, modified or deleted since the last poll
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            snapshot = self._scan()
+            changed = {
+                path for path in snapshot.keys() | self._snapshot.keys()
+                if snapshot.get(path) != self._snapshot.get(path)
+            }
+            self._snapshot = snapshot
+            remaining = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            time.sleep(min(self.interval, remaining))
+    
+    def close(self) -> None:
+        """Release resources (nothing to release)"""
+    
+    def _scan(self) -> Dict[str, tuple]:
+        snapshot = {}
+        for path in watched_files(self.root):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+
+class InotifyWatcher:
+    """Detect changed files with Linux inotify, without polling"""
+    
+    def __init__(self, root: str):
+        """
+        Initialize inotify watcher.
+        
+        Args:
+            root: File or directory to watch
+        
+        Raises:
+            OSError: If inotify is not available
+        """
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.root = root
+        self._single_file = root if os.path.isfile(root) else None
+        self._watches: Dict[int, str] = {}
+        try:
+            if self._single_file:
+                self._add_watch(os.path.dirname(root) or ".")
+            else:
+                self._add_tree(root)
+        except OSError:
+            self.close()
+            raise
+    
+    def poll(self, timeout: float) -> Set[str]:
+        """
+        Wait up to timeout seconds for changes.
+        
+        Returns:
+            Paths created, written, moved or deleted since the last poll
+        """
+        readable, _, _ = select.select([self._fd], [], [], max(timeout, 0))
+        if not readable:
+            return set()
+        changed = set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0").decode("utf-8", "surrogateescape")
+            offset += length
+            directory = self._watches.get(wd)
+            if directory is None or not name:
+                continue
+            path = os.path.join(directory, name)
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO) and not self._single_file and not is_ignored_dir(name):
+                    self._add_tree(path)
+                    changed.update(watched_files(path))
+                continue
+            if self._accepts(path):
+                changed.add(path)
+        return changed
+    
+    def close(self) -> None:
+        """Stop watching"""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+    
+    def _accepts(self, path: str) -> bool:
+        if self._single_file:
+            return os.path.normpath(path) == os.path.normpath(self._single_file)
+        return is_text_file(path)
+    
+    def _add_tree(self, root: str) -> None:
+        for directory, subdirs, _ in os.walk(root):
+            subdirs[:] = [name for name in subdirs if not is_ignored_dir(name)]
+            self._add_watch(directory)
+    
+    def _add_watch(self, directory: str) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"Cannot watch {directory}")
+        self._watches[wd] = directory
+
+
+def create_watcher(root: str, polling: bool = False):
+    """
+    Create the best available watcher for a path.
+    
+    Args:
+        root: File or directory to watch
+        polling: Force the portable polling watcher
+    
+    Returns:
+        InotifyWatcher where supported, otherwise PollingWatcher
+    """
+    if not polling:
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError):
+            # Not Linux, libc without inotify, or the watch limit is reached
+            pass
+    return PollingWatcher(root)
+
+
+class Debouncer:
+    """Hold back changed paths until they stop changing"""
+    
+    def __init__(self, window: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize debouncer.
+        
+        Args:
+            window: Quiet seconds required after the last change
+            clock: Monotonic clock
+        """
+        self.window = window
+        self.clock = clock
+        self._changed: Dict[str, float] = {}
+    
+    def add(self, path: str) -> None:
+        """Record a change, restarting the path's quiet period"""
+        self._changed[path] = self.clock()
+    
+    def due(self) -> List[str]:
+        """Remove and return paths that have been quiet for the whole window"""
+        now = self.clock()
+        ready = [path for path, changed in self._changed.items() if now - changed >= self.window]
+        for path in ready:
+            del self._changed[path]
+        return ready
+    
+    def next_deadline(self) -> Optional[float]:
+        """Seconds until the next path is due, or None if nothing is pending"""
+        if not self._changed:
+            return None
+        return max(0.0, min(self._changed.values()) + self.window - self.clock())
+
+
+class WatchStatus(Enum):
+    """State of a watched file"""
+    REVIEWING = "reviewing"
+    DONE = "done"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+    CANCELLED = "cancelled"
+    DELETED = "deleted"
+
+
+@dataclass
+class WatchEntry:
+    """Latest review state of a watched file"""
+    path: str
+    status: WatchStatus
+    result: Optional[ReviewResult] = None
+    updated_at: float = 0.0
+    reviews: int = 0
+
+
+class WatchReviewer:
+    """Review changed files, dropping work made stale by newer saves"""
+    
+    def __init__(self, review: Callable[[SourceFile], Optional[ReviewResult]],
+                 on_update: Optional[Callable[[WatchEntry], None]] = None, max_workers: int = 1):
+        """
+        Initialize watch reviewer.
+        
+        Args:
+            review: Function reviewing one file (None if it was skipped)
+            on_update: Optional callback receiving each changed entry
+            max_workers: Maximum number of files reviewed concurrently
+        """
+        self.review = review
+        self.on_update = on_update
+        self.entries: Dict[str, WatchEntry] = {}
+        self._hashes: Dict[str, str] = {}
+        self._futures: Dict[str, Future] = {}
+        self._generations: Dict[str, int] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="watch")
+        self._lock = threading.Lock()
+    
+    def prime(self, paths: List[str]) -> None:
+        """Remember current contents so saving them unchanged triggers nothing"""
+        for path in paths:
+            content = _read(path)
+            if content is not None:
+                self._hashes[path] = _content_hash(content)
+    
+    def submit(self, path: str) -> bool:
+        """
+        Review a file's current content unless it was already reviewed.
+        
+        A review still running for an older version is cancelled if it has
+        not started, and its result is discarded otherwise.
+        
+        Args:
+            path: Changed file
+        
+        Returns:
+            True if a review was started
+        """
+        content = _read(path)
+        with self._lock:
+            if content is None:
+                self._hashes.pop(path, None)
+                self._cancel(path)
+                if path in self.entries:
+                    self._update(path, WatchStatus.DELETED)
+                return False
+            
+            digest = _content_hash(content)
+            if self._hashes.get(path) == digest:
+                return False
+            self._hashes[path] = digest
+            self._cancel(path)
+            generation = self._generations.get(path, 0) + 1
+            self._generations[path] = generation
+            entry = self._update(path, WatchStatus.REVIEWING, notify=False)
+            entry.reviews += 1
+            source_file = SourceFile(path=path, content=content, size=len(content), lines=len(content.splitlines()))
+            self._futures[path] = self._executor.submit(self._run, source_file, generation)
+        self._notify(entry)
+        return True
+    
+    def close(self) -> None:
+        """Cancel queued reviews and wait for running ones"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _run(self, source_file: SourceFile, generation: int) -> None:
+        try:
+            result = self.review(source_file)
+        except Exception as e:
+            result = ReviewResult(source_file.path, f"Review failed: {e}", False)
+        path = source_file.path
+        with self._lock:
+            if self._generations.get(path) != generation:
+                # A newer save superseded this review
+                return
+            self._futures.pop(path, None)
+            if result is None:
+                status = WatchStatus.SKIPPED
+            elif result.success:
+                status = WatchStatus.DONE
+            else:
+                status = WatchStatus.FAILED
+            if status != WatchStatus.DONE:
+                # Retry on the next save even if the content is unchanged
+                self._hashes.pop(path, None)
+            entry = self._update(path, status, result, notify=False)
+        self._notify(entry)
+    
+    def _cancel(self, path: str) -> None:
+        """Drop the pending or running review of a path (lock held)"""
+        future = self._futures.pop(path, None)
+        if future is not None and not future.done():
+            future.cancel()
+            self._generations[path] = self._generations.get(path, 0) + 1
+            self._update(path, WatchStatus.CANCELLED, notify=False)
+    
+    def _update(self, path: str, status: WatchStatus, result: Optional[ReviewResult] = None,
+                notify: bool = True) -> WatchEntry:
+        entry = self.entries.get(path)
+        if entry is None:
+            entry = self.entries[path] = WatchEntry(path, status)
+        entry.status = status
+        if result is not None:
+            entry.result = result
+        entry.updated_at = time.time()
+        if notify:
+            self._notify(entry)
+        return entry
+    
+    def _notify(self, entry: WatchEntry) -> None:
+        if self.on_update:
+            self.on_update(entry)
+
+
+def watch(watcher, debouncer: Debouncer, reviewer: WatchReviewer,
+          stop: Optional[threading.Event] = None, idle_poll: float = 1.0) -> None:
+    """
+    Feed file changes through the debouncer into the reviewer until stopped.
+    
+    Args:
+        watcher: InotifyWatcher or PollingWatcher
+        debouncer: Debouncer holding back files still being edited
+        reviewer: Reviewer of files that settled
+        stop: Optional event ending the loop (default: run until interrupted)
+        idle_poll: Longest wait for changes while nothing is pending
+    """
+    stop = stop or threading.Event()
+    while not stop.is_set():
+        deadline = debouncer.next_deadline()
+        for path in watcher.poll(idle_poll if deadline is None else min(deadline, idle_poll)):
+            debouncer.add(path)
+        for path in debouncer.due():
+            reviewer.submit(path)
+
+
+def _read(path: str) -> Optional[str]:
+    """Read a watched file, or None if it is gone or unreadable"""
+    try:
+        return read_file_content(path)
+    except (OSError, ValueError):
+        return None
+
+
+def _content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8", "surrogateescape")).hexdigest()
@@ -0,0 +1,227 @@
+"""Findings - Parse line-referenced findings out of review text (no rendering imports)"""
+
+import json
+import re
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+
+
+# Severities of structured findings, most severe first
+SEVERITIES = ("error", "warning", "info")
+
+# Severity words models use instead of the requested ones
+SEVERITY_ALIASES = {
+    "critical": "error", "high": "error", "major": "error", "bug": "error",
+    "medium": "warning", "moderate": "warning", "minor": "warning",
+    "low": "info", "note": "info", "suggestion": "info", "style": "info",
+}
+
+# "Line 12: ...", "Lines 12-14: ...", optionally tagged "[error/security]"
+LINE_REFERENCE_RE = re.compile(r"\bLines? (\d+)(?:\s*(?:-|–|to)\s*(\d+))?:", re.IGNORECASE)
+GENERAL_FINDING_RE = re.compile(r"^General:\s*(.*)", re.IGNORECASE)
+TAG_RE = re.compile(r"^\[(error|warning|info)(?:/([\w-]+))?\]\s*", re.IGNORECASE)
+
+# Start of the findings array in a structured response
+FINDINGS_ARRAY_RE = re.compile(r'"findings"\s*:\s*\[')
+
+STRUCTURED_INSTRUCTIONS = """
+
+OUTPUT FORMAT (this replaces any other formatting instruction):
+Reply with ONLY a JSON object, without prose or markdown fences:
+{"findings": [{"line": 12, "end_line": 14, "severity": "error", "category": "bugs", "message": "..."}]}
+- line, end_line: first and last line the finding is about; omit end_line for a single line,
+  use null for line if the finding concerns the whole file
+- severity: "error" (bug or vulnerability), "warning" (likely problem) or "info" (minor improvement)
+- category: one of "bugs", "security", "performance", "quality", "language"
+- message: what is wrong and how to fix it, in one or two sentences
+- Reply with {"findings": []} if nothing needs fixing"""
+
+
+@dataclass
+class Finding:
+    """One issue reported by a review"""
+    line: Optional[int]  # None for findings about the whole file
+    message: str
+    end_line: Optional[int] = None  # Last line of a multi-line finding
+    severity: Optional[str] = None  # One of SEVERITIES; None if the review didn't say
+    category: str = ""
+    
+    def format(self) -> str:
+        """Render the finding as review text that findings_from_text reads back"""
+        tag = ""
+        if self.severity:
+            tag = f"[{self.severity}/{self.category}] " if self.category else f"[{self.severity}] "
+        if self.line is None:
+            return f"- General: {tag}{self.message}"
+        if self.end_line:
+            return f"- Lines {self.line}-{self.end_line}: {tag}{self.message}"
+        return f"- Line {self.line}: {tag}{self.message}"
+
+
+def structured_section(structured: bool) -> str:
+    """Prompt instructions asking for findings as JSON, empty unless structured output is on"""
+    return STRUCTURED_INSTRUCTIONS if structured else ""
+
+
+def structured_label(structured: bool) -> str:
+    """Suffix distinguishing stored results and journals of structured-output reviews"""
+    return "+structured" if structured else ""
+
+
+def render_findings(findings: List[Finding]) -> str:
+    """Render structured findings as review text, one finding per line"""
+    return "\n".join(finding.format() for finding in findings)
+
+
+def findings_from_text(review_text: str) -> List[Finding]:
+    """
+    Parse findings out of free-form review text.
+    
+    A line may hold several "Line X:" references, each starting a finding.
+    Lines following a finding up to the next blank line or finding continue
+    its message. Severity tags written by Finding.format are read back.
+    
+    Args:
+        review_text: LLM review response or rendered findings
+    
+    Returns:
+        Findings with a line reference or an explicit "General:" label
+    """
+    findings: List[Finding] = []
+    current = None
+    for text in review_text.splitlines():
+        stripped = text.strip().lstrip("-*•").strip()
+        references = list(LINE_REFERENCE_RE.finditer(stripped))
+        general = None if references else GENERAL_FINDING_RE.match(stripped)
+        if references:
+            ends = [reference.start() for reference in references[1:]] + [len(stripped)]
+            for reference, end in zip(references, ends):
+                line = int(reference.group(1))
+                end_line = int(reference.group(2)) if reference.group(2) else None
+                # Drop the markdown emphasis around "**Line 3:**"
+                message = stripped[reference.end():end].lstrip("*_").strip()
+                if end < len(stripped):
+                    message = message.rstrip("* ")
+                current = _tagged_finding(line, message, end_line if end_line and end_line > line else None)
+                findings.append(current)
+        elif general:
+            current = _tagged_finding(None, general.group(1).strip())
+            findings.append(current)
+        elif current is not None and stripped and not stripped.startswith(("#", "```")):
+            current.message = f"{current.message}\n{stripped}" if current.message else stripped
+        else:
+            current = None
+    return findings
+
+
+def parse_json_findings(response: str) -> Optional[List[Finding]]:
+    """
+    Parse a structured response, tolerating what models get wrong.
+    
+    The findings array is scanned element by element, so prose or markdown
+    fences around the JSON, malformed elements, trailing commas and a
+    response cut off at the token limit cost only the affected findings.
+    
+    Args:
+        response: LLM response to a prompt with STRUCTURED_INSTRUCTIONS
+    
+    Returns:
+        Findings, or None if the response has no findings array (the caller
+        then falls back to findings_from_text)
+    """
+    match = FINDINGS_ARRAY_RE.search(response)
+    if match:
+        start = match.end()
+    else:
+        # A bare array of findings
+        stripped = re.sub(r"^```\w*\s*", "", response.strip())
+        if not stripped.startswith("["):
+            return None
+        start = response.index("[") + 1
+    findings = []
+    for element in _iter_array_objects(response, start):
+        try:
+            data = json.loads(element)
+        except ValueError:
+            try:
+                data = json.loads(re.sub(r",\s*([}\]])", r"\1", element))
+            except ValueError:
+                continue
+        finding = _finding_from_json(data)
+        if finding is not None:
+            findings.append(finding)
+    return findings
+
+
+def _iter_array_objects(text: str, start: int) -> Iterator[str]:
+    """Yield the source of each complete object in the JSON array starting at text[start]"""
+    depth = 0
+    in_string = escaped = False
+    element_start = None
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            if depth == 0 and char == "{":
+                element_start = index
+            depth += 1
+        elif char in "}]":
+            if depth == 0:
+                return  # End of the findings array
+            depth -= 1
+            if depth == 0 and element_start is not None:
+                yield text[element_start:index + 1]
+                element_start = None
+
+
+def _finding_from_json(data) -> Optional[Finding]:
+    """Validate one decoded findings element, normalizing loosely typed fields"""
+    if not isinstance(data, dict):
+        return None
+    message = data.get("message") or data.get("description") or data.get("issue")
+    if not isinstance(message, str) or not message.strip():
+        return None
+    line, end_line = _json_line(data.get("line")), _json_line(data.get("end_line"))
+    if isinstance(data.get("line"), str) and "-" in data["line"]:
+        # "line": "12-14"
+        line, end_line = (_json_line(part) for part in data["line"].split("-", 1))
+    severity = str(data.get("severity") or "").strip().lower()
+    severity = SEVERITY_ALIASES.get(severity, severity)
+    category = data.get("category")
+    return Finding(
+        line=line,
+        message=" ".join(message.split()),
+        end_line=end_line if line and end_line and end_line > line else None,
+        severity=severity if severity in SEVERITIES else "warning",
+        category=category.strip().lower() if isinstance(category, str) else ""
+    )
+
+
+def _json_line(value) -> Optional[int]:
+    """Line number from an int or numeric string, None if absent or invalid"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value if value > 0 else None
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value) or None
+    return None
+
+
+def _tagged_finding(line: Optional[int], message: str, end_line: Optional[int] = None) -> Finding:
+    """Finding whose message may start with a "[severity/category]" tag"""
+    finding = Finding(line, message, end_line)
+    tag = TAG_RE.match(message)
+    if tag:
+        finding.severity = tag.group(1).lower()
+        finding.category = (tag.group(2) or "").lower()
+        finding.message = message[tag.end():]
+    return finding
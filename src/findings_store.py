@@ -0,0 +1,278 @@
+"""Findings Store - SQLite history of review results and their findings"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import List, Optional, Tuple
+from .config import config
+from .review_orchestrator import PROMPT_VERSION, ReviewResult
+from .source_collector import SourceFile
+from .tool_ops import git_blob_sha
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    repo TEXT NOT NULL,
+    review_type TEXT NOT NULL,
+    target TEXT,
+    base_ref TEXT,
+    commit_sha TEXT,
+    model TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    started_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL REFERENCES runs(run_id),
+    repo TEXT NOT NULL,
+    path TEXT NOT NULL,
+    blob_sha TEXT NOT NULL,
+    model TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    commit_sha TEXT,
+    success INTEGER NOT NULL,
+    is_diff INTEGER NOT NULL,
+    diff_info TEXT,
+    review_content TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    duplicate_of TEXT
+);
+CREATE TABLE IF NOT EXISTS findings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    result_id INTEGER NOT NULL REFERENCES results(id),
+    path TEXT NOT NULL,
+    line INTEGER,
+    message TEXT NOT NULL,
+    end_line INTEGER,
+    severity TEXT,
+    category TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_results_key ON results(repo, path, blob_sha, model, prompt_version);
+CREATE INDEX IF NOT EXISTS idx_results_path ON results(path);
+CREATE INDEX IF NOT EXISTS idx_results_commit ON results(commit_sha);
+CREATE INDEX IF NOT EXISTS idx_results_run ON results(run_id);
+CREATE INDEX IF NOT EXISTS idx_findings_path ON findings(path);
+"""
+
+# Columns added after a table was first created, added to older databases on open
+ADDED_COLUMNS = {
+    "results": [("duplicate_of", "TEXT")],
+    "findings": [("end_line", "INTEGER"), ("severity", "TEXT"), ("category", "TEXT")],
+}
+
+
+def _result_from_row(row: sqlite3.Row) -> ReviewResult:
+    return ReviewResult(
+        file_path=row["path"],
+        review_content=row["review_content"],
+        success=bool(row["success"]),
+        is_diff=bool(row["is_diff"]),
+        diff_info=json.loads(row["diff_info"]) if row["diff_info"] else None,
+        duplicate_of=row["duplicate_of"]
+    )
+
+
+class FindingsStore:
+    """SQLite database of review runs, results and parsed findings"""
+    
+    def __init__(self, path: str):
+        """
+        Open (and create if needed) a findings database.
+        
+        Args:
+            path: Database file path, or ":memory:"
+        """
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.executescript(SCHEMA)
+        self._add_columns()
+        self._lock = threading.Lock()
+    
+    def _add_columns(self) -> None:
+        """Upgrade tables created by older versions with the columns they lack"""
+        with self._connection:
+            for table, columns in ADDED_COLUMNS.items():
+                existing = {row["name"] for row in self._connection.execute(f"PRAGMA table_info({table})")}
+                for name, column_type in columns:
+                    if name not in existing:
+                        self._connection.execute(f"ALTER TABLE {table} ADD COLUMN {name} {column_type}")
+    
+    @classmethod
+    def for_repo(cls, repo: str = ".") -> "FindingsStore":
+        """Return the store inside the repository's state directory"""
+        return cls(os.path.join(repo, config.get_state_dir(), "findings.db"))
+    
+    def start_run(self, repo: str, review_type: str, model: str, target: Optional[str] = None,
+                  base_ref: Optional[str] = None, commit_sha: Optional[str] = None) -> "RunRecorder":
+        """
+        Register a new review run.
+        
+        Args:
+            repo: Repository path
+            review_type: ReviewType value of the run
+            model: LLM model name
+            target: Reviewed file, commit or branch
+            base_ref: Base commit the review compares against
+            commit_sha: Head commit the review covers
+        
+        Returns:
+            Recorder bound to the new run
+        """
+        run_id = uuid.uuid4().hex[:12]
+        repo = os.path.abspath(repo)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (run_id, repo, review_type, target, base_ref, commit_sha, model, PROMPT_VERSION, time.time())
+            )
+        return RunRecorder(self, run_id, repo, model, commit_sha)
+    
+    def lookup(self, repo: str, path: str, blob_sha: str, model: str) -> Optional[ReviewResult]:
+        """
+        Find the latest successful result for identical input.
+        
+        Args:
+            repo: Repository path
+            path: File path
+            blob_sha: git_blob_sha of the reviewed content
+            model: LLM model name
+        
+        Returns:
+            Stored result, or None
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT * FROM results WHERE repo = ? AND path = ? AND blob_sha = ? AND model = ? "
+                "AND prompt_version = ? AND success = 1 ORDER BY id DESC LIMIT 1",
+                (os.path.abspath(repo), path, blob_sha, model, PROMPT_VERSION)
+            ).fetchone()
+        return _result_from_row(row) if row else None
+    
+    def record(self, run_id: str, repo: str, model: str, commit_sha: Optional[str],
+               blob_sha: str, result: ReviewResult) -> None:
+        """Store a result and its findings as part of a run"""
+        findings = [finding for finding in result.findings if finding.line is not None]
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "INSERT INTO results (run_id, repo, path, blob_sha, model, prompt_version, commit_sha, "
+                "success, is_diff, diff_info, review_content, created_at, duplicate_of) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (run_id, os.path.abspath(repo), result.file_path, blob_sha, model, PROMPT_VERSION,
+                 commit_sha, int(result.success), int(result.is_diff),
+                 json.dumps(result.diff_info) if result.diff_info else None,
+                 result.review_content, time.time(), result.duplicate_of)
+            )
+            self._connection.executemany(
+                "INSERT INTO findings (result_id, path, line, message, end_line, severity, category) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(cursor.lastrowid, result.file_path, finding.line, finding.message, finding.end_line,
+                  finding.severity, finding.category or None) for finding in findings]
+            )
+    
+    def latest_run_id(self) -> Optional[str]:
+        """Return the most recently started run, if any"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT run_id FROM runs ORDER BY started_at DESC, rowid DESC LIMIT 1"
+            ).fetchone()
+        return row["run_id"] if row else None
+    
+    def get_run(self, run_id: str) -> Tuple[dict, List[ReviewResult]]:
+        """
+        Load a run and its results in review order.
+        
+        Args:
+            run_id: Run identifier (a unique prefix is accepted)
+        
+        Returns:
+            Tuple of (run metadata, results)
+        
+        Raises:
+            ValueError: If no single run matches
+        """
+        with self._lock:
+            runs = self._connection.execute(
+                "SELECT * FROM runs WHERE run_id LIKE ? || '%'", (run_id,)
+            ).fetchall()
+            if len(runs) != 1:
+                problem = "No run matches" if not runs else "Ambiguous run id"
+                raise ValueError(f"{problem}: {run_id}")
+            rows = self._connection.execute(
+                "SELECT * FROM results WHERE run_id = ? ORDER BY id", (runs[0]["run_id"],)
+            ).fetchall()
+        return dict(runs[0]), [_result_from_row(row) for row in rows]
+    
+    def history(self, path: str, limit: int = 20) -> List[dict]:
+        """
+        List stored reviews of a file, newest first.
+        
+        Args:
+            path: File path as reviewed
+            limit: Maximum number of reviews returned
+        
+        Returns:
+            Dicts with run_id, commit_sha, model, created_at, success and
+            findings as (line, message) tuples
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, run_id, commit_sha, model, created_at, success FROM results "
+                "WHERE path = ? ORDER BY id DESC LIMIT ?", (path, limit)
+            ).fetchall()
+            entries = []
+            for row in rows:
+                findings = self._connection.execute(
+                    "SELECT line, message FROM findings WHERE result_id = ? ORDER BY id", (row["id"],)
+                ).fetchall()
+                entry = dict(row)
+                del entry["id"]
+                entry["findings"] = [(finding["line"], finding["message"]) for finding in findings]
+                entries.append(entry)
+        return entries
+    
+    def close(self) -> None:
+        """Close the database connection"""
+        self._connection.close()
+
+
+class RunRecorder:
+    """Findings store bound to one run, used as a result cache while reviewing"""
+    
+    def __init__(self, store: FindingsStore, run_id: str, repo: str, model: str,
+                 commit_sha: Optional[str] = None):
+        """
+        Initialize run recorder.
+        
+        Args:
+            store: Findings store
+            run_id: Run the results belong to
+            repo: Repository path
+            model: LLM model name
+            commit_sha: Head commit of the run
+        """
+        self.store = store
+        self.run_id = run_id
+        self.repo = repo
+        self.model = model
+        self.commit_sha = commit_sha
+    
+    def lookup(self, source_file: SourceFile) -> Optional[ReviewResult]:
+        """Return a stored result for identical content, if any"""
+        return self.store.lookup(self.repo, source_file.path, git_blob_sha(source_file.content or ""), self.model)
+    
+    def record(self, source_file: SourceFile, result: ReviewResult) -> None:
+        """Store a result of this run"""
+        self.store.record(self.run_id, self.repo, self.model, self.commit_sha,
+                          git_blob_sha(source_file.content or ""), result)
+    
+    def close(self) -> None:
+        """Close the underlying findings store"""
+        self.store.close()
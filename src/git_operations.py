@@ -2,8 +2,10 @@
 
 import subprocess
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
+from .metrics import GIT_COMMAND_SECONDS, timed
+from .tracing import traced
 
 
 @dataclass
@@ -29,6 +31,8 @@ class GitOperations:
         """
         self.working_dir = working_dir
     
+    @traced("git.diff")
+    @timed(GIT_COMMAND_SECONDS, command="diff")
     def get_staged_diff(self) -> str:
         """
         Get staged changes diff.
@@ -58,6 +62,8 @@ class GitOperations:
         except FileNotFoundError:
             raise ValueError("Git not found - ensure git is installed")
     
+    @traced("git.diff")
+    @timed(GIT_COMMAND_SECONDS, command="diff")
     def get_commit_diff(self, commit_hash: str) -> str:
         """
         Get diff for specific commit.
@@ -85,6 +91,8 @@ class GitOperations:
         except subprocess.CalledProcessError as e:
             raise ValueError(f"Git show failed: {e.stderr}")
     
+    @traced("git.diff")
+    @timed(GIT_COMMAND_SECONDS, command="diff")
     def get_branch_diff(self, branch: str, base_branch: str = "main") -> str:
         """
         Get diff between branch and base branch.
@@ -116,6 +124,7 @@ class GitOperations:
         except subprocess.CalledProcessError as e:
             raise ValueError(f"Git branch diff failed: {e.stderr}")
     
+    @traced("git.parse_diff")
     def parse_diff(self, diff_output: str) -> List[GitDiffFile]:
         """
         Parse git diff output into structured data.
@@ -188,6 +197,8 @@ class GitOperations:
         
         return files
     
+    @traced("git.show")
+    @timed(GIT_COMMAND_SECONDS, command="show")
     def get_file_content_at_commit(self, file_path: str, commit_hash: str = "HEAD") -> str:
         """
         Get file content at specific commit.
@@ -215,3 +226,111 @@ class GitOperations:
             
         except subprocess.CalledProcessError as e:
             raise ValueError(f"Failed to get file content: {e.stderr}")
+    
+    @timed(GIT_COMMAND_SECONDS, command="rev-parse")
+    def resolve_ref(self, ref: str) -> str:
+        """
+        Resolve a ref (branch, tag or abbreviated hash) to a full commit hash.
+        
+        Args:
+            ref: Git ref to resolve
+            
+        Returns:
+            Full commit hash
+            
+        Raises:
+            ValueError: If git command fails
+        """
+        try:
+            result = subprocess.run(
+                ["git", "rev-parse", "--verify", f"{ref}^{{commit}}"],
+                cwd=self.working_dir,
+                capture_output=True,
+                text=True,
+                check=True
+            )
+            
+            return result.stdout.strip()
+            
+        except subprocess.CalledProcessError as e:
+            raise ValueError(f"Failed to resolve ref '{ref}': {e.stderr}")
+        except FileNotFoundError:
+            raise ValueError("Git not found - ensure git is installed")
+    
+    @timed(GIT_COMMAND_SECONDS, command="merge-base")
+    def get_merge_base(self, branch: str, base_branch: str = "main") -> str:
+        """
+        Get the commit a branch diff compares against.
+        
+        Args:
+            branch: Branch to review
+            base_branch: Base branch to compare against
+            
+        Returns:
+            Full hash of the best common ancestor
+            
+        Raises:
+            ValueError: If git command fails
+        """
+        try:
+            result = subprocess.run(
+                ["git", "merge-base", base_branch, branch],
+                cwd=self.working_dir,
+                capture_output=True,
+                text=True,
+                check=True
+            )
+            
+            return result.stdout.strip()
+            
+        except subprocess.CalledProcessError as e:
+            raise ValueError(f"Failed to find merge base of {base_branch} and {branch}: {e.stderr}")
+        except FileNotFoundError:
+            raise ValueError("Git not found - ensure git is installed")
+    
+    @traced("git.cat_file")
+    @timed(GIT_COMMAND_SECONDS, command="cat-file")
+    def read_blobs(self, specs: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Read many file versions with a single git process.
+        
+        Args:
+            specs: Object names like "HEAD:src/app.py" (":src/app.py" for the index)
+            
+        Returns:
+            Content per spec, None for versions that don't exist
+            
+        Raises:
+            ValueError: If git command fails
+        """
+        if not specs:
+            return {}
+        try:
+            result = subprocess.run(
+                ["git", "cat-file", "--batch"],
+                cwd=self.working_dir,
+                input="".join(f"{spec}\n" for spec in specs).encode("utf-8"),
+                capture_output=True,
+                check=True
+            )
+        except subprocess.CalledProcessError as e:
+            raise ValueError(f"Git cat-file failed: {e.stderr.decode('utf-8', 'replace')}")
+        except FileNotFoundError:
+            raise ValueError("Git not found - ensure git is installed")
+        
+        # Each answer is "<sha> <type> <size>\n<content>\n", or "<spec> missing\n"
+        contents: Dict[str, Optional[str]] = {}
+        output = result.stdout
+        offset = 0
+        for spec in specs:
+            header_end = output.index(b"\n", offset)
+            header = output[offset:header_end].split()
+            offset = header_end + 1
+            if len(header) != 3:
+                contents[spec] = None
+                continue
+            size = int(header[2])
+            blob = header[1] == b"blob"
+            contents[spec] = output[offset:offset + size].decode("utf-8", "replace") if blob else None
+            offset += size + 1
+        return contents
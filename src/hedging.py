@@ -0,0 +1,111 @@
+"""Hedging - Duplicate slow requests and keep whichever response arrives first"""
+
+import math
+import queue
+import threading
+from collections import deque
+from typing import Callable, Optional, Tuple, TypeVar
+
+
+# Latency samples needed before the percentile is trusted enough to hedge
+MIN_SAMPLES = 20
+
+T = TypeVar("T")
+
+
+class LatencyWindow:
+    """Thread-safe window of recent request latencies"""
+    
+    def __init__(self, size: int = 200, min_samples: int = MIN_SAMPLES):
+        """
+        Initialize latency window.
+        
+        Args:
+            size: Number of most recent samples kept
+            min_samples: Samples required before percentile() returns a value
+        """
+        self.min_samples = min_samples
+        self._samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+    
+    def add(self, latency: float) -> None:
+        """Record the latency of a completed request"""
+        with self._lock:
+            self._samples.append(latency)
+    
+    def percentile(self, percentile: float) -> Optional[float]:
+        """
+        Nearest-rank percentile of recent latencies.
+        
+        Args:
+            percentile: Percentile between 0 and 100
+        
+        Returns:
+            Latency in seconds, or None with too few samples
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+        if len(samples) < self.min_samples:
+            return None
+        rank = max(1, math.ceil(percentile / 100 * len(samples)))
+        return samples[rank - 1]
+
+
+def hedged_call(request: Callable[[bool, threading.Event], T], delay: float,
+                on_abandoned: Optional[Callable[[T], None]] = None) -> Tuple[T, bool, bool]:
+    """
+    Run a request, sending a duplicate if it has not finished after a delay.
+    
+    The first successful response wins. The other request is cancelled if it
+    has not been sent yet (request functions should check the event right
+    before sending); a request already in flight cannot be aborted, so its
+    response is handed to on_abandoned when it arrives.
+    
+    Args:
+        request: Function called as request(is_hedge, cancelled)
+        delay: Seconds to wait for the primary before hedging
+        on_abandoned: Optional callback receiving the losing response
+    
+    Returns:
+        Tuple of (response, hedged, hedge_won)
+    
+    Raises:
+        Exception: The primary's error if both requests fail
+    """
+    outcomes: "queue.Queue[tuple]" = queue.Queue()
+    cancelled = {False: threading.Event(), True: threading.Event()}
+    
+    def run(is_hedge: bool) -> None:
+        try:
+            outcomes.put((is_hedge, request(is_hedge, cancelled[is_hedge]), None))
+        except Exception as e:
+            outcomes.put((is_hedge, None, e))
+    
+    threading.Thread(target=run, args=(False,), daemon=True).start()
+    try:
+        is_hedge, response, error = outcomes.get(timeout=delay)
+    except queue.Empty:
+        pass
+    else:
+        if error is not None:
+            raise error
+        return response, False, False
+    
+    threading.Thread(target=run, args=(True,), daemon=True).start()
+    errors = {}
+    for remaining in (1, 0):
+        is_hedge, response, error = outcomes.get()
+        if error is None:
+            if remaining:
+                cancelled[not is_hedge].set()
+                threading.Thread(target=_collect_loser, args=(outcomes, on_abandoned), daemon=True).start()
+            return response, True, is_hedge
+        errors[is_hedge] = error
+    raise errors[False]
+
+
+def _collect_loser(outcomes: "queue.Queue[tuple]", on_abandoned: Optional[Callable]) -> None:
+    """Wait for the losing request and report its response"""
+    _, response, error = outcomes.get()
+    if error is None and response is not None and on_abandoned:
+        on_abandoned(response)
@@ -4,6 +4,7 @@ from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
+from .tracing import traced
 
 
 class ReviewType(Enum):
@@ -25,6 +26,7 @@ class ReviewInput:
 class InputParser:
     """Parse and validate input for code review"""
     
+    @traced("input_parser.parse")
     def parse(self, file_path: str, diff: bool = False, commit: Optional[str] = None, 
               branch: Optional[str] = None) -> ReviewInput:
         """
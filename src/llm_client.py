@@ -1,7 +1,9 @@
 """LLM Client - Integration with litellm for multiple LLM providers"""
 
 import os
-from typing import Optional, Dict, Any
+import threading
+import time
+from typing import Optional, Dict, Any, List, Set, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables from .env file BEFORE importing litellm
@@ -9,27 +11,59 @@ load_dotenv()
 
 import litellm
 from litellm import completion
+from .cassette import Cassette
 from .config import config
+from .deployment_pool import DeploymentPool
+from .hedging import LatencyWindow, hedged_call
+from .metrics import (
+    LLM_HEDGE_TOKENS, LLM_HEDGES, LLM_IN_FLIGHT, LLM_RATE_LIMITED, LLM_REQUEST_SECONDS, LLM_REQUESTS, LLM_TOKENS
+)
+from .response_cache import ResponseCache
+from .change_analyzer import hints_section
+from .findings import structured_section
+from .symbol_index import context_section
+from .rate_limiter import RateLimiter
+from .tracing import tracer
+from .usage import UsageRecord, current_scope, record_usage
 
 
 class LLMClient:
     """Client for LLM communication using litellm"""
     
-    def __init__(self, model: Optional[str] = None):
+    def __init__(self, model: Optional[str] = None, cache: Optional[ResponseCache] = None,
+                 rate_limiter: Optional[RateLimiter] = None, pool: Optional[DeploymentPool] = None,
+                 hedge_percentile: Optional[float] = None, cassette: Optional[Cassette] = None):
         """
         Initialize LLM client with specified model.
         
         Args:
             model: Model name in litellm format (default: from config)
+            cache: Optional response cache shared between clients
+            rate_limiter: Optional rate limiter shared between clients
+            pool: Optional deployment pool; requests are routed to its
+                deployments instead of to `model`
+            hedge_percentile: Send a duplicate request when a call takes longer
+                than this percentile of recent latency; 0 disables hedging
+                (default: from config)
+            cassette: Optional cassette recording every completion, or
+                serving recorded completions instead of calling the provider
         """
         self.model = model or config.get_llm_model()
         self.default_params = {
             "temperature": config.get_temperature(),
             "max_tokens": config.get_max_tokens(),
         }
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.pool = pool
+        self.hedge_percentile = config.get_hedge_percentile() if hedge_percentile is None else hedge_percentile
+        self.latency = LatencyWindow()
+        self.cassette = cassette
+        self._local = threading.local()
         
         # Verify API key is available
-        if not os.getenv("GOOGLE_API_KEY"):
+        replaying = cassette is not None and cassette.replaying
+        if pool is None and not replaying and not os.getenv("GOOGLE_API_KEY"):
             print("Warning: GOOGLE_API_KEY not found in environment variables")
     
     def send_message(self, message: str, system_prompt: Optional[str] = None) -> str:
@@ -46,40 +80,199 @@ class LLMClient:
         Raises:
             Exception: If API call fails
         """
-        try:
-            messages = []
+        with tracer.span("llm.send_message", model=self.model, cache_hit=False) as span:
+            try:
+                messages = []
+                
+                # Add system prompt if provided
+                if system_prompt:
+                    messages.append({"role": "system", "content": system_prompt})
+                
+                # Add user message
+                messages.append({"role": "user", "content": message})
+                
+                started = time.perf_counter()
+                
+                # Serve repeated requests from the cache
+                self._local.cache_hit = False
+                cache_key = None
+                if self.cache is not None:
+                    cache_key = ResponseCache.make_key(self.model, messages, self.default_params)
+                    cached = self.cache.get(cache_key)
+                    if cached is not None:
+                        self._local.cache_hit = True
+                        span["cache_hit"] = True
+                        record_usage(UsageRecord(self.model, 0, 0, time.perf_counter() - started, cache_hit=True))
+                        LLM_REQUESTS.inc(model=self.model, outcome="cached")
+                        return cached
+                
+                if self.rate_limiter is not None:
+                    span["rate_limit_wait"] = self.rate_limiter.acquire()
+                
+                # Make API call, duplicating it when it is slower than recent requests
+                request_started = time.perf_counter()
+                delay = self.latency.percentile(self.hedge_percentile) if self.hedge_percentile else None
+                if delay is None:
+                    response, model, deployment = self._request(messages)
+                else:
+                    response, model, deployment = self._hedged_request(messages, delay, span)
+                self.latency.add(time.perf_counter() - request_started)
+                if deployment:
+                    span["deployment"] = deployment
+                content = response.choices[0].message.content
+                
+                prompt_tokens, completion_tokens = _response_tokens(response)
+                span["prompt_tokens"] = prompt_tokens
+                span["completion_tokens"] = completion_tokens
+                LLM_TOKENS.inc(prompt_tokens, model=model, type="prompt")
+                LLM_TOKENS.inc(completion_tokens, model=model, type="completion")
+                record_usage(UsageRecord(
+                    model=model,
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
+                    latency=time.perf_counter() - started,
+                    cost=request_cost(model, prompt_tokens, completion_tokens)
+                ))
+                
+                if cache_key is not None:
+                    self.cache.put(cache_key, content)
+                
+                return content
+                
+            except Exception as e:
+                raise Exception(f"LLM API error: {str(e)}")
+    
+    def _request(self, messages: list, exclude: Optional[Set[str]] = None,
+                 tried: Optional[Set[str]] = None) -> Tuple[Any, str, Optional[str]]:
+        """
+        Send a request, routed through the deployment pool when one is configured.
+        
+        Args:
+            messages: Chat messages
+            exclude: Deployments to avoid if others are available
+            tried: Optional set receiving the names of deployments used
             
-            # Add system prompt if provided
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
+        Returns:
+            Tuple of (response, model, deployment name or None)
+        """
+        if self.pool is None:
+            return self._complete(messages, self.model), self.model, None
+        
+        def send(deployment):
+            if tried is not None:
+                tried.add(deployment.name)
+            return self._complete(messages, deployment.model, deployment.api_key, deployment.api_base), deployment
+        
+        response, deployment = self.pool.call(send, is_overloaded=_is_rate_limited, exclude=exclude)
+        return response, deployment.model, deployment.name
+    
+    def _hedged_request(self, messages: list, delay: float, span: Dict[str, Any]) -> Tuple[Any, str, Optional[str]]:
+        """
+        Send a request and a duplicate if no response arrived within `delay`.
+        
+        The duplicate goes to another deployment when the pool has one. Tokens
+        spent on the losing request are recorded as hedge usage.
+        
+        Args:
+            messages: Chat messages
+            delay: Seconds to wait before hedging
+            span: Trace span attributes of the request
             
-            # Add user message
-            messages.append({"role": "user", "content": message})
+        Returns:
+            Tuple of (response, model, deployment name or None)
+        """
+        scope = current_scope()
+        primary_deployments: Set[str] = set()
+        
+        def request(is_hedge: bool, cancelled: threading.Event):
+            started = time.perf_counter()
+            if is_hedge and self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            if cancelled.is_set():
+                return None
+            if is_hedge:
+                outcome = self._request(messages, exclude=primary_deployments)
+            else:
+                outcome = self._request(messages, tried=primary_deployments)
+            return outcome, time.perf_counter() - started
+        
+        def on_abandoned(loser) -> None:
+            (response, model, _), latency = loser
+            prompt_tokens, completion_tokens = _response_tokens(response)
+            LLM_HEDGE_TOKENS.inc(prompt_tokens + completion_tokens, model=model)
+            record_usage(UsageRecord(
+                model=model,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                latency=latency,
+                cost=request_cost(model, prompt_tokens, completion_tokens),
+                hedge=True
+            ), scope)
+        
+        (outcome, _), hedged, hedge_won = hedged_call(request, delay, on_abandoned)
+        if hedged:
+            span["hedged"] = True
+            span["hedge_won"] = hedge_won
+            LLM_HEDGES.inc(winner="hedge" if hedge_won else "primary")
+        return outcome
+    
+    def _complete(self, messages: list, model: str, api_key: Optional[str] = None,
+                  api_base: Optional[str] = None):
+        """
+        Make one completion call and record its metrics.
+        
+        Args:
+            messages: Chat messages
+            model: Model name in litellm format
+            api_key: Optional API key overriding the environment
+            api_base: Optional endpoint URL
             
-            # Make API call
-            response = completion(
-                model=self.model,
-                messages=messages,
-                **self.default_params
-            )
+        Returns:
+            litellm response with non-empty content
+        """
+        endpoint = {key: value for key, value in (("api_key", api_key), ("api_base", api_base)) if value}
+        request_started = time.perf_counter()
+        LLM_IN_FLIGHT.inc()
+        try:
+            if self.cassette is not None and self.cassette.replaying:
+                response = self.cassette.play(messages, self.default_params)
+            else:
+                response = completion(
+                    model=model,
+                    messages=messages,
+                    **endpoint,
+                    **self.default_params
+                )
             
             # Debug: Check if response content is None
-            content = response.choices[0].message.content
-            if content is None:
+            if response.choices[0].message.content is None:
                 raise Exception("LLM returned None content - possible API issue")
-            
-            return content
-            
         except Exception as e:
-            raise Exception(f"LLM API error: {str(e)}")
+            LLM_REQUESTS.inc(model=model, outcome="error")
+            if _is_rate_limited(e):
+                LLM_RATE_LIMITED.inc(model=model)
+            raise
+        finally:
+            LLM_IN_FLIGHT.dec()
+            LLM_REQUEST_SECONDS.observe(time.perf_counter() - request_started, model=model)
+        
+        LLM_REQUESTS.inc(model=model, outcome="ok")
+        if self.cassette is not None and not self.cassette.replaying:
+            self.cassette.record(model, messages, self.default_params, response,
+                                 time.perf_counter() - request_started)
+        return response
     
-    def code_review(self, file_content: str, file_path: str) -> str:
+    def code_review(self, file_content: str, file_path: str, context: Optional[str] = None,
+                    hints: Optional[List[str]] = None, structured: bool = False) -> str:
         """
         Perform code review using LLM.
         
         Args:
             file_content: Content of the file to review
             file_path: Path to the file being reviewed
+            context: Optional definitions from other files the code refers to
+            hints: Optional local lint hits for the model to confirm
+            structured: Ask for findings as a JSON object (see findings.STRUCTURED_INSTRUCTIONS)
             
         Returns:
             Code review response from LLM
@@ -100,20 +293,25 @@ IMPORTANT:
 - Be concise and actionable
 - Skip positive feedback entirely
 - Check spelling and grammar in comments and variable names
-- Do not require documentation or docstrings"""
+- Do not require documentation or docstrings""" + structured_section(structured)
 
+        output_format = "Reply with the JSON object only." if structured else 'Include line numbers using "Line X:" format.'
         user_message = f"""Review this code and report ONLY the issues that need to be fixed:
 
 File: {file_path}
 
 ```
 {file_content}
-```
+```{context_section(context)}{hints_section(hints)}
 
-List only problems that require code changes. Include line numbers using "Line X:" format. Focus on bugs, security, performance, and language quality - not documentation."""
+List only problems that require code changes. {output_format} Focus on bugs, security, performance, and language quality - not documentation."""
 
         return self.send_message(user_message, system_prompt)
     
+    def last_call_cached(self) -> bool:
+        """Check whether the last request on this thread was served from cache"""
+        return getattr(self._local, "cache_hit", False)
+    
     def set_model(self, model: str) -> None:
         """Change the LLM model"""
         self.model = model
@@ -123,5 +321,36 @@ List only problems that require code changes. Include line numbers using "Line X
         return self.model
 
 
+def _response_tokens(response) -> tuple:
+    """Extract (prompt_tokens, completion_tokens) from a litellm response"""
+    usage = getattr(response, "usage", None)
+    prompt_tokens = getattr(usage, "prompt_tokens", 0)
+    completion_tokens = getattr(usage, "completion_tokens", 0)
+    return (
+        prompt_tokens if isinstance(prompt_tokens, int) else 0,
+        completion_tokens if isinstance(completion_tokens, int) else 0,
+    )
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """Check whether a provider error is an HTTP 429 rejection"""
+    if isinstance(error, litellm.RateLimitError):
+        return True
+    return getattr(error, "status_code", None) == 429
+
+
+def request_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """Estimate request cost in USD from litellm's price map (0.0 if unknown)"""
+    try:
+        prompt_cost, completion_cost = litellm.cost_per_token(
+            model=model,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens
+        )
+        return prompt_cost + completion_cost
+    except Exception:
+        return 0.0
+
+
 # Default client instance
 default_client = LLMClient()
@@ -1,19 +1,44 @@
 #!/usr/bin/env python3
 """CLI Coding Agent - Main Entry Point"""
 
+import json
+import os
+import time
 from pathlib import Path
+from typing import List
 import typer
 from rich.console import Console
 from rich.panel import Panel
-from .tool_ops import is_text_file
-from .input_parser import InputParser
+from .tool_ops import append_jsonl, git_blob_sha, is_text_file
+from .input_parser import InputParser, ReviewType
 from .source_collector import SourceCollector
-from .review_orchestrator import ReviewOrchestrator
-from .results_formatter import ResultsFormatter
-from .llm_client import LLMClient
+from .review_orchestrator import ReviewOrchestrator, ReviewEventType
+from .review_scheduler import parse_budget
+from .results_formatter import ResultsFormatter, has_issues
+from .progress_display import ProgressDashboard, ReviewProgress, WatchDashboard
+from .review_client import DaemonClient
+from .review_journal import ReviewJournal, ref_pair, run_identity
+from .aspect_review import aspects_label, configured_aspects, parse_aspects
+from .cassette import Cassette
+from .change_analyzer import ChangeAnalyzer
+from .file_watcher import Debouncer, WatchReviewer, create_watcher, watch, watched_files
+from .findings import structured_label
+from .findings_store import FindingsStore
+from .review_plan import build_plan
+from .result_spool import ResultSpool
+from .sharding import merge_results, parse_shard, select_shard
+from .symbol_index import SymbolIndex, repository_root
+from .config import config
+from .tracing import tracer
+from .metrics import metrics, start_metrics_server
+from .pre_commit import DEFAULT_BUDGET_SECONDS, install_hook, uninstall_hook
+from .profiler import RunProfiler, memory_checkpoint
+from .usage import UsageTracker
 
 
 app = typer.Typer(help="CLI Coding Agent - LLM-powered code assistance")
+hook_app = typer.Typer(help="Install or remove the fast pre-commit review hook")
+app.add_typer(hook_app, name="hook")
 console = Console()
 
 
@@ -30,9 +55,81 @@ def cr(
     target: str = typer.Argument(..., help="File path, or working directory for git operations"),
     diff: bool = typer.Option(False, "--diff", help="Review staged git changes"),
     commit: str = typer.Option(None, "--commit", help="Review specific commit"),
-    branch: str = typer.Option(None, "--branch", help="Review branch changes")
+    branch: str = typer.Option(None, "--branch", help="Review branch changes"),
+    daemon: bool = typer.Option(True, "--daemon/--no-daemon", help="Forward reviews to a running `serve` daemon when available"),
+    resume: bool = typer.Option(False, "--resume", help="Skip files already reviewed by an interrupted run of the same review"),
+    budget: str = typer.Option(None, "--budget", help="Stop starting reviews after a time or token budget, highest-value files first (e.g. 300s, 15m, 50k tokens)"),
+    trace: str = typer.Option(None, "--trace", help="Write stage timing spans to a Chrome trace JSON file"),
+    profile: str = typer.Option(None, "--profile", help="Profile CPU and memory, writing <prefix>.pstats and <prefix>.alloc.txt"),
+    usage_json: str = typer.Option(None, "--usage-json", help="Write per-request, per-file and per-run token usage to a JSON file"),
+    metrics_file: str = typer.Option(None, "--metrics-file", help="Write Prometheus-format metrics to a file when the run ends"),
+    store: bool = typer.Option(True, "--store/--no-store", help="Save results to the findings store and reuse stored results for unchanged files"),
+    shard: str = typer.Option(None, "--shard", help="Review only shard i of N (e.g. 2/4), split deterministically by estimated tokens"),
+    output: str = typer.Option(None, "--output", "-o", help="Write results as JSONL (combine shard outputs with `merge`)"),
+    record: str = typer.Option(None, "--record", help="Record every LLM request and response to a cassette directory"),
+    replay: str = typer.Option(None, "--replay", help="Serve LLM responses from a recorded cassette directory instead of the provider"),
+    replay_realtime: bool = typer.Option(False, "--replay-realtime", help="Reproduce the recorded latency of each replayed response"),
+    aspects: str = typer.Option(None, "--aspects", help="Review each file with concurrent prompts focused on these aspects, e.g. bugs,security or all (default: CODER_REVIEW_ASPECTS)"),
+    watch_mode: bool = typer.Option(False, "--watch", help="Watch the file or directory and re-review files as they are saved"),
+    debounce: float = typer.Option(1.0, "--debounce", help="With --watch, seconds a file must stay unchanged before it is reviewed"),
+    poll: bool = typer.Option(False, "--poll", help="With --watch, poll modification times instead of using inotify"),
+    context: bool = typer.Option(True, "--context/--no-context", help="Add definitions from other files that the reviewed code uses to each prompt"),
+    pre_analysis: bool = typer.Option(True, "--pre-analysis/--no-pre-analysis", help="Skip formatting-only, comment-only and other trivial changes without asking the LLM"),
+    plan: bool = typer.Option(False, "--plan", help="Only collect and filter files, then print the requests, tokens, cost and time the review would take"),
+    plan_json: str = typer.Option(None, "--plan-json", help="Write the --plan estimate to a JSON file (implies --plan)")
 ):
     """Code review for files or git changes"""
+    if record and replay:
+        ResultsFormatter(console).display_error("Use either --record or --replay, not both")
+        raise typer.Exit(1)
+    if trace:
+        tracer.enable()
+    
+    cassette = None
+    if record or replay:
+        # Cassette traffic must go through this process and reach the LLM client
+        daemon, store = False, False
+        try:
+            cassette = Cassette(record or replay, "record" if record else "replay", realtime=replay_realtime)
+        except ValueError as e:
+            ResultsFormatter(console).display_error(str(e))
+            raise typer.Exit(1)
+    
+    if watch_mode:
+        if diff or commit or branch:
+            ResultsFormatter(console).display_error("--watch reviews files as they are saved; it cannot be combined with git options")
+            raise typer.Exit(1)
+        _run_watch(target, debounce, poll, aspects, cassette)
+        return
+    
+    profiler = RunProfiler(profile) if profile else None
+    try:
+        if profiler:
+            with profiler:
+                _run_review(target, diff, commit, branch, daemon, resume, budget, usage_json, store, shard, output,
+                            cassette, aspects, context, pre_analysis, plan or bool(plan_json), plan_json)
+        else:
+            _run_review(target, diff, commit, branch, daemon, resume, budget, usage_json, store, shard, output,
+                        cassette, aspects, context, pre_analysis, plan or bool(plan_json), plan_json)
+    finally:
+        if trace:
+            tracer.export_chrome_trace(trace)
+            console.print(f"\n🧭 Trace written to {trace}", style="dim")
+        if profiler and profiler.report:
+            console.print()
+            ResultsFormatter(console).display_profile_summary(profiler.report)
+        if metrics_file:
+            metrics.dump(metrics_file)
+            console.print(f"📈 Metrics written to {metrics_file}", style="dim")
+        if cassette and cassette.recorded:
+            console.print(f"📼 Recorded {cassette.recorded} LLM interactions to {cassette.directory}", style="dim")
+
+
+def _run_review(target: str, diff: bool, commit: str, branch: str,
+                daemon: bool, resume: bool, budget: str, usage_json: str, store: bool,
+                shard: str = None, output: str = None, cassette=None, aspects: str = None,
+                context: bool = True, pre_analysis: bool = True, plan: bool = False, plan_json: str = None):
+    """Run the cr pipeline: parse, collect, review and render"""
     
     # Initialize components
     input_parser = InputParser()
@@ -42,6 +139,9 @@ def cr(
     try:
         # Parse and validate input
         review_input = input_parser.parse(target, diff=diff, commit=commit, branch=branch)
+        review_budget = parse_budget(budget) if budget else None
+        shard_spec = parse_shard(shard) if shard else None
+        review_aspects = parse_aspects(aspects) if aspects else configured_aspects()
         
         # For single files, check if it's a text file
         if review_input.review_type.value == "single_file":
@@ -60,8 +160,36 @@ def cr(
             formatter.display_error("No files found to review")
             raise typer.Exit(1)
         
+        if output and not plan:
+            Path(output).parent.mkdir(parents=True, exist_ok=True)
+            Path(output).write_text("", encoding="utf-8")
+        
+        if shard_spec:
+            total_files = len(source_files)
+            source_files = select_shard(source_files, *shard_spec)
+            console.print(f"🧩 Shard {shard}: {len(source_files)} of {total_files} files", style="bold")
+            if not source_files:
+                console.print("Nothing to review in this shard", style="dim")
+                return
+        
+        trivial = []
+        if pre_analysis:
+            source_files, trivial = _pre_analyze(source_files, review_input, source_collector)
+        
+        if context and source_files:
+            _attach_symbol_context(source_files, target)
+        
+        if plan:
+            _show_plan(source_files, trivial, review_input, source_collector, review_aspects, resume, store, plan_json)
+            return
+        
+        if not source_files:
+            console.print("✅ No substantive changes to review", style="bold green")
+            return
+        
         # Display collection info
-        if len(source_files) == 1 and not source_files[0].is_diff:
+        single_file = len(source_files) == 1 and not source_files[0].is_diff
+        if single_file:
             # Single file - show file info
             formatter.display_file_info(source_files[0])
         else:
@@ -70,27 +198,69 @@ def cr(
         
         # Initialize LLM client and orchestrator
         formatter.display_progress("🤖 Analyzing code with AI...")
+        # Every file's content and context is in memory until its review finishes
+        memory_checkpoint()
         
+        result_store = None
         try:
-            llm_client = LLMClient()
-            orchestrator = ReviewOrchestrator(llm_client)
+            progress = ReviewProgress(total=len(source_files))
+            journal = _open_journal(review_input, source_collector, resume, review_aspects)
+            usage_tracker = UsageTracker()
+            result_store = _open_store(review_input, source_collector, review_aspects) if store else None
             
-            # Perform reviews
-            results = orchestrator.review(source_files)
+            # Perform reviews, rendering each file's issues as soon as it completes.
+            # Finished results go to a disk spool and reviewed content is
+            # released, so reviewing adds little memory on top of collection
+            # (which still holds every file's content until its review).
+            order = {source_file.path: index for index, source_file in enumerate(source_files)}
+            any_issues = False
+            single_result = None
+            with ResultSpool() as spool:
+                with ProgressDashboard(console, progress) as dashboard:
+                    review_stream = _start_review(
+                        source_files, dashboard.handle_event, daemon, journal, review_budget, usage_tracker,
+                        result_store, cassette, review_aspects
+                    )
+                    for result in review_stream:
+                        if output:
+                            append_jsonl(output, result.to_dict())
+                        if single_file:
+                            single_result = result
+                            continue
+                        if has_issues(result):
+                            any_issues = True
+                            formatter.display_result_details(result)
+                        spool.append(result, order.get(result.file_path, len(order)))
+                        index = order.get(result.file_path)
+                        if index is not None:
+                            source_files[index].release()
+                
+                # Display results
+                memory_checkpoint()
+                if single_file:
+                    # Single file result
+                    formatter.display_review_result(single_result, source_files[0])
+                else:
+                    # Multiple files or git results, summarized in collection order
+                    formatter.display_results_table(spool)
+                    if not any_issues:
+                        formatter.display_all_clean()
             
-            # Display results
-            if len(results) == 1 and not results[0].is_diff:
-                # Single file result
-                formatter.display_review_result(results[0], source_files[0])
-            else:
-                # Multiple files or git results
-                formatter.display_git_results(results, source_files)
+            for reason, skipped_files in progress.skipped_by_reason().items():
+                formatter.display_skipped_files(skipped_files, reason)
+            formatter.display_usage_summary(usage_tracker)
+            if usage_json:
+                usage_tracker.dump_json(usage_json)
+                console.print(f"Usage written to {usage_json}", style="dim")
+            if result_store:
+                console.print(f"🗄️  Saved as run {result_store.run_id} (show it again with `show {result_store.run_id}`)",
+                              style="dim")
             
         except Exception as llm_error:
             console.print(f"\n[red]⚠️  LLM Error: {llm_error}[/red]")
             
             # Show fallback info
-            if len(source_files) == 1 and not source_files[0].is_diff:
+            if single_file:
                 # Single file fallback
                 lines = source_files[0].content.splitlines()
                 preview_lines = lines[:10]
@@ -112,6 +282,9 @@ def cr(
                     if source_file.is_diff and source_file.diff_info:
                         info += f" (+{source_file.diff_info.get('added_lines', 0)} -{source_file.diff_info.get('removed_lines', 0)})"
                     console.print(info)
+        finally:
+            if result_store:
+                result_store.close()
         
     except ValueError as e:
         formatter.display_error(str(e))
@@ -121,5 +294,553 @@ def cr(
         raise typer.Exit(1)
 
 
+@app.command()
+def show(
+    run_id: str = typer.Argument("latest", help="Run id (or unique prefix) printed by cr, or 'latest'"),
+    repo: str = typer.Option(".", "--repo", help="Repository whose findings store to read")
+):
+    """Display a stored review run without querying the LLM"""
+    formatter = ResultsFormatter(console)
+    findings_store = FindingsStore.for_repo(_store_repo(repo))
+    try:
+        if run_id == "latest":
+            run_id = findings_store.latest_run_id()
+            if run_id is None:
+                raise ValueError("No stored review runs")
+        run, results = findings_store.get_run(run_id)
+    except ValueError as e:
+        formatter.display_error(str(e))
+        raise typer.Exit(1)
+    finally:
+        findings_store.close()
+    
+    formatter.display_run_header(run)
+    formatter.display_git_results(results, [])
+
+
+@app.command()
+def history(
+    path: str = typer.Argument(..., help="File path as it appears in reviews"),
+    repo: str = typer.Option(".", "--repo", help="Repository whose findings store to read"),
+    limit: int = typer.Option(20, "--limit", help="Maximum number of reviews to list")
+):
+    """List stored findings for a file across review runs"""
+    findings_store = FindingsStore.for_repo(_store_repo(repo))
+    try:
+        entries = findings_store.history(path, limit)
+    finally:
+        findings_store.close()
+    ResultsFormatter(console).display_history(path, entries)
+
+
+@app.command()
+def merge(
+    inputs: List[str] = typer.Argument(..., help="JSONL result files written by `cr --output`"),
+    output: str = typer.Option(None, "--output", "-o", help="Write the merged results as JSONL")
+):
+    """Combine shard outputs into one review report"""
+    formatter = ResultsFormatter(console)
+    try:
+        results = merge_results(inputs)
+    except ValueError as e:
+        formatter.display_error(str(e))
+        raise typer.Exit(1)
+    
+    if output:
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+        Path(output).write_text("", encoding="utf-8")
+        for result in results:
+            append_jsonl(output, result.to_dict())
+    
+    console.print(f"🧩 Merged {len(results)} results from {len(inputs)} files", style="bold")
+    formatter.display_git_results(results, [])
+    if output:
+        console.print(f"Results written to {output}")
+
+
+@app.command()
+def enqueue(
+    target: str = typer.Argument(..., help="File path, or working directory for git operations"),
+    diff: bool = typer.Option(False, "--diff", help="Enqueue staged git changes"),
+    commit: str = typer.Option(None, "--commit", help="Enqueue a specific commit"),
+    branch: str = typer.Option(None, "--branch", help="Enqueue branch changes"),
+    model: str = typer.Option(None, "--model", help="Model the workers should use (default: worker's CODER_LLM_MODEL)"),
+    queue_path: str = typer.Option(None, "--queue", help="Queue database (default: <CODER_STATE_DIR>/queue.db)"),
+    wait: bool = typer.Option(False, "--wait", help="Wait for workers to finish and display the results")
+):
+    """Add file reviews to a work queue consumed by `worker` processes"""
+    from .work_queue import WorkQueue
+    
+    formatter = ResultsFormatter(console)
+    try:
+        review_input = InputParser().parse(target, diff=diff, commit=commit, branch=branch)
+        source_files = SourceCollector().collect(review_input)
+    except ValueError as e:
+        formatter.display_error(str(e))
+        raise typer.Exit(1)
+    _attach_symbol_context(source_files, target)
+    
+    work_queue = WorkQueue(queue_path) if queue_path else WorkQueue.default()
+    batch_id = work_queue.enqueue(source_files, model)
+    console.print(f"📥 Enqueued {len(source_files)} files as batch {batch_id}", style="bold green")
+    if not wait:
+        work_queue.close()
+        return
+    
+    try:
+        with console.status("Waiting for workers...") as status:
+            while True:
+                counts = work_queue.counts(batch_id)
+                finished = counts.get("done", 0) + counts.get("failed", 0)
+                status.update(f"Waiting for workers... {finished}/{len(source_files)} done, "
+                              f"{counts.get('leased', 0)} in flight")
+                if finished == len(source_files):
+                    break
+                time.sleep(1.0)
+        results = work_queue.results(batch_id)
+    finally:
+        work_queue.close()
+    
+    formatter.display_git_results(results, source_files)
+    if any(not result.success for result in results):
+        raise typer.Exit(1)
+
+
+@app.command()
+def worker(
+    queue_path: str = typer.Option(None, "--queue", help="Queue database (default: <CODER_STATE_DIR>/queue.db)"),
+    drain: bool = typer.Option(False, "--drain", help="Exit when the queue is empty instead of waiting for more work"),
+    lease: float = typer.Option(300.0, "--lease", help="Seconds a claimed task stays leased without renewal")
+):
+    """Claim and review queued files until stopped"""
+    from .work_queue import QueueWorker, WorkQueue
+    
+    work_queue = (WorkQueue(queue_path, lease_seconds=lease) if queue_path
+                  else WorkQueue.default(lease_seconds=lease))
+    
+    def on_task_done(task, result):
+        style = "green" if result.success else "red"
+        label = "done" if result.success else "failed"
+        console.print(f"[{style}]{label:>6}[/{style}] {task.source_file.path} (batch {task.batch_id})")
+    
+    queue_worker = QueueWorker(work_queue, on_task_done=on_task_done)
+    console.print(f"👷 Worker {queue_worker.worker_id} polling {work_queue.path}", style="bold green")
+    try:
+        processed = queue_worker.run(drain=drain)
+        console.print(f"Processed {processed} tasks")
+    except KeyboardInterrupt:
+        console.print("\nStopping worker; unfinished leases will be reclaimed", style="bold yellow")
+    finally:
+        work_queue.close()
+
+
+@app.command()
+def serve(
+    host: str = typer.Option(None, "--host", help="Interface to bind (default: CODER_DAEMON_HOST)"),
+    port: int = typer.Option(None, "--port", help="Port to listen on (default: CODER_DAEMON_PORT)")
+):
+    """Run a review daemon that keeps LLM clients, caches and rate limits warm"""
+    from .review_server import create_server
+    
+    default_host, default_port = config.get_daemon_address()
+    server = create_server(host or default_host, port or default_port)
+    bound_host, bound_port = server.server_address[:2]
+    console.print(f"🚀 Review daemon listening on http://{bound_host}:{bound_port}", style="bold green")
+    console.print(f"📈 Metrics at http://{bound_host}:{bound_port}/metrics", style="dim")
+    
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        console.print("\nShutting down review daemon", style="bold yellow")
+    finally:
+        server.server_close()
+
+
+@hook_app.command("install")
+def hook_install(
+    repo: str = typer.Option(".", "--repo", help="Repository to install the hook in"),
+    budget: float = typer.Option(DEFAULT_BUDGET_SECONDS, "--budget", help="Seconds after which the commit proceeds without waiting for reviews"),
+    block: bool = typer.Option(False, "--block", help="Reject commits with findings instead of only printing them"),
+    force: bool = typer.Option(False, "--force", help="Replace an existing pre-commit hook not installed by coder")
+):
+    """Install a pre-commit hook reviewing staged hunks"""
+    try:
+        path = install_hook(repo, budget_seconds=budget, block=block, force=force)
+    except ValueError as e:
+        ResultsFormatter(console).display_error(str(e))
+        raise typer.Exit(1)
+    console.print(f"🪝 Installed pre-commit hook at {path} ({budget:g}s budget, {'blocking' if block else 'warn only'})",
+                  style="bold green")
+
+
+@hook_app.command("uninstall")
+def hook_uninstall(
+    repo: str = typer.Option(".", "--repo", help="Repository to remove the hook from")
+):
+    """Remove the pre-commit hook installed by coder"""
+    try:
+        removed = uninstall_hook(repo)
+    except ValueError as e:
+        ResultsFormatter(console).display_error(str(e))
+        raise typer.Exit(1)
+    console.print("🪝 Pre-commit hook removed" if removed else "No coder pre-commit hook installed", style="bold")
+
+
+@app.command()
+def batch(
+    jobs_file: str = typer.Argument(..., help="JSONL file with one review job per line"),
+    output: str = typer.Option(None, "--output", "-o", help="JSONL results file (default: <jobs_file>.results.jsonl)"),
+    workers: int = typer.Option(None, "--workers", help="Jobs run in parallel (default: CODER_MAX_CONCURRENCY)"),
+    metrics_port: int = typer.Option(None, "--metrics-port", help="Serve Prometheus metrics at http://127.0.0.1:<port>/metrics while running")
+):
+    """Run many reviews from a job file, resuming from existing results"""
+    from .batch_runner import BatchRunner, load_jobs
+    
+    formatter = ResultsFormatter(console)
+    output = output or f"{jobs_file}.results.jsonl"
+    
+    try:
+        jobs = load_jobs(jobs_file)
+    except (OSError, ValueError) as e:
+        formatter.display_error(f"Invalid job file: {e}")
+        raise typer.Exit(1)
+    
+    def on_job_done(job, status):
+        style = "green" if status == "done" else "red"
+        console.print(f"[{style}]{status:>6}[/{style}] {job.job_id}")
+    
+    metrics_server = start_metrics_server(metrics_port) if metrics_port else None
+    if metrics_server:
+        console.print(f"📈 Metrics at http://127.0.0.1:{metrics_server.server_address[1]}/metrics", style="dim")
+    
+    formatter.display_progress(f"📦 Running {len(jobs)} review jobs...")
+    runner = BatchRunner(output, max_workers=workers, on_job_done=on_job_done)
+    try:
+        summary = runner.run(jobs)
+    finally:
+        if metrics_server:
+            metrics_server.shutdown()
+            metrics_server.server_close()
+    
+    console.print(
+        f"\n✅ {summary.completed} completed, ❌ {summary.failed} failed, "
+        f"⏭️  {summary.skipped} already done, 📁 {summary.files_reviewed} files reviewed"
+    )
+    console.print(f"Results written to {output}")
+    if summary.failed:
+        raise typer.Exit(1)
+
+
+def _prompt_label(aspects=None) -> str:
+    """Suffix keeping journals and stored results apart per prompt variant (aspects, structured output)"""
+    return aspects_label(aspects) + structured_label(config.get_structured_findings())
+
+
+def _open_journal(review_input, source_collector, resume: bool, aspects=None):
+    """
+    Open the checkpoint journal for a git review.
+    
+    Args:
+        review_input: Parsed review input
+        source_collector: Collector whose git operations identify the repository
+        resume: Keep checkpoints from an earlier run instead of starting fresh
+        aspects: Optional review aspects, kept apart from combined-prompt runs
+        
+    Returns:
+        ReviewJournal, or None for single-file reviews
+    """
+    if review_input.review_type == ReviewType.SINGLE_FILE:
+        return None
+    
+    git_ops = source_collector.git_ops
+    refs = ref_pair(review_input, git_ops)
+    run_id = run_identity(git_ops.working_dir, refs, config.get_llm_model() + _prompt_label(aspects))
+    journal = ReviewJournal.for_run(run_id, git_ops.working_dir)
+    if not resume:
+        journal.reset()
+    return journal
+
+
+def _open_store(review_input, source_collector, aspects=None):
+    """
+    Start a findings store run for a review.
+    
+    Args:
+        review_input: Parsed review input
+        source_collector: Collector whose git operations identify the repository
+        aspects: Optional review aspects, stored apart from combined-prompt results
+        
+    Returns:
+        RunRecorder for the new run
+    """
+    git_ops = source_collector.git_ops
+    base_ref = commit_sha = None
+    if review_input.review_type != ReviewType.SINGLE_FILE:
+        base_ref, commit_sha = ref_pair(review_input, git_ops)
+    repo = _store_repo(_review_path(review_input, source_collector))
+    return FindingsStore.for_repo(repo).start_run(
+        repo,
+        review_input.review_type.value,
+        config.get_llm_model() + _prompt_label(aspects),
+        target=review_input.target,
+        base_ref=base_ref,
+        commit_sha=commit_sha
+    )
+
+
+def _store_repo(path: str) -> str:
+    """
+    Repository whose findings store holds results for a reviewed path.
+    
+    Stores live at the git work tree's top level, like the symbol index, so
+    reviewing a file of another repository doesn't write to the current
+    directory; outside git, next to the reviewed path.
+    
+    Args:
+        path: Reviewed file or directory
+        
+    Returns:
+        Absolute repository directory
+    """
+    path = os.path.abspath(path)
+    return repository_root(path) or (path if os.path.isdir(path) else os.path.dirname(path))
+
+
+def _review_path(review_input, source_collector) -> str:
+    """Reviewed file for single-file input, otherwise the reviewed working directory"""
+    if review_input.review_type == ReviewType.SINGLE_FILE:
+        return review_input.target
+    return source_collector.git_ops.working_dir
+
+
+def _pre_analyze(source_files, review_input, source_collector):
+    """
+    Drop no-op and trivial changes, attaching lint hints to the rest.
+    
+    Args:
+        source_files: Collected files or diffs
+        review_input: Parsed review input, selecting the compared revisions
+        source_collector: Collector whose repository is reviewed
+        
+    Returns:
+        Tuple of (files that need an LLM review, analyses of the others)
+    """
+    with tracer.span("pre_analysis", files=len(source_files)):
+        analyzer = ChangeAnalyzer.for_input(review_input, source_collector.git_ops)
+        to_review, skipped = analyzer.split(source_files)
+    for analysis in skipped:
+        console.print(f"⏭️  {analysis.path}: {analysis.change_class.value} ({analysis.reason})", style="dim")
+    return to_review, skipped
+
+
+def _show_plan(source_files, trivial, review_input, source_collector, aspects, resume: bool, store: bool,
+               plan_json: str = None):
+    """
+    Estimate a review without calling the LLM.
+    
+    Args:
+        source_files: Files left after collection and filtering
+        trivial: Analyses of files dropped by pre-analysis
+        review_input: Parsed review input
+        source_collector: Collector whose git operations identify the repository
+        aspects: Optional review aspects
+        resume: Count files checkpointed by an interrupted run as done
+        store: Count files with stored results as done
+        plan_json: Optional path receiving the plan as JSON
+    """
+    from .llm_client import request_cost
+    
+    model = config.get_llm_model()
+    repo = _store_repo(_review_path(review_input, source_collector))
+    completed = {}
+    if resume:
+        journal = _open_journal(review_input, source_collector, True, aspects)
+        completed = journal.completed() if journal else {}
+    stored = None
+    findings = None
+    if store and os.path.exists(os.path.join(repo, config.get_state_dir(), "findings.db")):
+        # Read-only lookups: planning must not register a run
+        findings = FindingsStore.for_repo(repo)
+        model_key = model + _prompt_label(aspects)
+        
+        def stored(source_file) -> bool:
+            blob_sha = git_blob_sha(source_file.content or "")
+            return findings.lookup(repo, source_file.path, blob_sha, model_key) is not None
+    
+    try:
+        review_plan = build_plan(
+            source_files, model,
+            concurrency=config.get_max_concurrency(),
+            requests_per_minute=config.get_requests_per_minute(),
+            aspects=aspects,
+            duplicate_threshold=config.get_duplicate_threshold(),
+            stored=stored,
+            completed=completed,
+            skipped=[(analysis.path, f"{analysis.change_class.value}: {analysis.reason}") for analysis in trivial],
+            price=lambda prompt_tokens, completion_tokens: request_cost(model, prompt_tokens, completion_tokens)
+        )
+    finally:
+        if findings is not None:
+            findings.close()
+    ResultsFormatter(console).display_plan(review_plan)
+    if plan_json:
+        Path(plan_json).parent.mkdir(parents=True, exist_ok=True)
+        Path(plan_json).write_text(json.dumps(review_plan.to_dict(), indent=2), encoding="utf-8")
+        console.print(f"Plan written to {plan_json}", style="dim")
+
+
+def _attach_symbol_context(source_files, target: str) -> None:
+    """
+    Add definitions from other files that each file refers to.
+    
+    Context travels with the source files, so daemons and queue workers
+    receive it without indexing the repository themselves.
+    
+    Args:
+        source_files: Files or diffs about to be reviewed
+        target: Reviewed path, locating the repository to index
+    """
+    token_budget = config.get_symbol_context_tokens()
+    if token_budget <= 0:
+        return
+    with tracer.span("symbol_index"):
+        # Only git work trees are indexed: anything else could be a home directory
+        index = SymbolIndex.for_repo(target)
+        if index is None:
+            return
+        try:
+            indexed = index.update()
+            for source_file in source_files:
+                source_file.context = index.context_for(source_file, token_budget) or None
+        finally:
+            index.close()
+    if indexed:
+        console.print(f"🔗 Indexed definitions in {indexed} changed files", style="dim")
+
+
+def _start_review(source_files, on_event, use_daemon: bool, journal=None, budget=None,
+                  usage_tracker=None, result_store=None, cassette=None, aspects=None):
+    """
+    Start reviewing files, preferring a running daemon over in-process review.
+    
+    Args:
+        source_files: Files to review
+        on_event: Callback receiving review progress events
+        use_daemon: Whether to try forwarding to the daemon first
+        journal: Optional journal checkpointing completed results
+        budget: Optional run budget; enables priority scheduling
+        usage_tracker: Optional tracker receiving per-request token usage
+        result_store: Optional findings store run recording and reusing results
+        cassette: Optional cassette recording or replaying LLM traffic
+        aspects: Optional review aspects reviewed by concurrent focused prompts
+        
+    Returns:
+        Iterator of review results in completion order
+    """
+    def local_review(files):
+        orchestrator = _local_orchestrator(
+            on_event=on_event,
+            max_workers=config.get_max_concurrency(),
+            journal=journal,
+            budget=budget,
+            prioritized=budget is not None,
+            usage_tracker=usage_tracker,
+            result_store=result_store,
+            cassette=cassette,
+            aspects=aspects
+        )
+        return orchestrator.iter_review(files)
+    
+    if use_daemon:
+        client = DaemonClient()
+        if client.is_available():
+            return _daemon_review(client, source_files, local_review, on_event=on_event, journal=journal,
+                                  budget=budget, usage_tracker=usage_tracker,
+                                  result_store=result_store, aspects=aspects)
+    
+    return local_review(source_files)
+
+
+def _daemon_review(client, source_files, local_review, **kwargs):
+    """
+    Review files through the daemon, finishing in-process if the daemon goes away.
+    
+    Args:
+        client: Available daemon client
+        source_files: Files to review
+        local_review: Function reviewing a list of files in-process
+        **kwargs: Further DaemonClient.iter_review arguments
+        
+    Yields:
+        Review results in completion order
+    """
+    reviewed = set()
+    try:
+        for result in client.iter_review(source_files, **kwargs):
+            reviewed.add(result.file_path)
+            yield result
+    except ConnectionError as e:
+        console.print(f"[yellow]⚠️  {e}; reviewing the remaining files in-process[/yellow]")
+        yield from local_review([f for f in source_files if f.path not in reviewed])
+
+
+def _local_orchestrator(cassette=None, **kwargs) -> ReviewOrchestrator:
+    """
+    Create an in-process orchestrator with the configured clients and circuit breaker.
+    
+    Args:
+        cassette: Optional cassette recording or replaying LLM traffic
+        **kwargs: Further ReviewOrchestrator arguments
+        
+    Returns:
+        ReviewOrchestrator
+    """
+    # Imported here so daemon-backed runs never import litellm
+    from .llm_client import LLMClient
+    from .deployment_pool import load_pool
+    from .circuit_breaker import CircuitBreaker
+    
+    fallback_model = config.get_fallback_model()
+    return ReviewOrchestrator(
+        LLMClient(pool=load_pool(), cassette=cassette),
+        circuit_breaker=CircuitBreaker.from_config(),
+        fallback_client=LLMClient(fallback_model, cassette=cassette) if fallback_model else None,
+        duplicate_threshold=config.get_duplicate_threshold(),
+        structured=config.get_structured_findings(),
+        **kwargs
+    )
+
+
+def _run_watch(target: str, debounce: float, polling: bool, aspects: str = None, cassette=None):
+    """Watch a file or directory and re-review files whenever their content changes"""
+    formatter = ResultsFormatter(console)
+    try:
+        if not Path(target).exists():
+            raise ValueError(f"Path '{target}' not found")
+        orchestrator = _local_orchestrator(
+            cassette=cassette,
+            aspects=parse_aspects(aspects) if aspects else configured_aspects()
+        )
+    except ValueError as e:
+        formatter.display_error(str(e))
+        raise typer.Exit(1)
+    
+    def review(source_file):
+        results = orchestrator.review([source_file])
+        return results[0] if results else None
+    
+    watcher = create_watcher(target, polling=polling)
+    with WatchDashboard(console, target) as dashboard:
+        reviewer = WatchReviewer(review, on_update=dashboard.update, max_workers=config.get_max_concurrency())
+        reviewer.prime(watched_files(target))
+        try:
+            watch(watcher, Debouncer(debounce), reviewer)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            watcher.close()
+            reviewer.close()
+
+
 if __name__ == "__main__":
     app()
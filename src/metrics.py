@@ -0,0 +1,261 @@
+"""Metrics - In-process metrics registry with Prometheus text exposition"""
+
+import bisect
+import functools
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+def _label_key(labels: Dict[str, str]) -> LabelKey:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace('"', '\\"') for _, value in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonically increasing value per label set"""
+    
+    kind = "counter"
+    
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help_text = help_text
+        self._values: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+    
+    def inc(self, amount: float = 1, **labels) -> None:
+        """Increase the counter"""
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+    
+    def value(self, **labels) -> float:
+        """Current value for a label set"""
+        with self._lock:
+            return self._values.get(_label_key(labels), 0)
+    
+    def total(self) -> float:
+        """Sum over all label sets"""
+        with self._lock:
+            return sum(self._values.values())
+    
+    def samples(self) -> List[str]:
+        with self._lock:
+            return [f"{self.name}{_format_labels(key)} {_format_value(value)}"
+                    for key, value in sorted(self._values.items())]
+
+
+class Gauge(Counter):
+    """Value that can go up and down, or be computed when scraped"""
+    
+    kind = "gauge"
+    
+    def __init__(self, name: str, help_text: str, function: Optional[Callable[[], float]] = None):
+        super().__init__(name, help_text)
+        self.function = function
+    
+    def set(self, value: float, **labels) -> None:
+        """Set the gauge"""
+        with self._lock:
+            self._values[_label_key(labels)] = value
+    
+    def dec(self, amount: float = 1, **labels) -> None:
+        """Decrease the gauge"""
+        self.inc(-amount, **labels)
+    
+    def samples(self) -> List[str]:
+        if self.function is not None:
+            return [f"{self.name} {_format_value(float(self.function()))}"]
+        return super().samples()
+
+
+class Histogram:
+    """Distribution of observed values in cumulative buckets"""
+    
+    kind = "histogram"
+    
+    def __init__(self, name: str, help_text: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(sorted(float(bound) for bound in buckets))
+        self._series: Dict[LabelKey, List[float]] = {}
+        self._lock = threading.Lock()
+    
+    def observe(self, value: float, **labels) -> None:
+        """Record an observation"""
+        key = _label_key(labels)
+        with self._lock:
+            # Per-bucket counts followed by the +Inf count, sum and count
+            series = self._series.setdefault(key, [0] * (len(self.buckets) + 1) + [0.0, 0])
+            series[bisect.bisect_left(self.buckets, value)] += 1
+            series[-2] += value
+            series[-1] += 1
+    
+    def count(self, **labels) -> int:
+        """Number of observations for a label set"""
+        with self._lock:
+            series = self._series.get(_label_key(labels))
+            return series[-1] if series else 0
+    
+    def samples(self) -> List[str]:
+        lines = []
+        with self._lock:
+            for key, series in sorted(self._series.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets + (float("inf"),), series):
+                    cumulative += bucket_count
+                    lines.append(f"{self.name}_bucket{_format_labels(key, ('le', _format_value(bound)))} {cumulative}")
+                lines.append(f"{self.name}_sum{_format_labels(key)} {_format_value(series[-2])}")
+                lines.append(f"{self.name}_count{_format_labels(key)} {series[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named collection of metrics"""
+    
+    def __init__(self):
+        """Initialize an empty registry"""
+        self.started_at = time.monotonic()
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+    
+    def counter(self, name: str, help_text: str) -> Counter:
+        """Get or create a counter"""
+        return self._register(name, lambda: Counter(name, help_text))
+    
+    def gauge(self, name: str, help_text: str, function: Optional[Callable[[], float]] = None) -> Gauge:
+        """Get or create a gauge, optionally computed from a function at scrape time"""
+        return self._register(name, lambda: Gauge(name, help_text, function))
+    
+    def histogram(self, name: str, help_text: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        """Get or create a histogram"""
+        return self._register(name, lambda: Histogram(name, help_text, buckets))
+    
+    def uptime(self) -> float:
+        """Seconds since the registry was created"""
+        return time.monotonic() - self.started_at
+    
+    def render_prometheus(self) -> str:
+        """Render all metrics in Prometheus text exposition format"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help_text}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+    
+    def dump(self, file_path: str) -> None:
+        """Write the current metrics to a file in Prometheus text format"""
+        path = Path(file_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.render_prometheus(), encoding="utf-8")
+    
+    def _register(self, name: str, factory):
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = factory()
+            return self._metrics[name]
+
+
+def timed(histogram: Histogram, **labels):
+    """
+    Decorator observing the duration of every call in a histogram.
+    
+    Args:
+        histogram: Histogram receiving durations in seconds
+        **labels: Labels for the observations
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - started, **labels)
+        return wrapper
+    return decorator
+
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+    """Serve the global registry at /metrics"""
+    
+    def do_GET(self):
+        if self.path != "/metrics":
+            self.send_error(404)
+            return
+        send_metrics(self)
+    
+    def log_message(self, format, *args):
+        """Silence per-request logging"""
+
+
+def send_metrics(handler: BaseHTTPRequestHandler) -> None:
+    """Write the global registry as an HTTP response"""
+    body = metrics.render_prometheus().encode("utf-8")
+    handler.send_response(200)
+    handler.send_header("Content-Type", "text/plain; version=0.0.4")
+    handler.send_header("Content-Length", str(len(body)))
+    handler.end_headers()
+    handler.wfile.write(body)
+
+
+def start_metrics_server(port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """
+    Serve metrics on a background thread.
+    
+    Args:
+        port: Port to listen on
+        host: Interface to bind
+    
+    Returns:
+        Running server (call shutdown() to stop it)
+    """
+    server = ThreadingHTTPServer((host, port), MetricsRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# Global metrics registry
+metrics = MetricsRegistry()
+
+LLM_REQUEST_SECONDS = metrics.histogram("coder_llm_request_seconds", "LLM request latency in seconds")
+LLM_REQUESTS = metrics.counter("coder_llm_requests_total", "LLM requests by outcome")
+LLM_RATE_LIMITED = metrics.counter("coder_llm_rate_limited_total", "LLM requests rejected with HTTP 429")
+LLM_IN_FLIGHT = metrics.gauge("coder_llm_in_flight", "LLM requests currently waiting for a response")
+LLM_TOKENS = metrics.counter("coder_llm_tokens_total", "LLM tokens by type")
+metrics.gauge(
+    "coder_llm_tokens_per_second", "Average LLM token throughput since start",
+    lambda: LLM_TOKENS.total() / metrics.uptime() if metrics.uptime() > 0 else 0.0
+)
+metrics.gauge(
+    "coder_cache_hit_ratio", "Fraction of LLM requests served from cache",
+    lambda: LLM_REQUESTS.value(outcome="cached") / LLM_REQUESTS.total() if LLM_REQUESTS.total() else 0.0
+)
+LLM_HEDGES = metrics.counter("coder_llm_hedged_total", "Hedged LLM requests by which copy answered first")
+LLM_HEDGE_TOKENS = metrics.counter("coder_llm_hedge_tokens_total", "Tokens spent on losing hedged requests")
+REVIEW_QUEUE_DEPTH = metrics.gauge("coder_review_queue_depth", "Files queued and not yet started")
+REVIEW_FILES = metrics.counter("coder_review_files_total", "Reviewed files by final status")
+GIT_COMMAND_SECONDS = metrics.histogram("coder_git_command_seconds", "Git subprocess duration in seconds")
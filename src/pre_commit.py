@@ -0,0 +1,247 @@
+"""Pre-commit Hook - Fast, terse review of staged changes that never blocks a commit by failing
+
+Run by the installed hook as `python -m src.pre_commit`. Kept free of rich and
+typer imports so the hook starts quickly; litellm is only imported when no
+review daemon is running.
+"""
+
+import argparse
+import os
+import shlex
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, TextIO, Tuple
+from .change_analyzer import ChangeAnalyzer
+from .config import config
+from .findings import structured_label
+from .input_parser import ReviewInput, ReviewType
+from .review_orchestrator import ReviewResult
+from .review_scheduler import ReviewBudget
+from .source_collector import SourceCollector
+
+
+# Identifies hooks written by install_hook
+HOOK_MARKER = "# coder pre-commit hook"
+
+DEFAULT_BUDGET_SECONDS = 20.0
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+
+
+def hook_path(repo: str = ".") -> Path:
+    """
+    Locate the pre-commit hook of a repository, honoring core.hooksPath.
+    
+    Raises:
+        ValueError: If repo is not a git repository
+    """
+    try:
+        hooks_dir = subprocess.run(
+            ["git", "rev-parse", "--git-path", "hooks"],
+            cwd=repo, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        raise ValueError(f"'{repo}' is not a git repository")
+    return Path(repo, hooks_dir) / "pre-commit"
+
+
+def hook_script(budget_seconds: float = DEFAULT_BUDGET_SECONDS, block: bool = False) -> str:
+    """Shell script running the hook with this interpreter and package"""
+    args = ["--budget", f"{budget_seconds:g}"] + (["--block"] if block else [])
+    return "\n".join([
+        "#!/bin/sh",
+        HOOK_MARKER,
+        f"PYTHONPATH={shlex.quote(str(PACKAGE_ROOT))}${{PYTHONPATH:+:$PYTHONPATH}} "
+        f"exec {shlex.quote(sys.executable)} -m src.pre_commit {' '.join(args)}",
+        ""
+    ])
+
+
+def install_hook(repo: str = ".", budget_seconds: float = DEFAULT_BUDGET_SECONDS,
+                 block: bool = False, force: bool = False) -> Path:
+    """
+    Install the pre-commit hook.
+    
+    Args:
+        repo: Repository directory
+        budget_seconds: Hard time limit of each hook run
+        block: Reject commits with findings (otherwise they are only printed)
+        force: Replace a pre-commit hook not written by this tool
+    
+    Returns:
+        Path of the installed hook
+    
+    Raises:
+        ValueError: If repo is not a git repository or a foreign hook exists
+    """
+    path = hook_path(repo)
+    if path.exists() and HOOK_MARKER not in path.read_text(errors="replace") and not force:
+        raise ValueError(f"{path} already exists and was not installed by coder - use --force to replace it")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(hook_script(budget_seconds, block), encoding="utf-8")
+    path.chmod(0o755)
+    return path
+
+
+def uninstall_hook(repo: str = ".") -> bool:
+    """
+    Remove the pre-commit hook if this tool installed it.
+    
+    Returns:
+        True if a hook was removed
+    """
+    path = hook_path(repo)
+    if not path.exists() or HOOK_MARKER not in path.read_text(errors="replace"):
+        return False
+    path.unlink()
+    return True
+
+
+def format_findings(results: List[ReviewResult]) -> List[str]:
+    """
+    Render results as one line per finding.
+    
+    Args:
+        results: Review results
+    
+    Returns:
+        Lines like "src/app.py:12: Possible None dereference", with the
+        severity after the line number for structured findings
+    """
+    lines = []
+    for result in sorted(results, key=lambda r: r.file_path):
+        if not result.success:
+            continue
+        for finding in result.findings:
+            if finding.line is None:
+                continue
+            severity = f"{finding.severity}: " if finding.severity else ""
+            lines.append(f"{result.file_path}:{finding.line}: {severity}{finding.message.splitlines()[0]}")
+    return lines
+
+
+def run_hook(working_dir: str = ".", budget_seconds: float = DEFAULT_BUDGET_SECONDS,
+             block: bool = False, out: TextIO = sys.stdout) -> Tuple[int, bool]:
+    """
+    Review staged changes within a hard time limit.
+    
+    Every failure (no staged changes, missing key, provider outage, budget
+    exceeded) lets the commit through.
+    
+    Args:
+        working_dir: Repository directory
+        budget_seconds: Seconds after which the hook gives up waiting
+        block: Return 1 when findings were reported
+        out: Stream receiving the report
+    
+    Returns:
+        Tuple of (exit code, whether every review finished)
+    """
+    started = time.monotonic()
+    review_input = ReviewInput(ReviewType.GIT_DIFF, working_dir, {"diff": True})
+    collector = SourceCollector(working_dir)
+    try:
+        source_files = collector.collect(review_input)
+    except ValueError:
+        # Nothing staged, or not a repository
+        return 0, True
+    source_files, trivial = ChangeAnalyzer.for_input(review_input, collector.git_ops).split(source_files)
+    if not source_files:
+        print(f"coder: only trivial changes in {len(trivial)} files - nothing to review", file=out)
+        return 0, True
+    
+    results: List[ReviewResult] = []
+    errors: List[Exception] = []
+    budget = ReviewBudget(max_seconds=budget_seconds)
+    
+    def review() -> None:
+        try:
+            for result in _review_stream(source_files, working_dir, budget):
+                results.append(result)
+        except Exception as e:
+            errors.append(e)
+    
+    worker = threading.Thread(target=review, daemon=True)
+    worker.start()
+    worker.join(budget_seconds)
+    finished = not worker.is_alive()
+    reviewed = list(results)
+    
+    findings = format_findings(reviewed)
+    for line in findings:
+        print(line, file=out)
+    elapsed = time.monotonic() - started
+    failed = [result for result in reviewed if not result.success]
+    if errors:
+        print(f"coder: review skipped ({errors[0]}) - commit allowed", file=out)
+        return 0, finished
+    summary = f"coder: {len(findings)} findings in {len(reviewed)}/{len(source_files)} files ({elapsed:.1f}s)"
+    if not finished or len(reviewed) < len(source_files):
+        summary += f", budget of {budget_seconds:g}s reached"
+    if failed:
+        reason = failed[0].review_content.splitlines()[0] if failed[0].review_content else "unknown error"
+        summary += f", {len(failed)} failed ({reason[:80]})"
+    print(summary, file=out)
+    if block and findings:
+        print("coder: commit blocked - fix the findings or commit with --no-verify", file=out)
+        return 1, finished
+    return 0, finished
+
+
+def _review_stream(source_files, working_dir: str, budget: ReviewBudget):
+    """Review through the daemon's warm cache when it runs, otherwise in-process"""
+    from .review_client import DaemonClient
+    
+    client = DaemonClient()
+    if client.is_available():
+        return client.iter_review(source_files, budget=budget)
+    
+    # Imported here so daemon-backed hooks never import litellm
+    from .circuit_breaker import CircuitBreaker
+    from .deployment_pool import load_pool
+    from .findings_store import FindingsStore
+    from .llm_client import LLMClient
+    from .review_orchestrator import ReviewOrchestrator
+    
+    # The findings store serves unchanged staged files (e.g. a retried commit) without a request
+    store = FindingsStore.for_repo(working_dir).start_run(
+        working_dir, "pre_commit", config.get_llm_model() + structured_label(config.get_structured_findings()),
+        target=working_dir
+    )
+    orchestrator = ReviewOrchestrator(
+        LLMClient(pool=load_pool()),
+        max_workers=config.get_max_concurrency(),
+        budget=budget,
+        result_store=store,
+        circuit_breaker=CircuitBreaker.from_config(),
+        duplicate_threshold=config.get_duplicate_threshold(),
+        structured=config.get_structured_findings()
+    )
+    return orchestrator.iter_review(source_files)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Hook entry point"""
+    parser = argparse.ArgumentParser(prog="coder-pre-commit", description="Review staged changes")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_SECONDS,
+                        help="Seconds after which the commit proceeds without waiting")
+    parser.add_argument("--block", action="store_true", help="Reject commits with findings")
+    args = parser.parse_args(argv)
+    
+    try:
+        code, finished = run_hook(budget_seconds=args.budget, block=args.block)
+    except Exception as e:
+        print(f"coder: review skipped ({e}) - commit allowed")
+        return 0
+    if not finished:
+        # Don't let interpreter shutdown wait for abandoned LLM requests
+        sys.stdout.flush()
+        os._exit(code)
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+"""Profiler - CPU and memory attribution for a whole review run"""
+
+import cProfile
+import pstats
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+SRC_DIR = Path(__file__).resolve().parent
+
+# Frames kept per allocation so allocations inside libraries can be
+# attributed to the src module that triggered them
+TRACEMALLOC_FRAMES = 25
+
+# Live memory must grow by this factor over the kept snapshot before the
+# background sampler takes a new one (snapshots of a large heap are slow)
+SAMPLE_GROWTH = 1.25
+
+# Profiler of the current run, used by memory_checkpoint
+_active: Optional["RunProfiler"] = None
+
+
+@dataclass
+class ProfileReport:
+    """Summary of a profiled run"""
+    pstats_path: str
+    allocations_path: str
+    wall_seconds: float
+    peak_memory: int
+    snapshot_memory: int = 0  # Live memory when the reported allocations were snapshotted
+    module_cpu: Dict[str, float] = field(default_factory=dict)
+    module_memory: Dict[str, int] = field(default_factory=dict)
+    top_allocations: List[Tuple[str, int, int]] = field(default_factory=list)
+
+
+@lru_cache(maxsize=None)
+def _is_src_file(file_path: str) -> bool:
+    """Check whether a frame belongs to this package"""
+    try:
+        return Path(file_path).resolve().parent == SRC_DIR
+    except OSError:
+        return False
+
+
+@lru_cache(maxsize=None)
+def module_for_path(file_path: str) -> str:
+    """
+    Map a source file path to a report bucket.
+    
+    Args:
+        file_path: Path from a profile or allocation frame
+    
+    Returns:
+        src module name, third-party package name, or "stdlib"
+    """
+    if file_path.startswith("<") or file_path == "~":
+        return "builtins"
+    path = Path(file_path)
+    if _is_src_file(file_path):
+        return path.stem
+    parts = path.parts
+    for marker in ("site-packages", "dist-packages"):
+        if marker in parts:
+            index = parts.index(marker)
+            if index + 1 < len(parts):
+                return parts[index + 1].split(".")[0]
+    return "stdlib"
+
+
+def memory_checkpoint() -> None:
+    """Offer the profiler of the current run a memory snapshot (no-op unless profiling)"""
+    profiler = _active
+    if profiler is not None:
+        profiler.checkpoint()
+
+
+class RunProfiler:
+    """Context manager running code under cProfile and tracemalloc"""
+    
+    def __init__(self, output_prefix: str, top_n: int = 20, sample_interval: float = 0.5):
+        """
+        Initialize run profiler.
+        
+        Note that cProfile only sees the calling thread; time spent by review
+        worker threads shows up as waiting in the main thread.
+        
+        Allocations are reported from the snapshot taken when the most memory
+        was live: the run is sampled in the background and at explicit
+        memory_checkpoint calls, and the end of the run is one more candidate.
+        
+        Args:
+            output_prefix: Prefix for <prefix>.pstats and <prefix>.alloc.txt
+            top_n: Number of allocation sites to report
+            sample_interval: Seconds between background memory samples (0 disables)
+        """
+        self.output_prefix = output_prefix
+        self.top_n = top_n
+        self.sample_interval = sample_interval
+        self.report: Optional[ProfileReport] = None
+        self._profile = cProfile.Profile()
+        self._started = 0.0
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self._snapshot_memory = 0
+        self._snapshot_overhead = 0
+        self._snapshot_lock = threading.Lock()
+        self._stop_sampling = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+    
+    def __enter__(self) -> "RunProfiler":
+        global _active
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+        _active = self
+        if self.sample_interval > 0:
+            self._sampler = threading.Thread(target=self._sample, name="profiler-sampler", daemon=True)
+            self._sampler.start()
+        self._started = time.perf_counter()
+        self._profile.enable()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        global _active
+        self._profile.disable()
+        wall_seconds = time.perf_counter() - self._started
+        self._stop_sampling.set()
+        if self._sampler is not None:
+            self._sampler.join()
+        _active = None
+        self.checkpoint()
+        snapshot, snapshot_memory = self._snapshot, self._snapshot_memory
+        self._snapshot = None
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        
+        Path(self.output_prefix).parent.mkdir(parents=True, exist_ok=True)
+        pstats_path = f"{self.output_prefix}.pstats"
+        self._profile.dump_stats(pstats_path)
+        
+        self.report = ProfileReport(
+            pstats_path=pstats_path,
+            allocations_path=f"{self.output_prefix}.alloc.txt",
+            wall_seconds=wall_seconds,
+            peak_memory=peak,
+            snapshot_memory=snapshot_memory,
+            module_cpu=self._cpu_by_module(),
+        )
+        self._attribute_allocations(snapshot)
+        self._write_allocation_report()
+    
+    def checkpoint(self, min_growth: float = 1.0) -> None:
+        """
+        Snapshot allocations if more memory is live than at the kept snapshot.
+        
+        Args:
+            min_growth: Factor by which live memory must exceed the kept snapshot's
+        """
+        with self._snapshot_lock:
+            # The kept snapshot is itself traced; don't count it as run memory
+            current = tracemalloc.get_traced_memory()[0] - self._snapshot_overhead
+            if self._snapshot is not None and current <= self._snapshot_memory * min_growth:
+                return
+            self._snapshot = None
+            before = tracemalloc.get_traced_memory()[0]
+            snapshot = tracemalloc.take_snapshot()
+            self._snapshot_overhead = max(0, tracemalloc.get_traced_memory()[0] - before)
+            self._snapshot, self._snapshot_memory = snapshot, current
+    
+    def _sample(self) -> None:
+        """Background loop snapshotting allocations as live memory grows"""
+        while not self._stop_sampling.wait(self.sample_interval):
+            self.checkpoint(SAMPLE_GROWTH)
+    
+    def _cpu_by_module(self) -> Dict[str, float]:
+        """Sum self time per module bucket"""
+        totals: Dict[str, float] = defaultdict(float)
+        stats = pstats.Stats(self._profile).stats
+        for (file_path, _, _), (_, _, self_time, _, _) in stats.items():
+            totals[module_for_path(file_path)] += self_time
+        return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+    
+    def _attribute_allocations(self, snapshot: tracemalloc.Snapshot) -> None:
+        """Attribute allocations live at the snapshot to the innermost src module on their stack"""
+        snapshot = snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+        memory: Dict[str, int] = defaultdict(int)
+        for stat in snapshot.statistics("traceback"):
+            frames = list(stat.traceback)
+            module = module_for_path(frames[-1].filename) if frames else "builtins"
+            for frame in reversed(frames):
+                if _is_src_file(frame.filename):
+                    module = Path(frame.filename).stem
+                    break
+            memory[module] += stat.size
+        
+        self.report.module_memory = dict(sorted(memory.items(), key=lambda item: item[1], reverse=True))
+        self.report.top_allocations = [
+            (f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}", stat.size, stat.count)
+            for stat in snapshot.statistics("lineno")[:self.top_n]
+        ]
+    
+    def _write_allocation_report(self) -> None:
+        """Write the allocation breakdown as plain text"""
+        report = self.report
+        lines = [f"Peak traced memory: {report.peak_memory / 1024:.1f} KiB",
+                 f"Live memory at the largest snapshot: {report.snapshot_memory / 1024:.1f} KiB",
+                 "", "By module (live at that snapshot):"]
+        lines += [f"  {module:<24} {size / 1024:>10.1f} KiB" for module, size in report.module_memory.items()]
+        lines += ["", f"Top {self.top_n} allocation sites:"]
+        lines += [f"  {size / 1024:>10.1f} KiB {count:>8} blocks  {location}"
+                  for location, size, count in report.top_allocations]
+        with open(report.allocations_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
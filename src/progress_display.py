@@ -0,0 +1,253 @@
+"""Progress Display - Live dashboard driven by orchestrator events"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+from rich.console import Console, Group
+from rich.live import Live
+from rich.table import Table
+from rich.text import Text
+from .file_watcher import WatchEntry, WatchStatus
+from .review_orchestrator import ReviewEvent, ReviewEventType
+
+
+STATUS_LABELS = {
+    ReviewEventType.QUEUED: "⏳ Queued",
+    ReviewEventType.IN_FLIGHT: "🤖 Reviewing",
+    ReviewEventType.DONE: "✅ Done",
+    ReviewEventType.FAILED: "❌ Failed",
+    ReviewEventType.CACHED: "💾 Cached",
+    ReviewEventType.SKIPPED: "⏭️  Skipped",
+}
+
+WATCH_LABELS = {
+    WatchStatus.REVIEWING: "🤖 Reviewing",
+    WatchStatus.DONE: "✅ Reviewed",
+    WatchStatus.FAILED: "❌ Failed",
+    WatchStatus.SKIPPED: "⏭️  Skipped",
+    WatchStatus.CANCELLED: "🚫 Superseded",
+    WatchStatus.DELETED: "🗑️  Deleted",
+}
+
+FINISHED_STATES = {ReviewEventType.DONE, ReviewEventType.FAILED, ReviewEventType.CACHED, ReviewEventType.SKIPPED}
+
+
+class ReviewProgress:
+    """Aggregate review events into run statistics"""
+    
+    def __init__(self, total: int = 0, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize progress statistics.
+        
+        Args:
+            total: Number of files expected in the run
+            clock: Monotonic clock used for throughput and ETA
+        """
+        self.total = total
+        self.clock = clock
+        self.started_at = clock()
+        self.file_status: Dict[str, ReviewEventType] = {}
+        self.skip_reasons: Dict[str, str] = {}
+        self.started: Dict[str, float] = {}
+        self.tokens = 0
+        self.review_seconds = 0.0
+        self._lock = threading.Lock()
+    
+    def handle_event(self, event: ReviewEvent) -> None:
+        """Record a single orchestrator event"""
+        with self._lock:
+            if event.event_type == ReviewEventType.QUEUED and event.file_path not in self.file_status:
+                self.total = max(self.total, len(self.file_status) + 1)
+            if event.event_type == ReviewEventType.IN_FLIGHT:
+                self.started[event.file_path] = self.clock()
+            if event.event_type in FINISHED_STATES:
+                self.started.pop(event.file_path, None)
+                self.tokens += event.tokens
+                self.review_seconds += event.elapsed
+            if event.event_type == ReviewEventType.SKIPPED:
+                self.skip_reasons[event.file_path] = event.reason or "skipped"
+            self.file_status[event.file_path] = event.event_type
+    
+    def count(self, event_type: ReviewEventType) -> int:
+        """Count files currently in the given state"""
+        return sum(1 for status in self.file_status.values() if status == event_type)
+    
+    @property
+    def completed(self) -> int:
+        """Number of files with a final result"""
+        return sum(1 for status in self.file_status.values() if status in FINISHED_STATES)
+    
+    def files_with_status(self, event_type: ReviewEventType) -> List[str]:
+        """List files currently in the given state"""
+        return [path for path, status in self.file_status.items() if status == event_type]
+    
+    def skipped_by_reason(self) -> Dict[str, List[str]]:
+        """Group skipped files by the reason they were not reviewed"""
+        groups: Dict[str, List[str]] = {}
+        for path in self.files_with_status(ReviewEventType.SKIPPED):
+            groups.setdefault(self.skip_reasons.get(path, "skipped"), []).append(path)
+        return groups
+    
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently waiting on the LLM"""
+        return self.count(ReviewEventType.IN_FLIGHT)
+    
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the run started"""
+        return self.clock() - self.started_at
+    
+    @property
+    def tokens_per_second(self) -> float:
+        """Token throughput over the whole run"""
+        elapsed = self.elapsed
+        return self.tokens / elapsed if elapsed > 0 else 0.0
+    
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of completed files served from cache"""
+        completed = self.completed
+        return self.count(ReviewEventType.CACHED) / completed if completed else 0.0
+    
+    def eta_seconds(self) -> Optional[float]:
+        """Estimated seconds until all files finish, or None before the first result"""
+        completed = self.completed
+        if not completed:
+            return None
+        remaining = self.total - completed
+        return remaining * (self.elapsed / completed)
+    
+    def oldest_in_flight(self) -> float:
+        """Seconds the longest-running in-flight request has been waiting"""
+        with self._lock:
+            starts = list(self.started.values())
+        return self.clock() - min(starts) if starts else 0.0
+
+
+class ProgressDashboard:
+    """Render ReviewProgress in a rich live view"""
+    
+    def __init__(self, console: Console, progress: ReviewProgress, max_rows: int = 10):
+        """
+        Initialize progress dashboard.
+        
+        Args:
+            console: Rich console for output
+            progress: Statistics to render
+            max_rows: Maximum number of per-file rows to show
+        """
+        self.console = console
+        self.progress = progress
+        self.max_rows = max_rows
+        self.live = Live(self.render(), console=console, refresh_per_second=4, transient=True)
+    
+    def __enter__(self) -> "ProgressDashboard":
+        self.live.start()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.live.stop()
+    
+    def handle_event(self, event: ReviewEvent) -> None:
+        """Update statistics and refresh the live view"""
+        self.progress.handle_event(event)
+        self.live.update(self.render())
+    
+    def render(self) -> Group:
+        """Build the dashboard renderable"""
+        progress = self.progress
+        eta = progress.eta_seconds()
+        
+        stats = Table.grid(padding=(0, 2))
+        stats.add_row(
+            f"📁 {progress.completed}/{progress.total} files",
+            f"🤖 {progress.in_flight} in flight",
+            f"⚡ {progress.tokens_per_second:.0f} tokens/s",
+            f"💾 {progress.cache_hit_rate:.0%} cached",
+            f"⏱️  ETA {_format_seconds(eta) if eta is not None else '--'}",
+        )
+        if progress.in_flight:
+            stats.add_row(f"⌛ Oldest request waiting {_format_seconds(progress.oldest_in_flight())}")
+        
+        files = Table(show_header=False, box=None, padding=(0, 1))
+        files.add_column("Status")
+        files.add_column("File", style="cyan")
+        active = [
+            (path, status) for path, status in progress.file_status.items()
+            if status in (ReviewEventType.IN_FLIGHT, ReviewEventType.FAILED)
+        ]
+        for path, status in active[:self.max_rows]:
+            files.add_row(STATUS_LABELS[status], path)
+        
+        return Group(stats, files)
+
+
+class WatchDashboard:
+    """Live view of watched files, updated in place as reviews finish"""
+    
+    def __init__(self, console: Console, root: str, max_rows: int = 15, max_findings: int = 10):
+        """
+        Initialize watch dashboard.
+        
+        Args:
+            console: Rich console for output
+            root: Watched path shown in the header
+            max_rows: Maximum number of files to show, most recent first
+            max_findings: Maximum findings shown for the latest review
+        """
+        self.console = console
+        self.root = root
+        self.max_rows = max_rows
+        self.max_findings = max_findings
+        self.entries: Dict[str, WatchEntry] = {}
+        self.latest: Optional[WatchEntry] = None
+        self._lock = threading.Lock()
+        self.live = Live(self.render(), console=console, refresh_per_second=4)
+    
+    def __enter__(self) -> "WatchDashboard":
+        self.live.start()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.live.stop()
+    
+    def update(self, entry: WatchEntry) -> None:
+        """Show the new state of a file"""
+        with self._lock:
+            self.entries[entry.path] = entry
+            if entry.status in (WatchStatus.DONE, WatchStatus.FAILED):
+                self.latest = entry
+            self.live.update(self.render())
+    
+    def render(self) -> Group:
+        """Build the dashboard renderable"""
+        header = f"👀 Watching {self.root} - save a file to review it (Ctrl+C to stop)"
+        files = Table(box=None, padding=(0, 1))
+        files.add_column("Status")
+        files.add_column("File", style="cyan")
+        files.add_column("Findings", justify="right")
+        files.add_column("Updated", style="dim")
+        recent = sorted(self.entries.values(), key=lambda e: e.updated_at, reverse=True)
+        for entry in recent[:self.max_rows]:
+            findings = ""
+            if entry.status == WatchStatus.DONE and entry.result:
+                findings = str(len(entry.result.findings))
+            files.add_row(WATCH_LABELS[entry.status], entry.path, findings,
+                          time.strftime("%H:%M:%S", time.localtime(entry.updated_at)))
+        
+        parts = [header, files]
+        if self.latest and self.latest.result:
+            lines = [line for line in self.latest.result.review_content.splitlines() if line.strip()]
+            parts.append(f"\n[bold]{self.latest.path}[/bold] (review #{self.latest.reviews})")
+            # Plain Text so brackets in findings (e.g. aspect tags) are not read as markup
+            parts.extend(Text(line) for line in lines[:self.max_findings] or ["No issues found"])
+            if len(lines) > self.max_findings:
+                parts.append(f"[dim]... {len(lines) - self.max_findings} more[/dim]")
+        return Group(*parts)
+
+
+def _format_seconds(seconds: float) -> str:
+    """Format seconds as m:ss"""
+    minutes, secs = divmod(int(seconds), 60)
+    return f"{minutes}:{secs:02d}"
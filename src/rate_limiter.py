@@ -0,0 +1,55 @@
+"""Rate Limiter - Token bucket shared by concurrent LLM requests"""
+
+import threading
+import time
+from typing import Callable
+
+
+class RateLimiter:
+    """Thread-safe token bucket limiting requests per minute"""
+    
+    def __init__(self, requests_per_minute: int, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Initialize rate limiter.
+        
+        Args:
+            requests_per_minute: Allowed request rate (0 disables limiting)
+            clock: Monotonic clock
+            sleep: Sleep function used while waiting for capacity
+        """
+        self.requests_per_minute = requests_per_minute
+        self.capacity = max(1, requests_per_minute)
+        self.tokens = float(self.capacity)
+        self.clock = clock
+        self.sleep = sleep
+        self.updated_at = clock()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> float:
+        """
+        Block until a request slot is available.
+        
+        Returns:
+            Seconds spent waiting
+        """
+        if self.requests_per_minute <= 0:
+            return 0.0
+        
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) * 60.0 / self.requests_per_minute
+            self.sleep(delay)
+            waited += delay
+    
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last refill"""
+        now = self.clock()
+        rate = self.requests_per_minute / 60.0
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * rate)
+        self.updated_at = now
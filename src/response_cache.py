@@ -0,0 +1,62 @@
+"""Response Cache - In-memory LRU cache of LLM responses"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+
+class ResponseCache:
+    """Thread-safe LRU cache keyed by a hash of the full LLM request"""
+    
+    def __init__(self, max_entries: int = 512):
+        """
+        Initialize response cache.
+        
+        Args:
+            max_entries: Maximum number of responses kept in memory
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(model: str, messages: List[Dict[str, str]], params: Dict[str, Any]) -> str:
+        """
+        Build a stable cache key for an LLM request.
+        
+        Args:
+            model: Model name
+            messages: Chat messages sent to the model
+            params: Sampling parameters
+            
+        Returns:
+            Hex digest identifying the request
+        """
+        payload = json.dumps({"model": model, "messages": messages, "params": params}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return cached response for key, or None on a miss"""
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+    
+    def put(self, key: str, response: str) -> None:
+        """Store a response, evicting the least recently used entry if full"""
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
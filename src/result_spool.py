@@ -0,0 +1,60 @@
+"""Result Spool - Keep finished review results on disk instead of in memory"""
+
+import json
+import os
+import tempfile
+from typing import Iterator, List, Optional, Tuple
+from .review_orchestrator import ReviewResult
+
+
+class ResultSpool:
+    """
+    Append-only temporary JSONL file of review results.
+    
+    Only a (sort key, byte offset) pair per result stays in memory, so a run
+    of any size can be rendered in collection order by reading results back
+    one at a time. The file is deleted when the spool is closed.
+    """
+    
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Create an empty spool.
+        
+        Args:
+            directory: Directory of the spool file (default: system temp dir)
+        """
+        self._file = tempfile.TemporaryFile("w+b", dir=directory, prefix="coder-spool-")
+        self._offsets: List[Tuple[int, int]] = []
+    
+    def __enter__(self) -> "ResultSpool":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def __len__(self) -> int:
+        return len(self._offsets)
+    
+    def append(self, result: ReviewResult, key: int = 0) -> None:
+        """
+        Write a result to the spool.
+        
+        Args:
+            result: Finished review result
+            key: Position the result is read back at; equal keys keep
+                the order results were appended in
+        """
+        self._file.seek(0, os.SEEK_END)
+        self._offsets.append((key, self._file.tell()))
+        self._file.write(json.dumps(result.to_dict()).encode("utf-8") + b"\n")
+    
+    def __iter__(self) -> Iterator[ReviewResult]:
+        """Read results back ordered by key, one at a time"""
+        self._file.flush()
+        for _, offset in sorted(self._offsets, key=lambda item: item[0]):
+            self._file.seek(offset)
+            yield ReviewResult.from_dict(json.loads(self._file.readline()))
+    
+    def close(self) -> None:
+        """Delete the spool file"""
+        self._file.close()
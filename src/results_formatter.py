@@ -1,6 +1,7 @@
 """Results Formatter - Format and display review results"""
 
-from typing import List
+import time
+from typing import Iterable, List
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
@@ -10,6 +11,10 @@ from .source_collector import SourceFile
 from .review_orchestrator import ReviewResult
 from .input_parser import ReviewInput, ReviewType
 from .code_context import display_code_with_feedback
+from .tracing import traced
+from .profiler import ProfileReport
+from .review_plan import PlanStatus, ReviewPlan
+from .usage import UsageTracker
 
 
 class ResultsFormatter:
@@ -24,6 +29,7 @@ class ResultsFormatter:
         """
         self.console = console
     
+    @traced("render.file_info")
     def display_file_info(self, source_file: SourceFile):
         """Display single file information"""
         info_text = Text()
@@ -34,6 +40,7 @@ class ResultsFormatter:
         
         self.console.print(Panel(info_text, title="File Information", border_style="blue"))
     
+    @traced("render.git_summary")
     def display_git_summary(self, source_files: List[SourceFile], review_input: ReviewInput):
         """Display git changes summary"""
         info_text = Text()
@@ -55,26 +62,51 @@ class ResultsFormatter:
         
         self.console.print(Panel(info_text, title="Git Changes Summary", border_style="blue"))
     
+    @traced("render.git_results")
     def display_git_results(self, results: List[ReviewResult], source_files: List[SourceFile]):
         """Display git review results"""
-        # Summary table
+        self.display_results_table(results)
+        
+        # Detailed results for files with issues
+        files_with_issues = [r for r in results if has_issues(r)]
+        
+        if files_with_issues:
+            self.console.print(f"\n[bold red]Found issues in {len(files_with_issues)} files:[/bold red]")
+            
+            for result in files_with_issues:
+                self.display_result_details(result)
+        else:
+            self.display_all_clean()
+    
+    @traced("render.results_table")
+    def display_results_table(self, results: Iterable[ReviewResult], max_rows: int = 500):
+        """
+        Display summary table of review results.
+        
+        Results are consumed one at a time and only counted past max_rows,
+        so the table of a huge run costs no more memory than a small one.
+        
+        Args:
+            results: Review results in display order (any iterable, e.g. a ResultSpool)
+            max_rows: Maximum number of file rows; further files are summarized
+        """
         table = Table(title="📋 Git Review Summary")
         table.add_column("File", style="cyan")
         table.add_column("Status", style="bold")
         table.add_column("Changes", style="yellow")
         
-        issues_found = 0
+        files = with_issues = failed = findings = 0
         for result in results:
-            if result.success and result.review_content.strip():
-                # Count issues (simple heuristic)
-                issue_count = result.review_content.count("Line ") + result.review_content.count("issue") + result.review_content.count("problem")
-                if issue_count > 0:
-                    issues_found += 1
-                    status = f"⚠️  {issue_count} issues"
-                else:
-                    status = "✅ Clean"
+            files += 1
+            findings += len(result.findings)
+            if has_issues(result):
+                with_issues += 1
+                status = f"⚠️  {len(result.findings)} issues" if result.findings else "⚠️  Issues"
             else:
                 status = "❌ Error" if not result.success else "✅ Clean"
+                failed += not result.success
+            if files > max_rows:
+                continue
             
             changes = ""
             if result.diff_info:
@@ -84,35 +116,85 @@ class ResultsFormatter:
             
             table.add_row(result.file_path, status, changes)
         
+        if files > max_rows:
+            table.add_row(f"... {files - max_rows} more files", "", "")
         self.console.print(table)
+        self.console.print(f"{files} files: {with_issues} with issues ({findings} findings), "
+                           f"{files - with_issues - failed} clean, {failed} failed", style="dim")
+    
+    @traced("render.result_details")
+    def display_result_details(self, result: ReviewResult):
+        """Display detailed issues for a single multi-file review result"""
+        self.console.print(f"\n[bold cyan]File: {result.file_path}[/bold cyan]")
         
-        # Detailed results for files with issues
-        files_with_issues = [r for r in results if r.success and r.review_content.strip() and 
-                           ("Line " in r.review_content or "issue" in r.review_content.lower() or "problem" in r.review_content.lower())]
+        if result.diff_info:
+            diff_type = result.diff_info.get('type', 'changes')
+            self.console.print(f"[yellow]Git {diff_type} review[/yellow]")
+        if result.duplicate_of:
+            self.console.print(f"[dim]Copy of {result.duplicate_of} - findings copied from its review[/dim]")
         
-        if files_with_issues:
-            self.console.print(f"\n[bold red]Found issues in {len(files_with_issues)} files:[/bold red]")
-            
-            for result in files_with_issues:
-                self.console.print(f"\n[bold cyan]File: {result.file_path}[/bold cyan]")
-                
-                if result.diff_info:
-                    diff_type = result.diff_info.get('type', 'changes')
-                    self.console.print(f"[yellow]Git {diff_type} review[/yellow]")
-                
-                self.console.print(Panel(
-                    Markdown(result.review_content),
-                    title=f"📋 Issues in {result.file_path}",
-                    border_style="red"
-                ))
-        else:
-            self.console.print("\n")
-            self.console.print(Panel(
-                "✅ No issues found in git changes",
-                title="🎉 All Clean!",
-                border_style="green"
-            ))
+        self.console.print(Panel(
+            Markdown(result.review_content),
+            title=f"📋 Issues in {result.file_path}",
+            border_style="red"
+        ))
+    
+    @traced("render.all_clean")
+    def display_all_clean(self):
+        """Display panel for reviews without issues"""
+        self.console.print("\n")
+        self.console.print(Panel(
+            "✅ No issues found in git changes",
+            title="🎉 All Clean!",
+            border_style="green"
+        ))
+    
+    @traced("render.run_header")
+    def display_run_header(self, run: dict):
+        """Display metadata of a stored review run"""
+        info_text = Text()
+        info_text.append("🗄️  Run: ", style="bold")
+        info_text.append(run["run_id"], style="cyan")
+        info_text.append(f"\n🔎 Review: {run['review_type']} {run['target'] or ''}".rstrip())
+        if run["commit_sha"]:
+            info_text.append(f"\n📝 Commit: {run['commit_sha'][:12]}")
+        info_text.append(f"\n🤖 Model: {run['model']} (prompt v{run['prompt_version']})")
+        info_text.append(f"\n🕒 Started: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(run['started_at']))}")
+        
+        self.console.print(Panel(info_text, title="Stored Review", border_style="blue"))
     
+    @traced("render.history")
+    def display_history(self, path: str, entries: List[dict]):
+        """Display stored reviews of one file, newest first"""
+        if not entries:
+            self.console.print(f"No stored reviews for {path}", style="yellow")
+            return
+        
+        table = Table(title=f"🗂️  Review History: {path}")
+        table.add_column("When", style="dim")
+        table.add_column("Run", style="cyan")
+        table.add_column("Commit")
+        table.add_column("Model")
+        table.add_column("Findings", style="yellow")
+        
+        for entry in entries:
+            if not entry["success"]:
+                findings = "❌ Error"
+            elif entry["findings"]:
+                findings = "\n".join(f"Line {line}: {message}" for line, message in entry["findings"])
+            else:
+                findings = "✅ Clean"
+            table.add_row(
+                time.strftime("%Y-%m-%d %H:%M", time.localtime(entry["created_at"])),
+                entry["run_id"],
+                (entry["commit_sha"] or "")[:12],
+                entry["model"],
+                findings
+            )
+        
+        self.console.print(table)
+    
+    @traced("render.review_result")
     def display_review_result(self, result: ReviewResult, source_file: SourceFile):
         """Display single file review result"""
         if result.success:
@@ -128,19 +210,131 @@ class ResultsFormatter:
                 self.console, 
                 source_file.content, 
                 result.review_content, 
-                source_file.path
+                source_file.path,
+                result.findings
             )
         else:
             self.console.print(f"\n[red]⚠️  {result.review_content}[/red]")
     
+    @traced("render.skipped_files")
+    def display_skipped_files(self, file_paths: List[str], reason: str):
+        """Display files that were not reviewed"""
+        if not file_paths:
+            return
+        self.console.print(f"\n[yellow]⏭️  {len(file_paths)} files not reviewed ({reason}):[/yellow]")
+        for file_path in file_paths:
+            self.console.print(f"  • {file_path}")
+    
+    def display_profile_summary(self, report: ProfileReport, max_rows: int = 8):
+        """Display CPU and memory attribution from a profiled run"""
+        table = Table(title=f"⏱️  Profile ({report.wall_seconds:.2f}s wall, {report.peak_memory / 1024 / 1024:.1f} MiB peak)")
+        table.add_column("Module", style="cyan")
+        table.add_column("CPU (self)", justify="right")
+        table.add_column(f"Memory (at {report.snapshot_memory / 1024 / 1024:.1f} MiB)", justify="right")
+        
+        modules = list(report.module_cpu)
+        modules += [m for m in report.module_memory if m not in report.module_cpu]
+        for module in modules[:max_rows]:
+            cpu = report.module_cpu.get(module, 0.0)
+            memory = report.module_memory.get(module, 0)
+            table.add_row(module, f"{cpu:.3f}s", f"{memory / 1024:.1f} KiB")
+        
+        self.console.print(table)
+        self.console.print(f"CPU profile: {report.pstats_path}  Allocations: {report.allocations_path}", style="dim")
+    
+    @traced("render.plan")
+    def display_plan(self, plan: ReviewPlan, max_rows: int = 25):
+        """Display the expected cost of a review planned with --plan"""
+        table = Table(title=f"🗺️  Review Plan ({plan.model})")
+        table.add_column("File", style="cyan")
+        table.add_column("Plan")
+        table.add_column("Requests", justify="right")
+        table.add_column("Prompt tokens", justify="right")
+        table.add_column("Est. time", justify="right")
+        
+        # Most expensive files first
+        files = sorted(plan.files, key=lambda planned: planned.prompt_tokens, reverse=True)
+        for planned in files[:max_rows]:
+            label = planned.status.value + (f" ({planned.note})" if planned.note else "")
+            if planned.status == PlanStatus.REVIEW:
+                table.add_row(planned.path, label, str(planned.requests), f"{planned.prompt_tokens:,}",
+                              f"{planned.seconds:.1f}s")
+            else:
+                table.add_row(planned.path, f"[dim]{label}[/dim]", "0", "-", "-")
+        if len(files) > max_rows:
+            table.add_row(f"... {len(files) - max_rows} more files", "", "", "", "")
+        self.console.print(table)
+        
+        reused = plan.count(PlanStatus.STORED) + plan.count(PlanStatus.RESUMED)
+        summary = Text()
+        summary.append(f"📁 {plan.count(PlanStatus.REVIEW)} files to review", style="bold")
+        summary.append(f", {reused} with stored results, {plan.count(PlanStatus.DUPLICATE)} duplicates, "
+                       f"{len(plan.skipped)} trivial changes skipped")
+        summary.append(f"\n🤖 {plan.requests} LLM requests, ~{plan.prompt_tokens:,} prompt + "
+                       f"~{plan.completion_tokens:,} completion tokens")
+        cost = f"${plan.cost:.4f}" if plan.cost is not None else "unknown (no prices for this model)"
+        summary.append(f"\n💰 Estimated cost: {cost}")
+        summary.append(f"\n⏱️  Projected time: {plan.seconds:.0f}s at concurrency {plan.concurrency}")
+        self.console.print(Panel(summary, title="Plan Summary - no LLM calls were made", border_style="blue"))
+    
+    @traced("render.usage_summary")
+    def display_usage_summary(self, usage_tracker: UsageTracker, max_rows: int = 10):
+        """Display token, latency and cost usage per file and for the run"""
+        totals = usage_tracker.totals()
+        if not totals.requests:
+            return
+        
+        table = Table(title="💰 LLM Usage")
+        table.add_column("File", style="cyan")
+        table.add_column("Requests", justify="right")
+        table.add_column("Prompt", justify="right")
+        table.add_column("Completion", justify="right")
+        table.add_column("Latency", justify="right")
+        table.add_column("Cached", justify="right")
+        
+        by_file = sorted(usage_tracker.by_file().items(), key=lambda item: item[1].total_tokens, reverse=True)
+        for file_path, file_totals in by_file[:max_rows]:
+            table.add_row(
+                file_path, str(file_totals.requests), str(file_totals.prompt_tokens),
+                str(file_totals.completion_tokens), f"{file_totals.latency:.1f}s", str(file_totals.cache_hits)
+            )
+        if len(by_file) > max_rows:
+            table.add_row(f"... {len(by_file) - max_rows} more files", "", "", "", "", "")
+        table.add_row(
+            "[bold]Total[/bold]", str(totals.requests), str(totals.prompt_tokens),
+            str(totals.completion_tokens), f"{totals.latency:.1f}s", str(totals.cache_hits)
+        )
+        
+        self.console.print(table)
+        self.console.print(f"Estimated cost: ${totals.cost:.4f}", style="dim")
+        if totals.hedge_requests:
+            self.console.print(
+                f"Hedging: {totals.hedge_requests} abandoned duplicate requests used "
+                f"{totals.hedge_tokens} extra tokens", style="dim"
+            )
+    
+    @traced("render.progress")
     def display_progress(self, message: str):
         """Display progress message"""
         self.console.print(f"\n{message}", style="bold yellow")
     
+    @traced("render.error")
     def display_error(self, message: str):
         """Display error message"""
         self.console.print(f"[red]Error: {message}[/red]")
     
+    @traced("render.warning")
     def display_warning(self, message: str):
         """Display warning message"""
         self.console.print(f"[yellow]Warning: {message}[/yellow]")
+
+
+def has_issues(result: ReviewResult) -> bool:
+    """Check whether a successful review result reports any issues"""
+    if not result.success or not result.review_content.strip():
+        return False
+    if result.findings:
+        return True
+    # Free-form reviews that name no line
+    content = result.review_content
+    return "Line " in content or "issue" in content.lower() or "problem" in content.lower()
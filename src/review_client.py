@@ -0,0 +1,136 @@
+"""Review Client - Thin client forwarding reviews to a running daemon"""
+
+import json
+from dataclasses import asdict
+from http.client import HTTPConnection
+from typing import Callable, Iterator, List, Optional
+from .config import config
+from .findings_store import RunRecorder
+from .review_journal import ReviewJournal
+from .review_orchestrator import ReviewEvent, ReviewEventType, ReviewResult
+from .review_scheduler import ReviewBudget
+from .source_collector import SourceFile
+from .usage import UsageRecord, UsageTracker
+
+
+class DaemonClient:
+    """Client for the review daemon started with `serve`"""
+    
+    def __init__(self, host: Optional[str] = None, port: Optional[int] = None,
+                 probe_timeout: float = 0.2):
+        """
+        Initialize daemon client.
+        
+        Args:
+            host: Daemon host (default: from config)
+            port: Daemon port (default: from config)
+            probe_timeout: Seconds to wait when checking daemon availability
+        """
+        default_host, default_port = config.get_daemon_address()
+        self.host = host or default_host
+        self.port = port or default_port
+        self.probe_timeout = probe_timeout
+    
+    def is_available(self) -> bool:
+        """Check whether a daemon is listening and healthy"""
+        connection = HTTPConnection(self.host, self.port, timeout=self.probe_timeout)
+        try:
+            connection.request("GET", "/health")
+            response = connection.getresponse()
+            return response.status == 200 and json.loads(response.read()).get("status") == "ok"
+        except (OSError, ValueError):
+            return False
+        finally:
+            connection.close()
+    
+    def iter_review(self, source_files: List[SourceFile], model: Optional[str] = None,
+                    on_event: Optional[Callable[[ReviewEvent], None]] = None,
+                    journal: Optional[ReviewJournal] = None,
+                    budget: Optional[ReviewBudget] = None,
+                    usage_tracker: Optional[UsageTracker] = None,
+                    result_store: Optional[RunRecorder] = None,
+                    aspects: Optional[List[str]] = None,
+                    structured: Optional[bool] = None) -> Iterator[ReviewResult]:
+        """
+        Forward files to the daemon and yield results as they stream back.
+        
+        Args:
+            source_files: Files to review
+            model: Model to review with (default: this client's CODER_LLM_MODEL,
+                not the daemon's, so local journals and stores key results right)
+            on_event: Optional callback receiving forwarded progress events
+            journal: Optional local journal that checkpoints results and skips
+                files already completed in it
+            budget: Optional run budget enforced by the daemon
+            usage_tracker: Optional tracker receiving usage records from the daemon
+            result_store: Optional local findings store run that records every
+                result and serves stored results for unchanged content
+            aspects: Optional review aspects reviewed by concurrent focused prompts
+            structured: Ask for JSON findings (default: this client's CODER_STRUCTURED_FINDINGS)
+        
+        Yields:
+            Review results in completion order
+        
+        Raises:
+            ConnectionError: If the daemon request fails
+        """
+        completed = journal.completed() if journal else {}
+        by_path = {source_file.path: source_file for source_file in source_files}
+        for source_file in source_files:
+            result = completed.get(source_file.path)
+            if result is None and result_store:
+                result = result_store.lookup(source_file)
+                completed[source_file.path] = result
+            if result is not None:
+                if on_event:
+                    on_event(ReviewEvent(ReviewEventType.CACHED, source_file.path))
+                if result_store:
+                    result_store.record(source_file, result)
+                yield result
+        source_files = [f for f in source_files if completed.get(f.path) is None]
+        if not source_files:
+            return
+        
+        body = json.dumps({
+            "source_files": [source_file.to_dict() for source_file in source_files],
+            "model": model or config.get_llm_model(),
+            "budget": asdict(budget) if budget else None,
+            "aspects": aspects,
+            "structured": config.get_structured_findings() if structured is None else structured,
+        })
+        connection = HTTPConnection(self.host, self.port, timeout=config.get_api_timeout() * 10)
+        try:
+            connection.request("POST", "/review", body=body,
+                               headers={"Content-Type": "application/json"})
+            response = connection.getresponse()
+            if response.status != 200:
+                raise ConnectionError(f"Review daemon returned HTTP {response.status}")
+            
+            for line in response:
+                message = json.loads(line)
+                if "result" in message:
+                    result = ReviewResult.from_dict(message["result"])
+                    if journal:
+                        journal.append(result)
+                    if result_store and result.file_path in by_path:
+                        result_store.record(by_path[result.file_path], result)
+                    yield result
+                elif "event" in message and on_event:
+                    event = message["event"]
+                    on_event(ReviewEvent(
+                        event_type=ReviewEventType(event["event_type"]),
+                        file_path=event["file_path"],
+                        tokens=event["tokens"],
+                        elapsed=event["elapsed"],
+                        reason=event.get("reason")
+                    ))
+                elif "usage" in message and usage_tracker:
+                    usage_tracker.add(UsageRecord(**message["usage"]))
+                elif "error" in message:
+                    raise ConnectionError(f"Review daemon error: {message['error']}")
+        except ConnectionError:
+            raise
+        except OSError as e:
+            raise ConnectionError(f"Review daemon unavailable: {e}")
+        finally:
+            connection.close()
@@ -0,0 +1,99 @@
+"""Review Journal - Append-only checkpoint of completed reviews for resuming runs"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Dict, Tuple
+from .config import config
+from .git_operations import GitOperations
+from .input_parser import ReviewInput, ReviewType
+from .review_orchestrator import PROMPT_VERSION, ReviewResult
+from .tool_ops import append_jsonl, read_jsonl
+
+
+def ref_pair(review_input: ReviewInput, git_ops: GitOperations) -> Tuple[str, str]:
+    """
+    Describe the (base, head) refs a git review compares.
+    
+    Refs are resolved to commit hashes when possible so a branch that moves
+    gets a new run identity.
+    
+    Args:
+        review_input: Parsed review input
+        git_ops: Git operations for the reviewed repository
+    
+    Returns:
+        Tuple of (base, head) identifiers
+    """
+    def resolve(ref: str) -> str:
+        try:
+            return git_ops.resolve_ref(ref)
+        except ValueError:
+            return ref
+    
+    if review_input.review_type == ReviewType.GIT_DIFF:
+        return resolve("HEAD"), "INDEX"
+    if review_input.review_type == ReviewType.GIT_COMMIT:
+        return resolve(f"{review_input.target}^"), resolve(review_input.target)
+    if review_input.review_type == ReviewType.GIT_BRANCH:
+        return resolve("main"), resolve(review_input.target)
+    raise ValueError(f"Journaling not supported for review type: {review_input.review_type}")
+
+
+def run_identity(repo: str, refs: Tuple[str, str], model: str) -> str:
+    """
+    Build a stable identifier for a review run.
+    
+    Runs with other review prompts (see PROMPT_VERSION) get other identities.
+    
+    Args:
+        repo: Repository path
+        refs: (base, head) identifiers from ref_pair
+        model: LLM model name
+    
+    Returns:
+        Short hex identifier
+    """
+    key = "\0".join([os.path.abspath(repo), refs[0], refs[1], model, PROMPT_VERSION])
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
+class ReviewJournal:
+    """JSONL journal of review results for one run identity"""
+    
+    def __init__(self, path: str):
+        """
+        Initialize review journal.
+        
+        Args:
+            path: Journal file path
+        """
+        self.path = Path(path)
+    
+    @classmethod
+    def for_run(cls, run_id: str, repo: str = ".") -> "ReviewJournal":
+        """Return the journal for a run inside the repository's state directory"""
+        return cls(os.path.join(repo, config.get_state_dir(), "journal", f"{run_id}.jsonl"))
+    
+    def completed(self) -> Dict[str, ReviewResult]:
+        """
+        Load successfully completed results, keyed by file path.
+        
+        Returns:
+            Latest successful result per file
+        """
+        results = {}
+        for record in read_jsonl(self.path):
+            result = ReviewResult.from_dict(record)
+            if result.success:
+                results[result.file_path] = result
+        return results
+    
+    def append(self, result: ReviewResult) -> None:
+        """Checkpoint a completed review result"""
+        append_jsonl(self.path, result.to_dict())
+    
+    def reset(self) -> None:
+        """Discard all checkpoints for this run"""
+        if self.path.exists():
+            self.path.unlink()
@@ -1,9 +1,40 @@
 """Review Orchestrator - Manage code review workflow"""
 
-from dataclasses import dataclass
-from typing import List
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple
+from .aspect_review import review_aspects
+from .duplicates import Duplicate, find_duplicates, remap_review
+from .findings import Finding, findings_from_text, parse_json_findings, render_findings, structured_section
+from .metrics import REVIEW_FILES, REVIEW_QUEUE_DEPTH
 from .source_collector import SourceFile
-from .llm_client import LLMClient
+from .change_analyzer import hints_section
+from .symbol_index import context_section
+from .token_estimator import estimate_tokens
+from .review_scheduler import ReviewBudget, prioritize
+from .tracing import tracer
+from .usage import UsageTracker
+
+if TYPE_CHECKING:
+    # Imported lazily so thin clients don't pay for importing litellm
+    from .llm_client import LLMClient
+    from .review_journal import ReviewJournal
+    from .findings_store import RunRecorder
+    from .circuit_breaker import CircuitBreaker
+
+
+# Reasons reported with SKIPPED events
+BUDGET_EXHAUSTED_REASON = "budget exhausted"
+CIRCUIT_OPEN_REASON = "provider unavailable (circuit open)"
+
+# Bump whenever the review prompts change so stored results are not reused
+# (2: cross-file context, lint hints and structured output sections)
+PROMPT_VERSION = "2"
 
 
 @dataclass
@@ -14,19 +45,109 @@ class ReviewResult:
     success: bool
     is_diff: bool = False
     diff_info: dict = None
+    duplicate_of: str = None  # Reviewed file whose findings were copied to this one
+    findings: List[Finding] = None  # Parsed from review_content unless given
+    
+    def __post_init__(self):
+        """Parse findings out of the review text when none were given"""
+        if self.findings is None:
+            self.findings = findings_from_text(self.review_content) if self.success else []
+    
+    def to_dict(self) -> dict:
+        """Convert result to a JSON-serializable dictionary"""
+        return asdict(self)
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "ReviewResult":
+        """Create result from a dictionary produced by to_dict"""
+        if data.get("findings") is not None:
+            data = {**data, "findings": [Finding(**finding) for finding in data["findings"]]}
+        return cls(**data)
+
+
+class ReviewEventType(Enum):
+    """Lifecycle states of a file review"""
+    QUEUED = "queued"
+    IN_FLIGHT = "in_flight"
+    DONE = "done"
+    FAILED = "failed"
+    CACHED = "cached"
+    SKIPPED = "skipped"
+
+
+@dataclass
+class ReviewEvent:
+    """Progress event emitted by the orchestrator"""
+    event_type: ReviewEventType
+    file_path: str
+    tokens: int = 0
+    elapsed: float = 0.0
+    result: Optional[ReviewResult] = None
+    reason: Optional[str] = None
 
 
 class ReviewOrchestrator:
     """Orchestrate code review workflow"""
     
-    def __init__(self, llm_client: LLMClient):
+    def __init__(self, llm_client: "LLMClient",
+                 on_event: Optional[Callable[[ReviewEvent], None]] = None,
+                 max_workers: int = 1,
+                 journal: Optional["ReviewJournal"] = None,
+                 budget: Optional[ReviewBudget] = None,
+                 prioritized: bool = False,
+                 usage_tracker: Optional[UsageTracker] = None,
+                 result_store: Optional["RunRecorder"] = None,
+                 circuit_breaker: Optional["CircuitBreaker"] = None,
+                 fallback_client: Optional["LLMClient"] = None,
+                 aspects: Optional[List[str]] = None,
+                 duplicate_threshold: float = 0.0,
+                 structured: bool = False):
         """
         Initialize review orchestrator.
         
         Args:
             llm_client: LLM client for performing reviews
+            on_event: Optional callback receiving ReviewEvent notifications
+            max_workers: Maximum number of files reviewed concurrently
+            journal: Optional journal that checkpoints results and skips
+                files already completed in it
+            budget: Optional wall-clock/token budget; files not started
+                before it runs out are skipped
+            prioritized: Review files in order of estimated value per second
+            usage_tracker: Optional tracker receiving per-request token usage,
+                attributed to the file under review
+            result_store: Optional findings store run that records every
+                result and serves stored results for unchanged content
+            circuit_breaker: Optional breaker tracking llm_client failures;
+                while it is open, files go to fallback_client or are skipped
+            fallback_client: Optional client used while the circuit is open
+            aspects: Optional review aspects; each file is reviewed with one
+                concurrent, narrowly focused request per aspect and the
+                findings are merged
+            duplicate_threshold: Similarity at which a file counts as a copy
+                of an earlier one and gets its findings instead of a review;
+                1.0 matches identical content only, 0 disables the check
+            structured: Ask for findings as JSON instead of free-form text;
+                responses without a findings array are parsed as text
         """
         self.llm_client = llm_client
+        self.on_event = on_event
+        self.max_workers = max(1, max_workers)
+        self.journal = journal
+        self.budget = budget
+        self.prioritized = prioritized
+        self.usage_tracker = usage_tracker
+        self.result_store = result_store
+        self.circuit_breaker = circuit_breaker
+        self.fallback_client = fallback_client
+        self.aspects = aspects
+        self.duplicate_threshold = duplicate_threshold
+        self.structured = structured
+        self.skipped: List[str] = []
+        self.skip_reasons: Dict[str, str] = {}
+        self.tokens_used = 0
+        self._run_started = time.monotonic()
+        self._lock = threading.Lock()
     
     def review(self, source_files: List[SourceFile]) -> List[ReviewResult]:
         """
@@ -36,49 +157,266 @@ class ReviewOrchestrator:
             source_files: List of source files to review
             
         Returns:
-            List of review results
+            List of review results in input order
+        """
+        indexed = sorted(self._iter_indexed(source_files), key=lambda item: item[0])
+        return [result for _, result in indexed]
+    
+    def iter_review(self, source_files: List[SourceFile]) -> Iterator[ReviewResult]:
         """
-        results = []
+        Review source files, yielding each result as soon as it completes.
         
+        Args:
+            source_files: List of source files to review
+            
+        Yields:
+            Review results in completion order
+        """
+        for _, result in self._iter_indexed(source_files):
+            yield result
+    
+    def _iter_indexed(self, source_files: List[SourceFile]) -> Iterator[Tuple[int, ReviewResult]]:
+        """Review files sequentially or on a thread pool, yielding (index, result)"""
+        self._run_started = time.monotonic()
         for source_file in source_files:
-            try:
+            self._emit(ReviewEventType.QUEUED, source_file.path)
+        
+        # Results checkpointed by an earlier, interrupted run are not reviewed again
+        completed = self.journal.completed() if self.journal else {}
+        pending = []
+        for index, source_file in enumerate(source_files):
+            if source_file.path in completed:
+                result = completed[source_file.path]
+                REVIEW_QUEUE_DEPTH.dec()
+                self._emit(ReviewEventType.CACHED, source_file.path, result=result)
+                if self.result_store:
+                    self.result_store.record(source_file, result)
+                yield index, result
+            else:
+                pending.append((index, source_file))
+        
+        # Copies of another file in this run get its findings instead of a review
+        copies: Dict[int, List[Tuple[int, SourceFile, Duplicate]]] = {}
+        if self.duplicate_threshold > 0:
+            found = find_duplicates([source_file for _, source_file in pending], self.duplicate_threshold)
+            for position, duplicate in found.items():
+                index, source_file = pending[position]
+                copies.setdefault(pending[duplicate.original][0], []).append((index, source_file, duplicate))
+            pending = [item for position, item in enumerate(pending) if position not in found]
+        
+        if self.prioritized:
+            order = {id(source_file): rank for rank, source_file in enumerate(prioritize([f for _, f in pending]))}
+            pending.sort(key=lambda item: order[id(item[1])])
+        
+        for index, result in self._iter_pending(pending):
+            reviewed = [(index, result)] + [
+                (copy_index, self._copy_result(source_files[index], result, source_file, duplicate))
+                for copy_index, source_file, duplicate in copies.pop(index, [])
+            ]
+            for item_index, item_result in reviewed:
+                if self.journal:
+                    self.journal.append(item_result)
+                if self.result_store:
+                    self.result_store.record(source_files[item_index], item_result)
+                yield item_index, item_result
+        
+        # Copies of files that were never reviewed are skipped with them
+        for original_index, duplicates in copies.items():
+            reason = self.skip_reasons.get(source_files[original_index].path, BUDGET_EXHAUSTED_REASON)
+            self._skip([(index, source_file) for index, source_file, _ in duplicates], reason)
+    
+    def _copy_result(self, original: SourceFile, result: ReviewResult, source_file: SourceFile,
+                     duplicate: Duplicate) -> ReviewResult:
+        """Give a duplicate the findings of its original, with line numbers remapped"""
+        copied = ReviewResult(
+            file_path=source_file.path,
+            review_content=remap_review(result.review_content, duplicate) if result.success else result.review_content,
+            success=result.success,
+            is_diff=source_file.is_diff,
+            diff_info=source_file.diff_info,
+            duplicate_of=original.path
+        )
+        REVIEW_QUEUE_DEPTH.dec()
+        self._emit(ReviewEventType.CACHED if result.success else ReviewEventType.FAILED, source_file.path,
+                   result=copied, reason=f"duplicate of {original.path}")
+        return copied
+    
+    def _iter_pending(self, pending: List[Tuple[int, SourceFile]]) -> Iterator[Tuple[int, ReviewResult]]:
+        """Review (index, file) pairs in order, yielding results in completion order"""
+        queue = deque(pending)
+        
+        if self.max_workers == 1:
+            while queue and not self._budget_exhausted():
+                index, source_file = queue.popleft()
+                client = self._select_client()
+                if client is None:
+                    self._skip([(index, source_file)], CIRCUIT_OPEN_REASON)
+                    continue
+                yield index, self._review_file(source_file, client)
+            self._skip(queue)
+            return
+        
+        # Submit at most max_workers files at a time so the budget is
+        # checked before each new review starts
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            in_flight = {}
+            while queue or in_flight:
+                while queue and len(in_flight) < self.max_workers and not self._budget_exhausted():
+                    index, source_file = queue.popleft()
+                    client = self._select_client()
+                    if client is None:
+                        self._skip([(index, source_file)], CIRCUIT_OPEN_REASON)
+                        continue
+                    in_flight[executor.submit(self._review_file, source_file, client)] = index
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield in_flight.pop(future), future.result()
+        self._skip(queue)
+    
+    def _usage_scope(self, file_path: str):
+        """Attribute LLM usage on this thread to a file, if usage is tracked"""
+        if self.usage_tracker:
+            return self.usage_tracker.file_scope(file_path)
+        return nullcontext()
+    
+    def _budget_exhausted(self) -> bool:
+        """Check whether the run budget leaves room to start another review"""
+        if not self.budget:
+            return False
+        with self._lock:
+            tokens_used = self.tokens_used
+        return self.budget.exhausted(time.monotonic() - self._run_started, tokens_used)
+    
+    def _select_client(self) -> Optional["LLMClient"]:
+        """Pick the client for the next file, or None to skip it while the circuit is open"""
+        if self.circuit_breaker is None or self.circuit_breaker.allow_request():
+            return self.llm_client
+        return self.fallback_client
+    
+    def _skip(self, remaining, reason: str = BUDGET_EXHAUSTED_REASON) -> None:
+        """Record files that were never started"""
+        for _, source_file in remaining:
+            self.skipped.append(source_file.path)
+            self.skip_reasons[source_file.path] = reason
+            self._emit(ReviewEventType.SKIPPED, source_file.path, reason=reason)
+    
+    def _emit(self, event_type: ReviewEventType, file_path: str, **kwargs) -> None:
+        """Record metrics for an event and send it to the registered callback, if any"""
+        if event_type == ReviewEventType.QUEUED:
+            REVIEW_QUEUE_DEPTH.inc()
+        elif event_type in (ReviewEventType.IN_FLIGHT, ReviewEventType.SKIPPED):
+            REVIEW_QUEUE_DEPTH.dec()
+        if event_type not in (ReviewEventType.QUEUED, ReviewEventType.IN_FLIGHT):
+            REVIEW_FILES.inc(status=event_type.value)
+        if self.on_event:
+            self.on_event(ReviewEvent(event_type=event_type, file_path=file_path, **kwargs))
+    
+    def _review_file(self, source_file: SourceFile, llm_client: Optional["LLMClient"] = None) -> ReviewResult:
+        """
+        Review a single source file, converting failures into error results.
+        
+        Args:
+            source_file: Source file to review
+            llm_client: Client to use (default: the orchestrator's client)
+            
+        Returns:
+            Review result for the file
+        """
+        llm_client = llm_client or self.llm_client
+        self._emit(ReviewEventType.IN_FLIGHT, source_file.path)
+        started = time.monotonic()
+        
+        # Identical content was already reviewed with the same model and prompts
+        stored = self.result_store.lookup(source_file) if self.result_store else None
+        if stored is not None:
+            if self.circuit_breaker is not None and llm_client is self.llm_client:
+                self.circuit_breaker.release()
+            self._emit(ReviewEventType.CACHED, source_file.path,
+                       elapsed=time.monotonic() - started, result=stored)
+            return stored
+        
+        try:
+            with tracer.span("review.file", path=source_file.path, is_diff=source_file.is_diff), \
+                    self._usage_scope(source_file.path):
                 # Use different prompts for diff vs regular files
-                if source_file.is_diff:
-                    review_content = self._review_diff_file(source_file)
+                cached = None
+                options = {}
+                if source_file.context or source_file.hints:
+                    options.update(context=source_file.context, hints=source_file.hints)
+                if self.structured:
+                    options["structured"] = True
+                if self.aspects:
+                    review_content, cached = review_aspects(llm_client, source_file, self.aspects)
+                elif source_file.is_diff:
+                    review_content = self._review_diff_file(source_file, llm_client)
                 else:
-                    review_content = self.llm_client.code_review(
+                    review_content = llm_client.code_review(
                         source_file.content, 
-                        source_file.path
+                        source_file.path,
+                        **options
                     )
-                
-                result = ReviewResult(
-                    file_path=source_file.path,
-                    review_content=review_content,
-                    success=True,
-                    is_diff=source_file.is_diff,
-                    diff_info=source_file.diff_info
-                )
-                
-                results.append(result)
-                
-            except Exception as e:
-                error_result = ReviewResult(
-                    file_path=source_file.path,
-                    review_content=f"Review failed: {str(e)}",
-                    success=False,
-                    is_diff=source_file.is_diff,
-                    diff_info=source_file.diff_info
-                )
-                results.append(error_result)
-        
-        return results
-    
-    def _review_diff_file(self, source_file: SourceFile) -> str:
+            
+            # Structured findings are stored as rendered text too, so every
+            # consumer of review_content keeps working
+            findings = parse_json_findings(review_content) if self.structured and not self.aspects else None
+            if findings is not None:
+                review_content = render_findings(findings)
+            result = ReviewResult(
+                file_path=source_file.path,
+                review_content=review_content,
+                success=True,
+                is_diff=source_file.is_diff,
+                diff_info=source_file.diff_info,
+                findings=findings
+            )
+            self._record_outcome(llm_client, success=True)
+            if cached is None:
+                cached = llm_client.last_call_cached()
+            if cached:
+                event_type = ReviewEventType.CACHED
+            else:
+                event_type = ReviewEventType.DONE
+            
+        except Exception as e:
+            self._record_outcome(llm_client, success=False)
+            result = ReviewResult(
+                file_path=source_file.path,
+                review_content=f"Review failed: {str(e)}",
+                success=False,
+                is_diff=source_file.is_diff,
+                diff_info=source_file.diff_info
+            )
+            event_type = ReviewEventType.FAILED
+        
+        tokens = 0
+        if self.usage_tracker:
+            tokens = self.usage_tracker.file_totals(source_file.path).total_tokens
+        elif result.success:
+            tokens = estimate_tokens(source_file.content or "") + estimate_tokens(result.review_content)
+        with self._lock:
+            self.tokens_used += tokens
+        self._emit(event_type, source_file.path, tokens=tokens,
+                   elapsed=time.monotonic() - started, result=result)
+        return result
+    
+    def _record_outcome(self, llm_client: "LLMClient", success: bool) -> None:
+        """Feed the circuit breaker with outcomes of the primary client"""
+        if self.circuit_breaker is None or llm_client is not self.llm_client:
+            return
+        if success:
+            self.circuit_breaker.record_success()
+        else:
+            self.circuit_breaker.record_failure()
+    
+    def _review_diff_file(self, source_file: SourceFile, llm_client: Optional["LLMClient"] = None) -> str:
         """
         Review git diff file with specialized prompt.
         
         Args:
             source_file: Source file with diff content
+            llm_client: Client to use (default: the orchestrator's client)
             
         Returns:
             Review content from LLM
@@ -97,7 +435,7 @@ IMPORTANT:
 - Consider REMOVED LINES (marked with -) for context
 - Only report problems in the changes, not existing code
 - Include line numbers for specific issues
-- Be concise and actionable"""
+- Be concise and actionable""" + structured_section(self.structured)
 
         diff_type = source_file.diff_info.get("type", "changes") if source_file.diff_info else "changes"
         
@@ -105,8 +443,8 @@ IMPORTANT:
 
 File: {source_file.path}
 
-{source_file.content}
+{source_file.content}{context_section(source_file.context)}{hints_section(source_file.hints)}
 
 Focus on problems in the added lines. Include line numbers for specific issues."""
 
-        return self.llm_client.send_message(user_message, system_prompt)
+        return (llm_client or self.llm_client).send_message(user_message, system_prompt)
@@ -0,0 +1,164 @@
+"""Review Plan - Predict requests, tokens, cost and duration of a review without calling the LLM"""
+
+import heapq
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+from typing import Callable, Collection, List, Optional, Tuple
+from .duplicates import find_duplicates
+from .review_scheduler import BASE_LATENCY_SECONDS, PROMPT_OVERHEAD_TOKENS, SECONDS_PER_1K_TOKENS
+from .source_collector import SourceFile
+from .token_estimator import estimate_tokens
+
+
+# Assumed response length; reviews list short findings, far below max_tokens
+EXPECTED_COMPLETION_TOKENS = 300
+
+
+class PlanStatus(Enum):
+    """How a file's result will be obtained"""
+    REVIEW = "review"
+    STORED = "stored"  # Findings store has a result for identical content
+    RESUMED = "resumed"  # Checkpointed by the interrupted run being resumed
+    DUPLICATE = "duplicate"  # Gets the findings of another file in the run
+
+
+@dataclass
+class PlannedFile:
+    """Expected work for one file"""
+    path: str
+    status: PlanStatus
+    prompt_tokens: int = 0
+    requests: int = 0
+    seconds: float = 0.0
+    note: str = ""
+
+
+@dataclass
+class ReviewPlan:
+    """Expected requests, tokens, cost and duration of a review"""
+    model: str
+    concurrency: int
+    files: List[PlannedFile]
+    skipped: List[Tuple[str, str]] = field(default_factory=list)  # (path, reason) left out before review
+    cost: Optional[float] = None  # USD, None if the model's prices are unknown
+    seconds: float = 0.0
+    
+    @property
+    def requests(self) -> int:
+        """LLM requests the review will send"""
+        return sum(planned.requests for planned in self.files)
+    
+    @property
+    def prompt_tokens(self) -> int:
+        """Estimated prompt tokens over all requests"""
+        return sum(planned.prompt_tokens for planned in self.files)
+    
+    @property
+    def completion_tokens(self) -> int:
+        """Assumed completion tokens over all requests"""
+        return self.requests * EXPECTED_COMPLETION_TOKENS
+    
+    def count(self, status: PlanStatus) -> int:
+        """Number of files planned with the given status"""
+        return sum(1 for planned in self.files if planned.status == status)
+    
+    def to_dict(self) -> dict:
+        """Convert the plan to a JSON-serializable dictionary"""
+        return {
+            "model": self.model,
+            "concurrency": self.concurrency,
+            "requests": self.requests,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cost": self.cost,
+            "seconds": round(self.seconds, 1),
+            "files": [{**asdict(planned), "status": planned.status.value, "seconds": round(planned.seconds, 1)}
+                      for planned in self.files],
+            "skipped": [{"path": path, "reason": reason} for path, reason in self.skipped],
+        }
+
+
+def prompt_tokens(source_file: SourceFile) -> int:
+    """Estimate prompt tokens of one review request for a file, including context and hints"""
+    return (estimate_tokens(source_file.content or "") + estimate_tokens(source_file.context or "")
+            + estimate_tokens("\n".join(source_file.hints or [])) + PROMPT_OVERHEAD_TOKENS)
+
+
+def projected_seconds(durations: List[float], concurrency: int, requests_per_minute: float = 0) -> float:
+    """
+    Project the wall-clock time of reviews started in order on a worker pool.
+    
+    Args:
+        durations: Estimated seconds per file, in submission order
+        concurrency: Number of files reviewed at once
+        requests_per_minute: Rate limit over all requests (0 for none)
+    
+    Returns:
+        Seconds until the last review finishes
+    """
+    workers = [0.0] * max(1, concurrency)
+    for duration in durations:
+        heapq.heappush(workers, heapq.heappop(workers) + duration)
+    makespan = max(workers)
+    if requests_per_minute > 0:
+        makespan = max(makespan, len(durations) / requests_per_minute * 60)
+    return makespan
+
+
+def build_plan(source_files: List[SourceFile], model: str, concurrency: int = 1,
+               requests_per_minute: int = 0, aspects: Optional[List[str]] = None,
+               duplicate_threshold: float = 0.0,
+               stored: Optional[Callable[[SourceFile], bool]] = None,
+               completed: Collection[str] = (),
+               skipped: Optional[List[Tuple[str, str]]] = None,
+               price: Optional[Callable[[int, int], float]] = None) -> ReviewPlan:
+    """
+    Plan a review the way ReviewOrchestrator would run it.
+    
+    Args:
+        source_files: Files left after collection and filtering
+        model: Model the review would use
+        concurrency: Files reviewed at once
+        requests_per_minute: Configured rate limit (0 for none)
+        aspects: Review aspects; each file costs one request per aspect
+        duplicate_threshold: Duplicate threshold of the orchestrator (0 disables)
+        stored: Whether the findings store holds a result for a file
+        completed: Paths checkpointed by a resumed run
+        skipped: (path, reason) of files dropped before review
+        price: USD cost of (prompt tokens, completion tokens), 0.0 if unknown
+    
+    Returns:
+        ReviewPlan
+    """
+    requests_per_file = len(aspects) if aspects else 1
+    planned = {}
+    pending = []
+    for index, source_file in enumerate(source_files):
+        if source_file.path in completed:
+            planned[index] = PlannedFile(source_file.path, PlanStatus.RESUMED)
+        else:
+            pending.append((index, source_file))
+    
+    duplicates = find_duplicates([f for _, f in pending], duplicate_threshold) if duplicate_threshold > 0 else {}
+    for position, (index, source_file) in enumerate(pending):
+        if position in duplicates:
+            original = pending[duplicates[position].original][1]
+            planned[index] = PlannedFile(source_file.path, PlanStatus.DUPLICATE, note=f"copy of {original.path}")
+        elif stored is not None and stored(source_file):
+            planned[index] = PlannedFile(source_file.path, PlanStatus.STORED)
+        else:
+            tokens = prompt_tokens(source_file)
+            # Aspect requests of a file run concurrently, so they take about as long as one
+            seconds = BASE_LATENCY_SECONDS + (tokens + EXPECTED_COMPLETION_TOKENS) / 1000 * SECONDS_PER_1K_TOKENS
+            planned[index] = PlannedFile(source_file.path, PlanStatus.REVIEW, tokens * requests_per_file,
+                                         requests_per_file, seconds)
+    
+    plan = ReviewPlan(model, max(1, concurrency), [planned[index] for index in range(len(source_files))],
+                      skipped=list(skipped or []))
+    reviewed = [p for p in plan.files if p.status == PlanStatus.REVIEW]
+    plan.seconds = projected_seconds([p.seconds for p in reviewed], concurrency,
+                                     requests_per_minute / requests_per_file if requests_per_minute else 0)
+    if price is not None:
+        cost = price(plan.prompt_tokens, plan.completion_tokens)
+        plan.cost = cost if cost or not plan.requests else None
+    return plan
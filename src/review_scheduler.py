@@ -0,0 +1,125 @@
+"""Review Scheduler - Order file reviews by estimated value and enforce run budgets"""
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+from .source_collector import SourceFile
+from .token_estimator import estimate_tokens
+
+
+# Path patterns that make a change riskier, with their value multipliers
+RISK_PATTERNS = [
+    (re.compile(r"auth|login|session|passw|secret|credential|token|oauth|permission|acl", re.IGNORECASE), 3.0),
+    (re.compile(r"crypt|cipher|hash|signature|signing|ssl|tls|jwt|private_key|keystore", re.IGNORECASE), 3.0),
+    (re.compile(r"migrat|schema|\.sql$", re.IGNORECASE), 2.5),
+    (re.compile(r"payment|billing|security|sanitiz|upload|exec|shell", re.IGNORECASE), 2.0),
+]
+
+# Relative review value of file types; unknown extensions count as code
+FILE_TYPE_WEIGHTS = {
+    ".md": 0.2, ".rst": 0.2, ".txt": 0.1,
+    ".json": 0.4, ".yaml": 0.5, ".yml": 0.5, ".toml": 0.5, ".xml": 0.3,
+    ".lock": 0.05, ".css": 0.4, ".scss": 0.4, ".html": 0.6,
+}
+
+# Tokens of system prompt and instructions wrapped around every file
+PROMPT_OVERHEAD_TOKENS = 300
+
+# Rough LLM latency model: fixed request latency plus time per 1k tokens
+BASE_LATENCY_SECONDS = 2.0
+SECONDS_PER_1K_TOKENS = 1.5
+
+
+@dataclass
+class ReviewBudget:
+    """Wall-clock and token limits for a review run"""
+    max_seconds: Optional[float] = None
+    max_tokens: Optional[int] = None
+    
+    def exhausted(self, elapsed: float, tokens_used: int) -> bool:
+        """Check whether no further reviews should be started"""
+        if self.max_seconds is not None and elapsed >= self.max_seconds:
+            return True
+        if self.max_tokens is not None and tokens_used >= self.max_tokens:
+            return True
+        return False
+
+
+def parse_budget(spec: str) -> ReviewBudget:
+    """
+    Parse a budget specification.
+    
+    Accepts wall-clock limits ("90s", "15m", "1h") and token limits
+    ("50000t", "200k tokens"). Several limits can be comma-separated.
+    
+    Args:
+        spec: Budget specification
+    
+    Returns:
+        Parsed ReviewBudget
+    
+    Raises:
+        ValueError: If the specification is invalid
+    """
+    budget = ReviewBudget()
+    for part in spec.split(","):
+        match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*(k?)\s*(s|m|h|t|tok|tokens)\s*", part.lower())
+        if not match:
+            raise ValueError(f"Invalid budget '{part.strip()}' (use e.g. 300s, 15m or 50k tokens)")
+        amount, thousands, unit = match.groups()
+        value = float(amount) * (1000 if thousands else 1)
+        if unit in ("t", "tok", "tokens"):
+            budget.max_tokens = int(value)
+        else:
+            budget.max_seconds = value * {"s": 1, "m": 60, "h": 3600}[unit]
+    return budget
+
+
+def estimate_request_tokens(source_file: SourceFile) -> int:
+    """Estimate prompt tokens needed to review a file"""
+    return estimate_tokens(source_file.content or "") + PROMPT_OVERHEAD_TOKENS
+
+
+def estimate_seconds(source_file: SourceFile) -> float:
+    """Estimate wall-clock seconds needed to review a file"""
+    return BASE_LATENCY_SECONDS + estimate_request_tokens(source_file) / 1000 * SECONDS_PER_1K_TOKENS
+
+
+def estimate_value(source_file: SourceFile) -> float:
+    """
+    Estimate how valuable reviewing a file is.
+    
+    Args:
+        source_file: File to score
+    
+    Returns:
+        Value score combining changed lines, file type and path risk
+    """
+    if source_file.diff_info:
+        lines = source_file.diff_info.get("added_lines", 0)
+    else:
+        lines = source_file.lines
+    
+    weight = FILE_TYPE_WEIGHTS.get(Path(source_file.path).suffix.lower(), 1.0)
+    risk = max((multiplier for pattern, multiplier in RISK_PATTERNS if pattern.search(source_file.path)),
+               default=1.0)
+    return (1 + lines) * weight * risk
+
+
+def priority(source_file: SourceFile) -> float:
+    """Estimated review value per second of LLM time"""
+    return estimate_value(source_file) / estimate_seconds(source_file)
+
+
+def prioritize(source_files: List[SourceFile]) -> List[SourceFile]:
+    """
+    Order files so the most valuable reviews per second come first.
+    
+    Args:
+        source_files: Files in collection order
+    
+    Returns:
+        Files sorted by descending priority (ties keep collection order)
+    """
+    return sorted(source_files, key=priority, reverse=True)
@@ -0,0 +1,201 @@
+"""Review Server - Long-running daemon holding warm LLM clients and caches"""
+
+import json
+import os
+import queue
+import threading
+from dataclasses import asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional
+from .aspect_review import parse_aspects
+from .circuit_breaker import CircuitBreaker
+from .config import config
+from .deployment_pool import DeploymentPool, load_pool
+from .llm_client import LLMClient
+from .metrics import send_metrics
+from .rate_limiter import RateLimiter
+from .response_cache import ResponseCache
+from .review_orchestrator import ReviewEvent, ReviewOrchestrator
+from .review_scheduler import ReviewBudget
+from .source_collector import SourceFile
+from .usage import UsageTracker
+
+
+class ReviewService:
+    """Review state shared by every request the daemon serves"""
+    
+    def __init__(self, cache: Optional[ResponseCache] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 pool: Optional[DeploymentPool] = None):
+        """
+        Initialize review service.
+        
+        Args:
+            cache: Response cache shared across requests
+            rate_limiter: Rate limiter shared across requests
+            pool: Deployment pool for the default model (default: CODER_DEPLOYMENTS)
+        """
+        self.cache = cache or ResponseCache(config.get_cache_size())
+        self.rate_limiter = rate_limiter or RateLimiter(config.get_requests_per_minute())
+        self.pool = pool or load_pool()
+        self._clients: Dict[str, LLMClient] = {}
+        self._breakers: Dict[str, Optional[CircuitBreaker]] = {}
+        self._lock = threading.Lock()
+    
+    def get_client(self, model: Optional[str] = None) -> LLMClient:
+        """Return the warm client for a model, creating it on first use"""
+        model = model or config.get_llm_model()
+        with self._lock:
+            if model not in self._clients:
+                # Explicit model overrides bypass the pool configured for the default model
+                pool = self.pool if model == config.get_llm_model() else None
+                self._clients[model] = LLMClient(model, cache=self.cache, rate_limiter=self.rate_limiter,
+                                                 pool=pool)
+            return self._clients[model]
+    
+    def get_breaker(self, model: Optional[str] = None) -> Optional[CircuitBreaker]:
+        """Return the circuit breaker shared by all requests for a model (None if disabled)"""
+        model = model or config.get_llm_model()
+        with self._lock:
+            if model not in self._breakers:
+                self._breakers[model] = CircuitBreaker.from_config()
+            return self._breakers[model]
+    
+    def get_fallback_client(self, model: Optional[str] = None) -> Optional[LLMClient]:
+        """Return the client used while a model's circuit is open, if configured"""
+        fallback_model = config.get_fallback_model()
+        if not fallback_model or fallback_model == (model or config.get_llm_model()):
+            return None
+        return self.get_client(fallback_model)
+    
+    def stream_review(self, source_files: List[SourceFile], model: Optional[str] = None,
+                      budget: Optional[ReviewBudget] = None,
+                      aspects: Optional[List[str]] = None,
+                      structured: Optional[bool] = None) -> Iterator[dict]:
+        """
+        Review files and stream progress events and results as messages.
+        
+        Args:
+            source_files: Files to review
+            model: Optional model override
+            budget: Optional run budget; enables priority scheduling
+            aspects: Optional review aspects reviewed by concurrent focused prompts
+            structured: Ask for JSON findings (default: CODER_STRUCTURED_FINDINGS)
+        
+        Yields:
+            {"event": {...}}, {"usage": {...}} and {"result": {...}} messages
+            in completion order
+        """
+        messages: "queue.Queue[Optional[dict]]" = queue.Queue()
+        
+        def on_event(event: ReviewEvent) -> None:
+            messages.put({"event": {
+                "event_type": event.event_type.value,
+                "file_path": event.file_path,
+                "tokens": event.tokens,
+                "elapsed": event.elapsed,
+                "reason": event.reason,
+            }})
+        
+        usage_tracker = UsageTracker(on_record=lambda record: messages.put({"usage": asdict(record)}))
+        
+        def run() -> None:
+            try:
+                orchestrator = ReviewOrchestrator(
+                    self.get_client(model),
+                    on_event=on_event,
+                    max_workers=config.get_max_concurrency(),
+                    budget=budget,
+                    prioritized=budget is not None,
+                    usage_tracker=usage_tracker,
+                    circuit_breaker=self.get_breaker(model),
+                    fallback_client=self.get_fallback_client(model),
+                    aspects=aspects,
+                    duplicate_threshold=config.get_duplicate_threshold(),
+                    structured=config.get_structured_findings() if structured is None else structured
+                )
+                for result in orchestrator.iter_review(source_files):
+                    messages.put({"result": result.to_dict()})
+            except Exception as e:
+                messages.put({"error": str(e)})
+            finally:
+                messages.put(None)
+        
+        threading.Thread(target=run, daemon=True).start()
+        while True:
+            message = messages.get()
+            if message is None:
+                return
+            yield message
+
+
+class ReviewRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler for the review daemon"""
+    
+    service: ReviewService = None
+    
+    def do_GET(self):
+        """Handle health checks and metrics scrapes"""
+        if self.path == "/metrics":
+            send_metrics(self)
+            return
+        if self.path != "/health":
+            self.send_error(404)
+            return
+        self._send_json({"status": "ok", "pid": os.getpid()})
+    
+    def do_POST(self):
+        """Handle review requests, streaming newline-delimited JSON"""
+        if self.path != "/review":
+            self.send_error(404)
+            return
+        
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length))
+            source_files = [SourceFile.from_dict(data) for data in payload["source_files"]]
+            budget = ReviewBudget(**payload["budget"]) if payload.get("budget") else None
+            aspects = parse_aspects(",".join(payload["aspects"])) if payload.get("aspects") else None
+            structured = payload.get("structured")
+            if structured is not None and not isinstance(structured, bool):
+                raise ValueError("structured must be a boolean")
+        except (ValueError, KeyError, TypeError) as e:
+            self.send_error(400, f"Invalid review request: {e}")
+            return
+        
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        for message in self.service.stream_review(source_files, payload.get("model"), budget, aspects,
+                                                  structured):
+            self.wfile.write((json.dumps(message) + "\n").encode("utf-8"))
+            self.wfile.flush()
+    
+    def log_message(self, format, *args):
+        """Silence per-request logging"""
+    
+    def _send_json(self, data: dict) -> None:
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def create_server(host: str, port: int, service: Optional[ReviewService] = None) -> ThreadingHTTPServer:
+    """
+    Create the review daemon HTTP server.
+    
+    Args:
+        host: Interface to bind (localhost only by default)
+        port: TCP port to listen on
+        service: Review service to use (default: new service)
+    
+    Returns:
+        Server ready for serve_forever()
+    """
+    handler = type("BoundReviewRequestHandler", (ReviewRequestHandler,), {
+        "service": service or ReviewService()
+    })
+    return ThreadingHTTPServer((host, port), handler)
@@ -0,0 +1,110 @@
+"""Sharding - Deterministic partitioning of review work across processes"""
+
+import hashlib
+import heapq
+import os
+from typing import Dict, Iterable, List, Tuple
+from .review_orchestrator import ReviewResult
+from .review_scheduler import estimate_request_tokens
+from .source_collector import SourceFile
+from .tool_ops import read_jsonl
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """
+    Parse a shard specification.
+    
+    Args:
+        spec: "i/N" with 1 <= i <= N, e.g. "2/4"
+    
+    Returns:
+        Tuple of (index, count), index 1-based
+    
+    Raises:
+        ValueError: If the specification is invalid
+    """
+    try:
+        index, count = (int(part) for part in spec.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard '{spec}' - expected i/N, e.g. 1/4")
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Invalid shard '{spec}' - index must be between 1 and {max(count, 1)}")
+    return index, count
+
+
+def _stable_hash(path: str) -> int:
+    """Hash a path identically on every machine and Python process"""
+    return int.from_bytes(hashlib.sha256(path.encode("utf-8")).digest()[:8], "big")
+
+
+def assign_shards(source_files: List[SourceFile], count: int) -> List[List[SourceFile]]:
+    """
+    Split files into shards of similar estimated token cost.
+    
+    Files are placed heaviest first onto the currently lightest shard; equal
+    weights are ordered by a stable hash of the path, so every runner that
+    collects the same files computes the same assignment.
+    
+    Args:
+        source_files: Files to split
+        count: Number of shards
+    
+    Returns:
+        Files per shard, each in collection order
+    """
+    order = {id(source_file): index for index, source_file in enumerate(source_files)}
+    weighted = sorted(
+        source_files,
+        key=lambda f: (-estimate_request_tokens(f), _stable_hash(f.path), f.path)
+    )
+    
+    shards: List[List[SourceFile]] = [[] for _ in range(count)]
+    loads = [(0, shard) for shard in range(count)]
+    for source_file in weighted:
+        load, shard = heapq.heappop(loads)
+        shards[shard].append(source_file)
+        heapq.heappush(loads, (load + estimate_request_tokens(source_file), shard))
+    
+    return [sorted(files, key=lambda f: order[id(f)]) for files in shards]
+
+
+def select_shard(source_files: List[SourceFile], index: int, count: int) -> List[SourceFile]:
+    """
+    Return the files belonging to one shard.
+    
+    Args:
+        source_files: All collected files
+        index: 1-based shard index
+        count: Number of shards
+    
+    Returns:
+        Files of the shard, in collection order
+    """
+    return assign_shards(source_files, count)[index - 1]
+
+
+def merge_results(paths: Iterable[str]) -> List[ReviewResult]:
+    """
+    Combine shard result files into one result list.
+    
+    If a file appears in several inputs, the last successful result wins.
+    
+    Args:
+        paths: JSONL files written by `cr --output`
+    
+    Returns:
+        Results sorted by file path
+    
+    Raises:
+        ValueError: If an input file does not exist
+    """
+    merged: Dict[str, ReviewResult] = {}
+    for path in paths:
+        if not os.path.isfile(path):
+            raise ValueError(f"Shard output not found: {path}")
+        for record in read_jsonl(path):
+            result = ReviewResult.from_dict(record)
+            previous = merged.get(result.file_path)
+            if previous is None or result.success or not previous.success:
+                merged[result.file_path] = result
+    return [merged[path] for path in sorted(merged)]
@@ -1,10 +1,11 @@
 """Source Collector - Collect source code from various inputs"""
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import List
 from .input_parser import ReviewInput, ReviewType
 from .tool_ops import read_file_content
 from .git_operations import GitOperations, GitDiffFile
+from .tracing import traced
 
 
 @dataclass
@@ -16,15 +17,38 @@ class SourceFile:
     lines: int
     is_diff: bool = False
     diff_info: dict = None
+    context: str = None  # Definitions referenced from other files, added to the prompt
+    hints: list = None  # Local lint hits on the reviewed lines, added to the prompt
+    
+    def to_dict(self) -> dict:
+        """Convert source file to a JSON-serializable dictionary"""
+        return asdict(self)
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "SourceFile":
+        """Create source file from a dictionary produced by to_dict"""
+        return cls(**data)
+    
+    def release(self) -> None:
+        """Drop the content and prompt additions once the file is reviewed; metadata stays"""
+        self.content = None
+        self.context = None
+        self.hints = None
 
 
 class SourceCollector:
     """Collect source code from various input types"""
     
-    def __init__(self):
-        """Initialize source collector"""
-        self.git_ops = GitOperations()
+    def __init__(self, working_dir: str = "."):
+        """
+        Initialize source collector.
+        
+        Args:
+            working_dir: Repository directory for git operations
+        """
+        self.git_ops = GitOperations(working_dir)
     
+    @traced("source_collector.collect")
     def collect(self, review_input: ReviewInput) -> List[SourceFile]:
         """
         Collect source files based on review input.
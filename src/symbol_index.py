@@ -0,0 +1,407 @@
+"""Symbol Index - Repository definitions supplied to reviews as cross-file context"""
+
+import ast
+import os
+import re
+import sqlite3
+import subprocess
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Set
+from .config import config
+from .source_collector import SourceFile
+from .token_estimator import estimate_tokens
+from .tool_ops import git_blob_sha, is_ignored_dir
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    blob_sha TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS symbols (
+    path TEXT NOT NULL,
+    name TEXT NOT NULL,
+    qualname TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    signature TEXT NOT NULL,
+    doc TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_symbols_name ON symbols(name);
+CREATE INDEX IF NOT EXISTS idx_symbols_path ON symbols(path);
+"""
+
+# Files larger than this are not indexed (generated or vendored code)
+MAX_FILE_BYTES = 1_000_000
+
+# Longest docstring summary kept per symbol
+MAX_DOC_CHARS = 300
+
+# Definitions shown per referenced name when several files define it
+MAX_DEFINITIONS_PER_NAME = 2
+
+LANGUAGES = {
+    ".js": "js", ".jsx": "js", ".mjs": "js", ".ts": "js", ".tsx": "js",
+    ".go": "go", ".rs": "rust", ".rb": "ruby", ".php": "php",
+    ".java": "java", ".kt": "java", ".scala": "java", ".swift": "java", ".cs": "java",
+    ".c": "c", ".h": "c", ".cpp": "c", ".hpp": "c", ".cc": "c",
+}
+
+_MODIFIERS = r"(?:(?:public|private|protected|internal|static|final|abstract|sealed|open|data|override|async|export|default)\s+)*"
+
+# ctags-style definition patterns: (regex capturing the name, kind)
+REGEX_PATTERNS = {
+    "js": [
+        (re.compile(r"^\s*" + _MODIFIERS + r"function\s*\*?\s*(\w+)\s*\("), "function"),
+        (re.compile(r"^\s*" + _MODIFIERS + r"class\s+(\w+)"), "class"),
+        (re.compile(r"^\s*" + _MODIFIERS + r"(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s+)?(?:\([^)]*\)|\w+)\s*=>"), "function"),
+        (re.compile(r"^\s*" + _MODIFIERS + r"(?:interface|type|enum)\s+(\w+)"), "type"),
+    ],
+    "go": [
+        (re.compile(r"^func\s+(?:\([^)]*\)\s*)?(\w+)\s*[\[(]"), "function"),
+        (re.compile(r"^type\s+(\w+)\s+"), "type"),
+    ],
+    "rust": [
+        (re.compile(r"^\s*(?:pub(?:\([^)]*\))?\s+)?(?:const\s+)?(?:async\s+)?(?:unsafe\s+)?fn\s+(\w+)"), "function"),
+        (re.compile(r"^\s*(?:pub(?:\([^)]*\))?\s+)?(?:struct|enum|trait|type)\s+(\w+)"), "type"),
+    ],
+    "ruby": [
+        (re.compile(r"^\s*def\s+(?:self\.)?(\w+[?!]?)"), "function"),
+        (re.compile(r"^\s*(?:class|module)\s+(\w+)"), "class"),
+    ],
+    "php": [
+        (re.compile(r"^\s*" + _MODIFIERS + r"function\s+(\w+)\s*\("), "function"),
+        (re.compile(r"^\s*" + _MODIFIERS + r"(?:class|interface|trait)\s+(\w+)"), "class"),
+    ],
+    "java": [
+        (re.compile(r"^\s*" + _MODIFIERS + r"(?:class|interface|enum|struct|record|object|protocol)\s+(\w+)"), "class"),
+        (re.compile(r"^\s*" + _MODIFIERS + r"(?:fun|func|def)\s+(?:<[^>]*>\s*)?(\w+)\s*[(<]"), "function"),
+        (re.compile(r"^\s*(?:(?:public|private|protected|static|final|abstract|synchronized)\s+)+"
+                    r"[\w<>\[\],.? ]+\s+(\w+)\s*\([^;]*$"), "function"),
+    ],
+    "c": [
+        (re.compile(r"^(?:struct|class|union|enum)\s+(\w+)\s*[{:]?\s*$"), "type"),
+        (re.compile(r"^(?!return\b|if\b|else\b|while\b|for\b|switch\b)[A-Za-z_][\w\s*&:<>,]*?\b(\w+)\s*\([^;]*\)\s*(?:const\s*)?\{?\s*$"),
+         "function"),
+    ],
+}
+
+COMMENT_PREFIXES = ("///", "//", "#", "/**", "/*", "*")
+
+
+@dataclass
+class Symbol:
+    """Definition of a function, class or type"""
+    path: str
+    name: str
+    qualname: str
+    kind: str
+    line: int
+    signature: str
+    doc: Optional[str] = None
+    
+    def render(self) -> str:
+        """Render the definition for a prompt"""
+        text = f"# {self.path}:{self.line}\n{self.signature}"
+        if self.doc:
+            text += f"\n    \"\"\"{self.doc}\"\"\""
+        return text
+
+
+def _summarize_doc(doc: Optional[str]) -> Optional[str]:
+    """First paragraph of a docstring on one line"""
+    if not doc:
+        return None
+    summary = " ".join(doc.strip().split("\n\n")[0].split())
+    return summary[:MAX_DOC_CHARS] or None
+
+
+def extract_python_symbols(path: str, content: str) -> List[Symbol]:
+    """
+    Extract top-level functions and classes, and public methods, with ast.
+    
+    Args:
+        path: File path stored with the symbols
+        content: Python source
+    
+    Returns:
+        Symbols in definition order (empty if the file does not parse)
+    """
+    try:
+        tree = ast.parse(content)
+    except (SyntaxError, ValueError):
+        return []
+    
+    def function(node, owner: Optional[str] = None) -> Symbol:
+        prefix = "async def" if isinstance(node, ast.AsyncFunctionDef) else "def"
+        signature = f"{prefix} {node.name}({ast.unparse(node.args)})"
+        if node.returns is not None:
+            signature += f" -> {ast.unparse(node.returns)}"
+        qualname = f"{owner}.{node.name}" if owner else node.name
+        kind = "method" if owner else "function"
+        return Symbol(path, node.name, qualname, kind, node.lineno, signature, _summarize_doc(ast.get_docstring(node)))
+    
+    symbols = []
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            symbols.append(function(node))
+        elif isinstance(node, ast.ClassDef):
+            bases = ", ".join(ast.unparse(base) for base in node.bases + node.keywords)
+            signature = f"class {node.name}({bases})" if bases else f"class {node.name}"
+            symbols.append(Symbol(path, node.name, node.name, "class", node.lineno, signature,
+                                  _summarize_doc(ast.get_docstring(node))))
+            for member in node.body:
+                if isinstance(member, (ast.FunctionDef, ast.AsyncFunctionDef)) and \
+                        (not member.name.startswith("_") or member.name == "__init__"):
+                    symbols.append(function(member, owner=node.name))
+    return symbols
+
+
+def extract_regex_symbols(path: str, content: str, language: str) -> List[Symbol]:
+    """
+    Extract definitions with ctags-style line patterns.
+    
+    Comment lines directly above a definition are kept as its doc.
+    
+    Args:
+        path: File path stored with the symbols
+        content: Source text
+        language: Key of REGEX_PATTERNS
+    
+    Returns:
+        Symbols in definition order
+    """
+    symbols = []
+    lines = content.splitlines()
+    for number, text in enumerate(lines, 1):
+        for pattern, kind in REGEX_PATTERNS[language]:
+            match = pattern.match(text)
+            if not match:
+                continue
+            comments = []
+            for previous in reversed(lines[max(0, number - 6):number - 1]):
+                stripped = previous.strip()
+                if not stripped.startswith(COMMENT_PREFIXES):
+                    break
+                comments.insert(0, stripped.lstrip("/#* ").rstrip("*/ "))
+            signature = text.strip().rstrip("{").strip()
+            doc = _summarize_doc("\n".join(line for line in comments if line))
+            symbols.append(Symbol(path, match.group(1), match.group(1), kind, number, signature, doc))
+            break
+    return symbols
+
+
+def extract_symbols(path: str, content: str) -> List[Symbol]:
+    """Extract the definitions of a source file (empty for unsupported languages)"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".py":
+        return extract_python_symbols(path, content)
+    if extension in LANGUAGES:
+        return extract_regex_symbols(path, content, LANGUAGES[extension])
+    return []
+
+
+def repository_root(path: str = ".") -> Optional[str]:
+    """Top-level directory of the git work tree containing path (None outside git)"""
+    directory = path if os.path.isdir(path) else os.path.dirname(path) or "."
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            cwd=directory, capture_output=True, text=True, check=True
+        ).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def context_section(context: Optional[str]) -> str:
+    """Prompt section presenting referenced definitions (empty without context)"""
+    if not context:
+        return ""
+    return f"""
+
+Definitions referenced from other files (for context only - do not review them):
+
+```
+{context}
+```"""
+
+
+class SymbolIndex:
+    """SQLite index of definitions in a repository, updated incrementally"""
+    
+    def __init__(self, path: str, root: str):
+        """
+        Open (and create if needed) a symbol index.
+        
+        Args:
+            path: Database file path, or ":memory:"
+            root: Repository root that indexed paths are relative to
+        """
+        self.path = path
+        self.root = os.path.abspath(root)
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.executescript(SCHEMA)
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def for_repo(cls, path: str = ".") -> Optional["SymbolIndex"]:
+        """Return the index inside the state directory of the repository containing path (None outside git)"""
+        root = repository_root(path)
+        if root is None:
+            return None
+        return cls(os.path.join(root, config.get_state_dir(), "symbols.db"), root)
+    
+    def update(self) -> int:
+        """
+        Re-index files added or changed since the last update.
+        
+        Files whose size and mtime are unchanged are not read; files touched
+        without a content change (same blob SHA) are not re-parsed.
+        
+        Returns:
+            Number of files (re)indexed or removed
+        """
+        with self._lock:
+            known = {
+                row["path"]: row for row in self._connection.execute("SELECT * FROM files").fetchall()
+            }
+        changed = 0
+        seen: Set[str] = set()
+        with self._lock, self._connection:
+            for relative, stat in self._source_files():
+                seen.add(relative)
+                row = known.get(relative)
+                if row and row["mtime_ns"] == stat.st_mtime_ns and row["size"] == stat.st_size:
+                    continue
+                try:
+                    with open(os.path.join(self.root, relative), "r", encoding="utf-8", errors="replace") as f:
+                        content = f.read()
+                except OSError:
+                    continue
+                blob_sha = git_blob_sha(content)
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO files (path, mtime_ns, size, blob_sha) VALUES (?, ?, ?, ?)",
+                    (relative, stat.st_mtime_ns, stat.st_size, blob_sha)
+                )
+                if row and row["blob_sha"] == blob_sha:
+                    continue
+                self._replace_symbols(relative, extract_symbols(relative, content))
+                changed += 1
+            for relative in known.keys() - seen:
+                self._connection.execute("DELETE FROM files WHERE path = ?", (relative,))
+                self._connection.execute("DELETE FROM symbols WHERE path = ?", (relative,))
+                changed += 1
+        return changed
+    
+    def lookup(self, names: List[str]) -> Dict[str, List[Symbol]]:
+        """
+        Find the definitions of names.
+        
+        Returns:
+            Symbols per defined name
+        """
+        found: Dict[str, List[Symbol]] = {}
+        names = list(names)
+        with self._lock:
+            for start in range(0, len(names), 500):
+                chunk = names[start:start + 500]
+                rows = self._connection.execute(
+                    f"SELECT * FROM symbols WHERE name IN ({','.join('?' * len(chunk))}) ORDER BY path, line",
+                    chunk
+                ).fetchall()
+                for row in rows:
+                    found.setdefault(row["name"], []).append(Symbol(
+                        row["path"], row["name"], row["qualname"], row["kind"], row["line"],
+                        row["signature"], row["doc"]
+                    ))
+        return found
+    
+    def context_for(self, source_file: SourceFile, token_budget: int) -> str:
+        """
+        Pack the definitions a file refers to into a prompt-sized block.
+        
+        Names are ranked by how often the file uses them; methods are only
+        included when their class is referenced too, and definitions in the
+        file itself are left out.
+        
+        Args:
+            source_file: File or diff under review
+            token_budget: Maximum estimated tokens of the block
+        
+        Returns:
+            Rendered definitions, or "" if none fit or none are referenced
+        """
+        if token_budget <= 0 or not source_file.content:
+            return ""
+        path = self._relative(source_file.path)
+        references = Counter(re.findall(r"\b[A-Za-z_]\w{2,}\b", source_file.content))
+        definitions = self.lookup(list(references))
+        
+        candidates = []
+        for name, symbols in definitions.items():
+            symbols = [s for s in symbols if s.path != path and
+                       (s.kind != "method" or s.qualname.split(".")[0] in references)]
+            # Prefer definitions close to the reviewed file
+            symbols.sort(key=lambda s: -len(os.path.commonprefix([s.path, path])))
+            for symbol in symbols[:MAX_DEFINITIONS_PER_NAME]:
+                candidates.append((symbol.kind == "method", -references[name], symbol.path, symbol.line, symbol))
+        candidates.sort(key=lambda candidate: candidate[:4])
+        
+        blocks = []
+        used = 0
+        for *_, symbol in candidates:
+            block = symbol.render()
+            cost = estimate_tokens(block) + 1
+            if used + cost > token_budget:
+                continue
+            blocks.append(block)
+            used += cost
+        return "\n\n".join(blocks)
+    
+    def close(self) -> None:
+        """Close the database connection"""
+        self._connection.close()
+    
+    def _replace_symbols(self, path: str, symbols: List[Symbol]) -> None:
+        self._connection.execute("DELETE FROM symbols WHERE path = ?", (path,))
+        self._connection.executemany(
+            "INSERT INTO symbols (path, name, qualname, kind, line, signature, doc) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(s.path, s.name, s.qualname, s.kind, s.line, s.signature, s.doc) for s in symbols]
+        )
+    
+    def _source_files(self) -> Iterator[tuple]:
+        """Yield (relative path, stat) of indexable files git tracks or would track under the root"""
+        try:
+            listing = subprocess.run(
+                ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+                cwd=self.root, capture_output=True, check=True
+            ).stdout.decode("utf-8", errors="replace")
+        except (OSError, subprocess.CalledProcessError):
+            return
+        # Unmerged files are listed once per conflict stage
+        for relative in dict.fromkeys(listing.split("\0")):
+            directories, name = os.path.split(relative)
+            if not name or any(is_ignored_dir(part) for part in directories.split("/") if part):
+                continue
+            extension = os.path.splitext(name)[1].lower()
+            if extension != ".py" and extension not in LANGUAGES:
+                continue
+            try:
+                stat = os.stat(os.path.join(self.root, relative))
+            except OSError:
+                continue
+            if stat.st_size <= MAX_FILE_BYTES:
+                yield relative, stat
+    
+    def _relative(self, path: str) -> str:
+        """Index path of a reviewed file (diff paths are already repository-relative)"""
+        if os.path.exists(path):
+            return os.path.relpath(os.path.abspath(path), self.root).replace(os.sep, "/")
+        return path.replace(os.sep, "/")
@@ -0,0 +1,19 @@
+"""Token Estimator - Fast local token count estimates"""
+
+# Average characters per token for code-heavy prompts
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in text without calling the provider.
+    
+    Args:
+        text: Text to estimate
+        
+    Returns:
+        Estimated token count (0 for empty text)
+    """
+    if not text:
+        return 0
+    return max(1, len(text) // CHARS_PER_TOKEN)
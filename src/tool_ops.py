@@ -1,9 +1,13 @@
 """Tool Operations - File reading and basic operations"""
 
+import hashlib
+import json
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
+from .tracing import traced
 
 
+@traced("file.read")
 def read_file_content(file_path: str) -> Optional[str]:
     """
     Read file content safely with proper error handling.
@@ -64,3 +68,70 @@ def is_text_file(file_path: str) -> bool:
     
     path = Path(file_path)
     return path.suffix.lower() in text_extensions
+
+
+def append_jsonl(file_path: str, record: dict) -> None:
+    """
+    Append a record to a JSON Lines file, flushing it to disk immediately.
+    
+    Args:
+        file_path: Path to the JSONL file (created if missing)
+        record: JSON-serializable record to append
+    """
+    path = Path(file_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record) + "\n")
+        f.flush()
+
+
+def read_jsonl(file_path: str) -> Iterator[dict]:
+    """
+    Read records from a JSON Lines file, skipping a truncated trailing line.
+    
+    Args:
+        file_path: Path to the JSONL file
+        
+    Yields:
+        Parsed records (nothing if the file does not exist)
+    """
+    path = Path(file_path)
+    if not path.exists():
+        return
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # A crash mid-write leaves a partial last line
+                continue
+
+
+def git_blob_sha(content: str) -> str:
+    """
+    Hash content the way git hashes blobs.
+    
+    For full-file reviews this equals the file's blob SHA in git, so branches
+    sharing a blob share stored results.
+    
+    Args:
+        content: Reviewed text
+    
+    Returns:
+        40-character hex SHA-1
+    """
+    data = content.encode("utf-8")
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+# Directories never scanned for source files (hidden directories are skipped too)
+IGNORED_DIRS = {"__pycache__", "node_modules", "venv"}
+
+
+def is_ignored_dir(name: str) -> bool:
+    """Check whether a directory holds tool state, dependencies or build output"""
+    return name.startswith(".") or name in IGNORED_DIRS
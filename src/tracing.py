@@ -0,0 +1,122 @@
+"""Tracing - Lightweight stage spans exported as Chrome trace JSON"""
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+
+class Tracer:
+    """Collect timed spans for pipeline stages"""
+    
+    def __init__(self):
+        """Initialize a disabled tracer"""
+        self.enabled = False
+        self.spans: List[Dict[str, Any]] = []
+        self._epoch = time.perf_counter()
+        self._lock = threading.Lock()
+    
+    def enable(self) -> None:
+        """Start recording spans"""
+        self.enabled = True
+    
+    def reset(self) -> None:
+        """Discard recorded spans and disable recording"""
+        with self._lock:
+            self.spans = []
+        self.enabled = False
+        self._epoch = time.perf_counter()
+    
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Dict[str, Any]]:
+        """
+        Time a block of code.
+        
+        Args:
+            name: Span name, e.g. "llm.send_message"
+            **attributes: Attributes recorded with the span
+        
+        Yields:
+            Mutable attribute dict; values added inside the block are recorded too
+        """
+        if not self.enabled:
+            yield attributes
+            return
+        
+        start = time.perf_counter()
+        try:
+            yield attributes
+        except BaseException as e:
+            attributes["error"] = str(e)
+            raise
+        finally:
+            end = time.perf_counter()
+            span = {
+                "name": name,
+                "start": start - self._epoch,
+                "duration": end - start,
+                "thread": threading.get_ident(),
+                "attributes": attributes,
+            }
+            with self._lock:
+                self.spans.append(span)
+    
+    def export_chrome_trace(self, file_path: str) -> None:
+        """
+        Write recorded spans in Chrome trace event format.
+        
+        The file can be opened in chrome://tracing or https://ui.perfetto.dev.
+        
+        Args:
+            file_path: Output JSON path
+        """
+        with self._lock:
+            spans = list(self.spans)
+        
+        pid = os.getpid()
+        events = [{
+            "name": span["name"],
+            "cat": span["name"].split(".")[0],
+            "ph": "X",
+            "ts": round(span["start"] * 1_000_000),
+            "dur": round(span["duration"] * 1_000_000),
+            "pid": pid,
+            "tid": span["thread"],
+            "args": {key: _jsonable(value) for key, value in span["attributes"].items()},
+        } for span in spans]
+        
+        path = Path(file_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+def traced(name: str):
+    """
+    Decorator recording a span around every call of a function.
+    
+    Args:
+        name: Span name
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with tracer.span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _jsonable(value: Any) -> Any:
+    """Convert attribute values that json cannot encode to strings"""
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+# Global tracer instance
+tracer = Tracer()
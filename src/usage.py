@@ -0,0 +1,190 @@
+"""Usage Accounting - Token, cost and latency records for LLM requests"""
+
+import json
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+
+@dataclass
+class UsageRecord:
+    """Usage of a single LLM request"""
+    model: str
+    prompt_tokens: int
+    completion_tokens: int
+    latency: float
+    cache_hit: bool = False
+    cost: float = 0.0
+    file_path: Optional[str] = None
+    hedge: bool = False
+    
+    @property
+    def total_tokens(self) -> int:
+        """Prompt plus completion tokens"""
+        return self.prompt_tokens + self.completion_tokens
+
+
+@dataclass
+class UsageTotals:
+    """Aggregated usage over many requests"""
+    requests: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency: float = 0.0
+    cache_hits: int = 0
+    cost: float = 0.0
+    hedge_requests: int = 0
+    hedge_tokens: int = 0
+    
+    @property
+    def total_tokens(self) -> int:
+        """Prompt plus completion tokens"""
+        return self.prompt_tokens + self.completion_tokens
+    
+    def add(self, record: UsageRecord) -> None:
+        """Add a request to the totals"""
+        self.requests += 1
+        self.prompt_tokens += record.prompt_tokens
+        self.completion_tokens += record.completion_tokens
+        self.latency += record.latency
+        self.cache_hits += int(record.cache_hit)
+        self.cost += record.cost
+        if record.hedge:
+            self.hedge_requests += 1
+            self.hedge_tokens += record.total_tokens
+
+
+_scope = threading.local()
+
+
+class UsageTracker:
+    """Collect usage records for a run, attributed to the file being reviewed"""
+    
+    def __init__(self, on_record: Optional[Callable[[UsageRecord], None]] = None):
+        """
+        Initialize an empty tracker.
+        
+        Args:
+            on_record: Optional callback receiving each record as it is added
+        """
+        self.on_record = on_record
+        self.records: List[UsageRecord] = []
+        self._file_totals: Dict[str, UsageTotals] = defaultdict(UsageTotals)
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def file_scope(self, file_path: str) -> Iterator[None]:
+        """
+        Attribute LLM requests made by the current thread to a file.
+        
+        Args:
+            file_path: File whose review is about to run
+        """
+        previous = getattr(_scope, "active", None)
+        _scope.active = (self, file_path)
+        try:
+            yield
+        finally:
+            _scope.active = previous
+    
+    def add(self, record: UsageRecord) -> None:
+        """Store a usage record"""
+        with self._lock:
+            self.records.append(record)
+            self._file_totals[record.file_path].add(record)
+        if self.on_record:
+            self.on_record(record)
+    
+    def totals(self) -> UsageTotals:
+        """Aggregate usage for the whole run"""
+        totals = UsageTotals()
+        for record in self._snapshot():
+            totals.add(record)
+        return totals
+    
+    def file_totals(self, file_path: str) -> UsageTotals:
+        """Aggregate usage for one file"""
+        with self._lock:
+            totals = self._file_totals.get(file_path)
+            return replace(totals) if totals else UsageTotals()
+    
+    def by_file(self) -> Dict[str, UsageTotals]:
+        """Aggregate usage per reviewed file"""
+        return self._group(lambda record: record.file_path or "(unattributed)")
+    
+    def by_file_type(self) -> Dict[str, UsageTotals]:
+        """Aggregate usage per file extension"""
+        return self._group(lambda record: Path(record.file_path or "").suffix or "(none)")
+    
+    def to_dict(self) -> dict:
+        """Convert usage to a JSON-serializable report"""
+        def totals_dict(totals: UsageTotals) -> dict:
+            return dict(asdict(totals), total_tokens=totals.total_tokens)
+        
+        return {
+            "run": totals_dict(self.totals()),
+            "by_file": {key: totals_dict(value) for key, value in self.by_file().items()},
+            "by_file_type": {key: totals_dict(value) for key, value in self.by_file_type().items()},
+            "requests": [asdict(record) for record in self._snapshot()],
+        }
+    
+    def dump_json(self, file_path: str) -> None:
+        """Write the usage report as JSON"""
+        path = Path(file_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+    
+    def _group(self, key) -> Dict[str, UsageTotals]:
+        groups: Dict[str, UsageTotals] = defaultdict(UsageTotals)
+        for record in self._snapshot():
+            groups[key(record)].add(record)
+        return dict(groups)
+    
+    def _snapshot(self) -> List[UsageRecord]:
+        with self._lock:
+            return list(self.records)
+
+
+def current_scope() -> Optional[tuple]:
+    """Return the current thread's (tracker, file_path) scope, if any"""
+    return getattr(_scope, "active", None)
+
+
+@contextmanager
+def use_scope(scope: Optional[tuple]) -> Iterator[None]:
+    """
+    Attribute LLM requests made by the current thread to a captured scope.
+    
+    Args:
+        scope: Scope captured with current_scope() on the thread that started
+            the work (None leaves requests unattributed)
+    """
+    previous = getattr(_scope, "active", None)
+    _scope.active = scope
+    try:
+        yield
+    finally:
+        _scope.active = previous
+
+
+def record_usage(record: UsageRecord, scope: Optional[tuple] = None) -> None:
+    """
+    Add a usage record to the tracker of the current thread's file scope.
+    
+    Requests made outside any file scope are not recorded.
+    
+    Args:
+        record: Usage of one LLM request (file_path is filled in from the scope)
+        scope: Scope captured with current_scope(), for records added from
+            another thread
+    """
+    active = scope or current_scope()
+    if active is None:
+        return
+    tracker, file_path = active
+    record.file_path = file_path
+    tracker.add(record)
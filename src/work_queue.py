@@ -0,0 +1,345 @@
+"""Work Queue - Crash-safe SQLite task queue for a farm of review workers"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+from .aspect_review import configured_aspects
+from .config import config
+from .review_orchestrator import ReviewOrchestrator, ReviewResult
+from .source_collector import SourceFile
+
+
+# Attempts before a task that keeps failing or losing its lease is given up
+MAX_ATTEMPTS = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    batch_id TEXT NOT NULL,
+    source_file TEXT NOT NULL,
+    model TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires REAL,
+    result TEXT,
+    enqueued_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status, id);
+CREATE INDEX IF NOT EXISTS idx_tasks_batch ON tasks(batch_id);
+"""
+
+
+@dataclass
+class QueueTask:
+    """Review task claimed by a worker"""
+    task_id: int
+    batch_id: str
+    source_file: SourceFile
+    model: Optional[str]
+    attempts: int
+
+
+class WorkQueue:
+    """SQLite (WAL) queue of file reviews with leases"""
+    
+    def __init__(self, path: str, lease_seconds: float = 300.0,
+                 max_attempts: int = MAX_ATTEMPTS, clock: Callable[[], float] = time.time):
+        """
+        Open (and create if needed) a work queue.
+        
+        Args:
+            path: Database file path
+            lease_seconds: How long a claim lasts without being renewed
+            max_attempts: Claims allowed per task before it is marked failed
+            clock: Wall-clock time source (shared between hosts, so not monotonic)
+        """
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.clock = clock
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # Autocommit mode; write transactions are opened explicitly with BEGIN IMMEDIATE
+        self._connection = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(SCHEMA)
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def default(cls, **kwargs) -> "WorkQueue":
+        """Return the queue in the current directory's state directory"""
+        return cls(os.path.join(config.get_state_dir(), "queue.db"), **kwargs)
+    
+    def enqueue(self, source_files: List[SourceFile], model: Optional[str] = None) -> str:
+        """
+        Add file reviews to the queue.
+        
+        Args:
+            source_files: Files to review
+            model: Optional model override for the workers
+        
+        Returns:
+            Batch id identifying the enqueued tasks
+        """
+        batch_id = uuid.uuid4().hex[:12]
+        now = self.clock()
+        with self._transaction() as connection:
+            connection.executemany(
+                "INSERT INTO tasks (batch_id, source_file, model, enqueued_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+                [(batch_id, json.dumps(source_file.to_dict()), model, now, now) for source_file in source_files]
+            )
+        return batch_id
+    
+    def claim(self, worker_id: str) -> Optional[QueueTask]:
+        """
+        Lease the oldest pending task, reclaiming expired leases first.
+        
+        Args:
+            worker_id: Identifier of the claiming worker
+        
+        Returns:
+            Claimed task, or None if nothing is pending
+        """
+        now = self.clock()
+        with self._transaction() as connection:
+            self._reclaim_expired(connection, now)
+            row = connection.execute(
+                "SELECT * FROM tasks WHERE status = 'pending' ORDER BY id LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE tasks SET status = 'leased', lease_owner = ?, lease_expires = ?, "
+                "attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                (worker_id, now + self.lease_seconds, now, row["id"])
+            )
+        return QueueTask(
+            task_id=row["id"],
+            batch_id=row["batch_id"],
+            source_file=SourceFile.from_dict(json.loads(row["source_file"])),
+            model=row["model"],
+            attempts=row["attempts"] + 1
+        )
+    
+    def renew(self, task_id: int, worker_id: str) -> bool:
+        """
+        Extend a lease held by a worker.
+        
+        Returns:
+            False if the lease was lost to another worker
+        """
+        now = self.clock()
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                "UPDATE tasks SET lease_expires = ?, updated_at = ? "
+                "WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (now + self.lease_seconds, now, task_id, worker_id)
+            )
+        return cursor.rowcount == 1
+    
+    def complete(self, task_id: int, worker_id: str, result: ReviewResult) -> bool:
+        """
+        Store the result of a task.
+        
+        A straggler whose lease was reclaimed may still finish; its result is
+        kept unless another worker already completed the task.
+        
+        Returns:
+            True if the result was stored
+        """
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                "UPDATE tasks SET status = 'done', result = ?, lease_owner = ?, lease_expires = NULL, "
+                "updated_at = ? WHERE id = ? AND status != 'done'",
+                (json.dumps(result.to_dict()), worker_id, self.clock(), task_id)
+            )
+        return cursor.rowcount == 1
+    
+    def fail(self, task_id: int, worker_id: str, result: ReviewResult) -> None:
+        """Release a failed task for retry, or mark it failed after max_attempts"""
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE tasks SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "result = ?, lease_owner = NULL, lease_expires = NULL, updated_at = ? "
+                "WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (self.max_attempts, json.dumps(result.to_dict()), self.clock(), task_id, worker_id)
+            )
+    
+    def release(self, task_id: int, worker_id: str) -> None:
+        """Return a leased task to the queue without counting the attempt"""
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE tasks SET status = 'pending', attempts = attempts - 1, lease_owner = NULL, "
+                "lease_expires = NULL, updated_at = ? WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (self.clock(), task_id, worker_id)
+            )
+    
+    def counts(self, batch_id: Optional[str] = None) -> Dict[str, int]:
+        """Number of tasks per status, optionally for one batch"""
+        query = "SELECT status, COUNT(*) AS n FROM tasks"
+        params: tuple = ()
+        if batch_id:
+            query += " WHERE batch_id = ?"
+            params = (batch_id,)
+        with self._lock:
+            rows = self._connection.execute(query + " GROUP BY status", params).fetchall()
+        return {row["status"]: row["n"] for row in rows}
+    
+    def results(self, batch_id: str) -> List[ReviewResult]:
+        """Results of finished (done or failed) tasks of a batch, in enqueue order"""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT result FROM tasks WHERE batch_id = ? AND status IN ('done', 'failed') ORDER BY id",
+                (batch_id,)
+            ).fetchall()
+        return [ReviewResult.from_dict(json.loads(row["result"])) for row in rows]
+    
+    def close(self) -> None:
+        """Close the database connection"""
+        self._connection.close()
+    
+    def _reclaim_expired(self, connection: sqlite3.Connection, now: float) -> None:
+        """Return tasks of dead or stalled workers to the queue"""
+        connection.execute(
+            "UPDATE tasks SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+            "lease_owner = NULL, lease_expires = NULL, updated_at = ? "
+            "WHERE status = 'leased' AND lease_expires < ?",
+            (self.max_attempts, now, now)
+        )
+        # Tasks given up on still need a result for the producer
+        for row in connection.execute(
+                "SELECT id, source_file FROM tasks WHERE status = 'failed' AND result IS NULL").fetchall():
+            path = json.loads(row["source_file"])["path"]
+            result = ReviewResult(path, "Review failed: worker lease expired too many times", False)
+            connection.execute("UPDATE tasks SET result = ? WHERE id = ?", (json.dumps(result.to_dict()), row["id"]))
+    
+    def _transaction(self):
+        return _Transaction(self._connection, self._lock)
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT block serialized across threads and processes"""
+    
+    def __init__(self, connection: sqlite3.Connection, lock: threading.Lock):
+        self.connection = connection
+        self.lock = lock
+    
+    def __enter__(self) -> sqlite3.Connection:
+        self.lock.acquire()
+        try:
+            self.connection.execute("BEGIN IMMEDIATE")
+        except BaseException:
+            self.lock.release()
+            raise
+        return self.connection
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self.connection.execute("ROLLBACK" if exc_type else "COMMIT")
+        finally:
+            self.lock.release()
+
+
+class QueueWorker:
+    """Claim tasks from a work queue and review them until stopped"""
+    
+    def __init__(self, queue: WorkQueue, service=None, worker_id: Optional[str] = None,
+                 on_task_done: Optional[Callable[[QueueTask, ReviewResult], None]] = None):
+        """
+        Initialize queue worker.
+        
+        Args:
+            queue: Work queue to consume
+            service: ReviewService providing warm LLM clients (default: new service)
+            worker_id: Lease owner name (default: host:pid:random)
+            on_task_done: Optional callback receiving each task and its result
+        """
+        if service is None:
+            # Imported here so queue producers never import litellm
+            from .review_server import ReviewService
+            service = ReviewService()
+        self.queue = queue
+        self.service = service
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.on_task_done = on_task_done
+        self._stop = threading.Event()
+    
+    def run(self, drain: bool = False, poll_interval: float = 1.0) -> int:
+        """
+        Process tasks.
+        
+        Args:
+            drain: Return once the queue has no pending task instead of polling
+            poll_interval: Seconds to wait before polling an empty queue again
+        
+        Returns:
+            Number of tasks processed
+        """
+        processed = 0
+        while not self._stop.is_set():
+            task = self.queue.claim(self.worker_id)
+            if task is None:
+                if drain:
+                    break
+                self._stop.wait(poll_interval)
+                continue
+            if self.process(task) is None:
+                self._stop.wait(poll_interval)
+                continue
+            processed += 1
+        return processed
+    
+    def stop(self) -> None:
+        """Ask run() to return after the current task"""
+        self._stop.set()
+    
+    def process(self, task: QueueTask) -> Optional[ReviewResult]:
+        """
+        Review one claimed task, renewing its lease while the review runs.
+        
+        Returns:
+            Result, or None if the task was handed back unreviewed
+        """
+        done = threading.Event()
+        
+        def keep_lease() -> None:
+            while not done.wait(self.queue.lease_seconds / 3):
+                if not self.queue.renew(task.task_id, self.worker_id):
+                    return
+        
+        renewer = threading.Thread(target=keep_lease, daemon=True)
+        renewer.start()
+        try:
+            orchestrator = ReviewOrchestrator(
+                self.service.get_client(task.model),
+                circuit_breaker=self.service.get_breaker(task.model),
+                fallback_client=self.service.get_fallback_client(task.model),
+                aspects=configured_aspects(),
+                structured=config.get_structured_findings()
+            )
+            results = orchestrator.review([task.source_file])
+        finally:
+            done.set()
+            renewer.join()
+        
+        if not results:
+            # Provider circuit is open; hand the task back without using up an attempt
+            self.queue.release(task.task_id, self.worker_id)
+            return None
+        result = results[0]
+        if result.success:
+            self.queue.complete(task.task_id, self.worker_id, result)
+        else:
+            self.queue.fail(task.task_id, self.worker_id, result)
+        if self.on_task_done:
+            self.on_task_done(task, result)
+        return result
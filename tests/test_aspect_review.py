@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Unit tests for aspect-specialized reviews"""
+
+import threading
+import unittest
+from unittest.mock import Mock
+from src.aspect_review import merge_findings, parse_aspects, review_aspects
+from src.llm_client import LLMClient
+from src.review_orchestrator import ReviewOrchestrator
+from src.source_collector import SourceFile
+from src.usage import UsageRecord, UsageTracker, record_usage
+
+
+class TestParseAspects(unittest.TestCase):
+    
+    def test_parse_list_and_all(self):
+        """Test aspect lists are normalized and 'all' expands"""
+        self.assertEqual(parse_aspects("Security, bugs,security"), ["security", "bugs"])
+        self.assertEqual(len(parse_aspects("all")), 5)
+    
+    def test_unknown_aspect_rejected(self):
+        """Test unknown aspects are input errors"""
+        with self.assertRaises(ValueError):
+            parse_aspects("bugs,style")
+
+
+class TestMergeFindings(unittest.TestCase):
+    
+    def test_duplicates_merged_and_tagged(self):
+        """Test similar findings on the same line are folded into one"""
+        findings = merge_findings([
+            ("bugs", "Line 3: Division by zero when count is 0"),
+            ("security", "Line 3: Possible division by zero if count is 0, crashing the handler\nLine 9: SQL injection"),
+            ("performance", "NONE"),
+        ])
+        
+        self.assertEqual([f.line for f in findings], [3, 9])
+        self.assertEqual(findings[0].aspects, ["bugs", "security"])
+        self.assertIn("crashing the handler", findings[0].message)
+        self.assertEqual(findings[1].format(), "Line 9: [security] SQL injection")
+    
+    def test_different_issues_on_same_line_kept(self):
+        """Test unrelated findings on one line stay separate"""
+        findings = merge_findings([
+            ("bugs", "Line 5: Off-by-one error in range bound"),
+            ("language", "Line 5: Typo 'recieve' in comment"),
+        ])
+        
+        self.assertEqual(len(findings), 2)
+
+
+class TestReviewAspects(unittest.TestCase):
+    
+    def setUp(self):
+        self.source_file = SourceFile("app.py", "x = 1 / n", 9, 1)
+        self.client = Mock(spec=LLMClient)
+        self.client.last_call_cached.return_value = False
+        self.threads = set()
+        
+        def send_message(message, system_prompt):
+            self.threads.add(threading.current_thread().name)
+            record_usage(UsageRecord("m", 10, 5, 0.1))
+            if "security" in system_prompt:
+                return "NONE"
+            return "Line 1: Division by zero when n is 0"
+        
+        self.client.send_message.side_effect = send_message
+    
+    def test_one_request_per_aspect(self):
+        """Test each aspect gets its own request on worker threads"""
+        content, cached = review_aspects(self.client, self.source_file, ["bugs", "security", "quality"])
+        
+        self.assertEqual(self.client.send_message.call_count, 3)
+        self.assertEqual(content, "Line 1: [bugs, quality] Division by zero when n is 0")
+        self.assertFalse(cached)
+        self.assertTrue(all(name.startswith("aspect") for name in self.threads))
+    
+    def test_orchestrator_attributes_aspect_usage_to_file(self):
+        """Test usage from aspect threads is attributed to the reviewed file"""
+        tracker = UsageTracker()
+        orchestrator = ReviewOrchestrator(self.client, usage_tracker=tracker, aspects=["bugs", "security"])
+        
+        results = orchestrator.review([self.source_file])
+        
+        self.assertTrue(results[0].success)
+        self.assertIn("[bugs]", results[0].review_content)
+        self.assertEqual(tracker.file_totals("app.py").requests, 2)
+        self.client.code_review.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
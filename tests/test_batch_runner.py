@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Unit tests for Batch Runner"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock
+from src.batch_runner import BatchRunner, BatchJob, load_jobs
+from src.llm_client import LLMClient
+from src.review_server import ReviewService
+from src.tool_ops import read_jsonl
+
+
+class TestLoadJobs(unittest.TestCase):
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.jobs_path = os.path.join(self.temp_dir.name, "jobs.jsonl")
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def write_jobs(self, *specs):
+        with open(self.jobs_path, "w") as f:
+            for spec in specs:
+                f.write(json.dumps(spec) + "\n")
+    
+    def test_load_jobs_with_defaults(self):
+        """Test job ids are derived from the spec when missing"""
+        self.write_jobs(
+            {"repo": "/r", "mode": "branch", "ref": "feature", "model": "m"},
+            {"id": "custom", "repo": "/r", "mode": "diff"}
+        )
+        
+        jobs = load_jobs(self.jobs_path)
+        
+        self.assertEqual(jobs[0].job_id, "/r:branch:feature:m")
+        self.assertEqual(jobs[1].job_id, "custom")
+        self.assertIsNone(jobs[1].ref)
+    
+    def test_load_jobs_rejects_invalid_specs(self):
+        """Test validation of mode and ref"""
+        self.write_jobs({"repo": "/r", "mode": "tree"})
+        with self.assertRaises(ValueError):
+            load_jobs(self.jobs_path)
+        
+        self.write_jobs({"repo": "/r", "mode": "commit"})
+        with self.assertRaises(ValueError):
+            load_jobs(self.jobs_path)
+    
+    def test_load_jobs_rejects_malformed_lines(self):
+        """Test bad JSON fails with its line number instead of dropping the job"""
+        with open(self.jobs_path, "w") as f:
+            f.write('{"repo": "/r"}\n\n{"repo": "/r", "mode": \n[1, 2]\n')
+        
+        with self.assertRaisesRegex(ValueError, "Job 3: invalid JSON"):
+            load_jobs(self.jobs_path)
+        
+        with open(self.jobs_path, "w") as f:
+            f.write('{"repo": "/r"}\n[1, 2]\n')
+        with self.assertRaisesRegex(ValueError, "Job 2: expected a JSON object"):
+            load_jobs(self.jobs_path)
+
+
+class TestBatchRunner(unittest.TestCase):
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.repo = self.temp_dir.name
+        for name in ("a.py", "b.py"):
+            with open(os.path.join(self.repo, name), "w") as f:
+                f.write("x = 1\n")
+        self.output = os.path.join(self.repo, "out.jsonl")
+        
+        self.mock_client = Mock(spec=LLMClient)
+        self.mock_client.code_review.return_value = "Line 1: Issue"
+        self.mock_client.last_call_cached.return_value = False
+        self.service = ReviewService()
+        self.service.get_client = Mock(return_value=self.mock_client)
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def test_run_writes_results_incrementally(self):
+        """Test each job writes its results and a completion marker"""
+        jobs = [BatchJob("a", self.repo, "file", "a.py"), BatchJob("b", self.repo, "file", "b.py")]
+        runner = BatchRunner(self.output, max_workers=2, service=self.service)
+        
+        summary = runner.run(jobs)
+        
+        self.assertEqual((summary.completed, summary.failed, summary.files_reviewed), (2, 0, 2))
+        records = list(read_jsonl(self.output))
+        self.assertEqual(len([r for r in records if "result" in r]), 2)
+        self.assertEqual(sorted(r["job_id"] for r in records if r.get("status") == "done"), ["a", "b"])
+    
+    def test_resume_skips_finished_jobs(self):
+        """Test that a second run skips jobs already marked done"""
+        jobs = [BatchJob("a", self.repo, "file", "a.py")]
+        BatchRunner(self.output, service=self.service).run(jobs)
+        
+        summary = BatchRunner(self.output, service=self.service).run(
+            jobs + [BatchJob("b", self.repo, "file", "b.py")]
+        )
+        
+        self.assertEqual((summary.skipped, summary.completed), (1, 1))
+        self.assertEqual(self.mock_client.code_review.call_count, 2)
+    
+    def test_failed_reviews_are_retried_on_resume(self):
+        """Test a job with failed file reviews is not marked done and is re-run on resume"""
+        jobs = [BatchJob("a", self.repo, "file", "a.py"), BatchJob("b", self.repo, "file", "b.py")]
+        
+        def review(content, path, **kwargs):
+            if path.endswith("a.py"):
+                raise TimeoutError("timed out")
+            return "Line 1: Issue"
+        
+        self.mock_client.code_review.side_effect = review
+        first = BatchRunner(self.output, service=self.service).run(jobs)
+        self.mock_client.code_review.side_effect = None
+        second = BatchRunner(self.output, service=self.service).run(jobs)
+        
+        self.assertEqual((first.completed, first.failed), (1, 1))
+        failed = [r for r in read_jsonl(self.output) if r.get("status") == "failed"]
+        self.assertIn("1 file reviews failed", failed[0]["error"])
+        self.assertEqual((second.skipped, second.completed, second.failed), (1, 1, 0))
+    
+    def test_failed_job_is_recorded(self):
+        """Test that collection errors fail the job without stopping the batch"""
+        jobs = [BatchJob("missing", self.repo, "file", "missing.py"), BatchJob("a", self.repo, "file", "a.py")]
+        done = []
+        
+        summary = BatchRunner(self.output, service=self.service,
+                              on_job_done=lambda job, status: done.append(status)).run(jobs)
+        
+        self.assertEqual((summary.completed, summary.failed), (1, 1))
+        self.assertEqual(sorted(done), ["done", "failed"])
+        failed = [r for r in read_jsonl(self.output) if r.get("status") == "failed"]
+        self.assertIn("not found", failed[0]["error"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Unit tests for LLM cassette recording and replay"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+from src.cassette import Cassette, make_request_key
+from src.llm_client import LLMClient
+
+
+class TestCassette(unittest.TestCase):
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.directory = os.path.join(self.temp_dir, "session")
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+    
+    def _record(self, *contents):
+        """Record one review per content through a client with a mocked provider"""
+        with patch('src.llm_client.completion') as mock_completion:
+            responses = []
+            for content in contents:
+                response = MagicMock()
+                response.choices[0].message.content = content
+                response.usage.prompt_tokens = 100
+                response.usage.completion_tokens = 20
+                responses.append(response)
+            mock_completion.side_effect = responses
+            client = LLMClient(cassette=Cassette(self.directory, "record"))
+            return [client.code_review("x = 1", "a.py") for _ in contents]
+    
+    def test_replay_serves_recorded_response_offline(self):
+        """Test replayed reviews match the recording without calling the provider"""
+        recorded = self._record("Line 1: Unused variable")
+        
+        with patch('src.llm_client.completion') as mock_completion:
+            client = LLMClient(model="other/model", cassette=Cassette(self.directory))
+            replayed = client.code_review("x = 1", "a.py")
+        
+        self.assertEqual(replayed, recorded[0])
+        mock_completion.assert_not_called()
+    
+    def test_repeated_requests_replay_in_order(self):
+        """Test identical requests are served in recording order, then the last repeats"""
+        self._record("first", "second")
+        client = LLMClient(cassette=Cassette(self.directory))
+        
+        replayed = [client.code_review("x = 1", "a.py") for _ in range(3)]
+        
+        self.assertEqual(replayed, ["first", "second", "second"])
+    
+    def test_unrecorded_request_fails(self):
+        """Test a request missing from the cassette raises instead of going online"""
+        self._record("Line 1: Unused variable")
+        client = LLMClient(cassette=Cassette(self.directory))
+        
+        with self.assertRaises(Exception) as context:
+            client.code_review("y = 2", "b.py")
+        self.assertIn("No recorded response", str(context.exception))
+    
+    def test_realtime_replay_waits_recorded_latency(self):
+        """Test realtime replay sleeps for the recorded latency"""
+        self._record("Line 1: Unused variable")
+        cassette = Cassette(self.directory, realtime=True)
+        messages = [{"role": "user", "content": "hi"}]
+        cassette._interactions = {make_request_key(messages, {}): [{
+            "model": "m", "content": "ok", "prompt_tokens": 1, "completion_tokens": 1, "latency": 1.5
+        }]}
+        
+        with patch('src.cassette.time.sleep') as mock_sleep:
+            response = cassette.play(messages, {})
+        
+        mock_sleep.assert_called_once_with(1.5)
+        self.assertEqual(response.choices[0].message.content, "ok")
+    
+    def test_empty_cassette_rejected(self):
+        """Test replaying a directory without recordings is an input error"""
+        with self.assertRaises(ValueError):
+            Cassette(self.directory)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Unit tests for local change pre-analysis"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from src.change_analyzer import (
+    ChangeAnalyzer, ChangeClass, classify_python, classify_text, hints_section, lint_python
+)
+from src.git_operations import GitOperations
+from src.input_parser import ReviewInput, ReviewType
+from src.source_collector import SourceCollector
+
+
+ORIGINAL = '''"""Module doc"""
+import os
+import sys
+
+__version__ = "1.2.0"
+
+
+def run(path):
+    """Run it"""
+    return os.path.join(sys.prefix, path)
+'''
+
+
+class TestClassifyPython(unittest.TestCase):
+    
+    def test_formatting_and_comments_are_noop(self):
+        """Test changes that leave the syntax tree equal are no-ops"""
+        changed = ORIGINAL.replace("return os.path.join(sys.prefix, path)",
+                                   "# Join under the prefix\n    return os.path.join(\n        sys.prefix,\n        path,\n    )")
+        
+        self.assertEqual(classify_python(ORIGINAL, changed)[0], ChangeClass.NOOP)
+    
+    def test_trivial_changes(self):
+        """Test docstring edits, import reordering and version bumps are trivial"""
+        cases = {
+            "docstrings only": ORIGINAL.replace('"""Run it"""', '"""Run the tool on a path"""'),
+            "imports reordered": ORIGINAL.replace("import os\nimport sys", "import sys\nimport os"),
+            "version bump": ORIGINAL.replace("1.2.0", "1.3.0"),
+        }
+        for reason, changed in cases.items():
+            self.assertEqual(classify_python(ORIGINAL, changed), (ChangeClass.TRIVIAL, reason))
+    
+    def test_logic_change_is_substantive(self):
+        """Test real code changes and unparsable files go to review"""
+        self.assertEqual(classify_python(ORIGINAL, ORIGINAL.replace("sys.prefix", "sys.exec_prefix"))[0],
+                         ChangeClass.SUBSTANTIVE)
+        self.assertEqual(classify_python(ORIGINAL, "def broken(:\n")[0], ChangeClass.SUBSTANTIVE)
+
+
+class TestClassifyText(unittest.TestCase):
+    
+    def test_comments_and_whitespace(self):
+        """Test comment and whitespace edits are no-ops outside strings"""
+        old = 'function f(a) {\n  return a + 1; // add\n}\n'
+        
+        self.assertEqual(classify_text("f.js", old, '/* doc */\nfunction f(a){\n    return a+1;\n}\n')[0],
+                         ChangeClass.NOOP)
+        self.assertEqual(classify_text("f.js", old, old.replace("a + 1", "a + 2"))[0], ChangeClass.SUBSTANTIVE)
+        self.assertEqual(classify_text("f.js", 'log("// a")', 'log("// b")')[0], ChangeClass.SUBSTANTIVE)
+    
+    def test_indentation_matters_where_it_is_syntax(self):
+        """Test YAML re-indentation is not a no-op"""
+        old = "build:\n  steps:\n    - run: make\n"
+        new = "build:\n  steps:\n  - run: make\n"
+        
+        self.assertEqual(classify_text("ci.yml", old, new)[0], ChangeClass.SUBSTANTIVE)
+        self.assertEqual(classify_text("ci.yml", old, old + "# trailing comment\n")[0], ChangeClass.NOOP)
+    
+    def test_version_bump_and_import_order(self):
+        """Test version-only and import-order-only edits are trivial"""
+        package = '{\n  "name": "app",\n  "version": "1.4.2"\n}\n'
+        self.assertEqual(classify_text("package.json", package, package.replace("1.4.2", "1.5.0")),
+                         (ChangeClass.TRIVIAL, "version bump"))
+        self.assertEqual(classify_text("main.go", "x := 1.5\n", "x := 2.5\n")[0], ChangeClass.SUBSTANTIVE)
+        
+        old = "import a from 'a';\nimport b from 'b';\nrun(a, b);\n"
+        new = "import b from 'b';\nimport a from 'a';\nrun(a, b);\n"
+        self.assertEqual(classify_text("app.js", old, new), (ChangeClass.TRIVIAL, "imports reordered"))
+
+
+class TestLintPython(unittest.TestCase):
+    
+    def test_common_mistakes(self):
+        """Test cheap checks report the line of each likely mistake"""
+        code = (
+            "import os\n"
+            "import json\n"
+            "def f(items=[]):\n"
+            "    try:\n"
+            "        return json.dumps(items) == None\n"
+            "    except:\n"
+            "        pass\n"
+        )
+        messages = dict(lint_python(code))
+        
+        self.assertIn("'os' imported but unused", messages[1])
+        self.assertNotIn(2, messages)
+        self.assertIn("Mutable default", messages[3])
+        self.assertIn("None", messages[5])
+        self.assertIn("Bare except", messages[6])
+        self.assertEqual(lint_python("import os\n", "pkg/__init__.py"), [])
+    
+    def test_hints_section(self):
+        """Test hints are presented for the model to confirm"""
+        self.assertEqual(hints_section(None), "")
+        self.assertIn("- Line 3: Bare except", hints_section(["Line 3: Bare except"]))
+
+
+class TestChangeAnalyzer(unittest.TestCase):
+    
+    def setUp(self):
+        self.repo = tempfile.mkdtemp()
+        self.git("init", "-q")
+        self.write("app.py", ORIGINAL)
+        self.write("README.md", "Hello world\n")
+        self.git("add", ".")
+        self.git("-c", "user.email=dev@example.com", "-c", "user.name=dev", "commit", "-qm", "base")
+    
+    def tearDown(self):
+        shutil.rmtree(self.repo)
+    
+    def git(self, *args):
+        subprocess.run(["git", *args], cwd=self.repo, check=True, capture_output=True)
+    
+    def write(self, name, content):
+        with open(os.path.join(self.repo, name), "w") as f:
+            f.write(content)
+    
+    def test_staged_changes_split(self):
+        """Test trivial staged files are dropped and lint hints cover added lines only"""
+        self.write("app.py", ORIGINAL.replace("sys.prefix, path)", "sys.prefix, path) == None"))
+        self.write("README.md", "Hello   world\n")
+        self.write("new.py", "x = 1\n")
+        self.git("add", ".")
+        review_input = ReviewInput(ReviewType.GIT_DIFF, self.repo, {"diff": True})
+        collector = SourceCollector(self.repo)
+        source_files = collector.collect(review_input)
+        
+        to_review, skipped = ChangeAnalyzer.for_input(review_input, collector.git_ops, lint=True).split(source_files)
+        
+        self.assertEqual(sorted(f.path for f in to_review), ["app.py", "new.py"])
+        self.assertEqual([(a.path, a.change_class) for a in skipped], [("README.md", ChangeClass.NOOP)])
+        app = next(f for f in to_review if f.path == "app.py")
+        self.assertEqual(len(app.hints), 1)
+        self.assertTrue(app.hints[0].startswith("Line 10: Comparison to None"))
+    
+    def test_read_blobs(self):
+        """Test many versions are read with one git process, missing ones as None"""
+        blobs = GitOperations(self.repo).read_blobs(["HEAD:README.md", "HEAD", "HEAD:missing.py", "HEAD:app.py"])
+        
+        self.assertEqual(blobs["HEAD:README.md"], "Hello world\n")
+        self.assertIsNone(blobs["HEAD"])
+        self.assertIsNone(blobs["HEAD:missing.py"])
+        self.assertEqual(blobs["HEAD:app.py"], ORIGINAL)
+
+
+if __name__ == "__main__":
+    unittest.main()
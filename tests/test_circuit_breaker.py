@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Unit tests for Circuit Breaker"""
+
+import unittest
+from unittest.mock import Mock
+from src.circuit_breaker import CircuitBreaker, CircuitState
+from src.llm_client import LLMClient
+from src.review_orchestrator import CIRCUIT_OPEN_REASON, ReviewEventType, ReviewOrchestrator
+from src.source_collector import SourceFile
+
+
+class FakeClock:
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    
+    def setUp(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(failure_threshold=3, reset_seconds=10, clock=self.clock)
+    
+    def test_opens_after_consecutive_failures(self):
+        """Test the circuit opens at the threshold and refuses requests"""
+        for _ in range(2):
+            self.breaker.record_failure()
+        self.assertTrue(self.breaker.allow_request())
+        self.breaker.record_failure()
+        
+        self.assertEqual(self.breaker.state, CircuitState.OPEN)
+        self.assertFalse(self.breaker.allow_request())
+    
+    def test_success_resets_failure_count(self):
+        """Test only consecutive failures count"""
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+        
+        self.assertEqual(self.breaker.state, CircuitState.CLOSED)
+    
+    def test_half_open_allows_single_probe(self):
+        """Test one probe is let through after the reset timeout"""
+        for _ in range(3):
+            self.breaker.record_failure()
+        self.clock.now += 10
+        
+        self.assertTrue(self.breaker.allow_request())
+        self.assertEqual(self.breaker.state, CircuitState.HALF_OPEN)
+        self.assertFalse(self.breaker.allow_request())
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CircuitState.CLOSED)
+    
+    def test_failed_probe_reopens(self):
+        """Test a failing probe opens the circuit for another timeout"""
+        for _ in range(3):
+            self.breaker.record_failure()
+        self.clock.now += 10
+        self.breaker.allow_request()
+        self.breaker.record_failure()
+        
+        self.assertEqual(self.breaker.state, CircuitState.OPEN)
+        self.assertFalse(self.breaker.allow_request())
+
+
+class TestOrchestratorCircuitBreaker(unittest.TestCase):
+    
+    def setUp(self):
+        self.source_files = [SourceFile(f"f{i}.py", f"x = {i}", 5, 1) for i in range(6)]
+        self.mock_client = Mock(spec=LLMClient)
+        self.mock_client.code_review.side_effect = Exception("503 Service Unavailable")
+        self.mock_client.last_call_cached.return_value = False
+    
+    def test_open_circuit_skips_remaining_files(self):
+        """Test files after the threshold fail fast and are reported as skipped"""
+        events = []
+        orchestrator = ReviewOrchestrator(
+            self.mock_client, on_event=events.append,
+            circuit_breaker=CircuitBreaker(failure_threshold=2, reset_seconds=60)
+        )
+        
+        results = orchestrator.review(self.source_files)
+        
+        self.assertEqual(self.mock_client.code_review.call_count, 2)
+        self.assertEqual(len(results), 2)
+        self.assertEqual(orchestrator.skipped, [f"f{i}.py" for i in range(2, 6)])
+        skipped = [e for e in events if e.event_type == ReviewEventType.SKIPPED]
+        self.assertEqual({e.reason for e in skipped}, {CIRCUIT_OPEN_REASON})
+    
+    def test_open_circuit_routes_to_fallback(self):
+        """Test a fallback client reviews files while the circuit is open"""
+        fallback = Mock(spec=LLMClient)
+        fallback.code_review.return_value = "Line 1: From fallback"
+        fallback.last_call_cached.return_value = False
+        orchestrator = ReviewOrchestrator(
+            self.mock_client, max_workers=2,
+            circuit_breaker=CircuitBreaker(failure_threshold=2, reset_seconds=60),
+            fallback_client=fallback
+        )
+        
+        results = orchestrator.review(self.source_files)
+        
+        self.assertEqual(len(results), 6)
+        self.assertEqual(orchestrator.skipped, [])
+        self.assertGreaterEqual(fallback.code_review.call_count, 1)
+        self.assertEqual(self.mock_client.code_review.call_count + fallback.code_review.call_count, 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
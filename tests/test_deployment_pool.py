@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Unit tests for Deployment Pool"""
+
+import json
+import os
+import unittest
+from unittest.mock import patch
+from src.deployment_pool import Deployment, DeploymentPool, parse_deployments
+
+
+class FakeClock:
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestParseDeployments(unittest.TestCase):
+    
+    @patch.dict(os.environ, {"SECOND_KEY": "secret"})
+    def test_parse_json(self):
+        """Test deployments with keys from the environment, weights and limits"""
+        deployments = parse_deployments(json.dumps([
+            {"model": "gemini/gemini-2.5-flash", "weight": 2, "rpm": 60},
+            {"name": "backup", "model": "openai/gpt-4o-mini", "api_key_env": "SECOND_KEY",
+             "api_base": "https://proxy.example"},
+        ]))
+        
+        self.assertEqual(deployments[0].name, "gemini/gemini-2.5-flash#1")
+        self.assertEqual((deployments[0].weight, deployments[0].requests_per_minute), (2.0, 60))
+        self.assertEqual((deployments[1].api_key, deployments[1].api_base), ("secret", "https://proxy.example"))
+    
+    def test_invalid_specs(self):
+        """Test malformed deployment lists"""
+        for spec in ["not json", "[]", '[{"weight": 1}]', '[{"model": "m", "weight": 0}]',
+                     '[{"model": "m", "api_key_env": "CODER_TEST_MISSING_KEY"}]']:
+            with self.assertRaises(ValueError):
+                parse_deployments(spec)
+
+
+class TestDeploymentPool(unittest.TestCase):
+    
+    def setUp(self):
+        self.clock = FakeClock()
+        self.a = Deployment("a", "model-a")
+        self.b = Deployment("b", "model-b")
+        self.pool = DeploymentPool([self.a, self.b], failure_threshold=2, cooldown_seconds=30, clock=self.clock)
+    
+    def test_least_outstanding_routing(self):
+        """Test requests go to the deployment with fewer in-flight requests"""
+        with self.pool.lease(self.pool.select()):
+            self.assertEqual(self.pool.select().name, "b")
+        self.assertEqual(self.pool.states["a"].outstanding, 0)
+    
+    def test_weights_scale_load(self):
+        """Test heavier deployments take proportionally more concurrent requests"""
+        pool = DeploymentPool([Deployment("big", "m", weight=3), Deployment("small", "m")])
+        chosen = []
+        for _ in range(4):
+            deployment = pool.select()
+            pool.states[deployment.name].outstanding += 1
+            chosen.append(deployment.name)
+        
+        self.assertEqual(chosen.count("big"), 3)
+    
+    def test_latency_routing(self):
+        """Test the latency strategy prefers the faster deployment"""
+        pool = DeploymentPool([self.a, self.b], strategy="latency", clock=self.clock)
+        pool.record_success(self.a, 4.0)
+        pool.record_success(self.b, 1.0)
+        
+        self.assertEqual(pool.select().name, "b")
+    
+    def test_unhealthy_deployment_cools_down(self):
+        """Test repeated failures take a deployment out of rotation until cooldown ends"""
+        self.pool.record_failure(self.a)
+        self.assertEqual(self.pool.healthy(), ["a", "b"])
+        self.pool.record_failure(self.a)
+        
+        self.assertEqual(self.pool.healthy(), ["b"])
+        self.assertEqual(self.pool.select().name, "b")
+        self.clock.now += 31
+        self.assertEqual(self.pool.healthy(), ["a", "b"])
+    
+    def test_overload_cools_down_immediately(self):
+        """Test rate-limited deployments are skipped right away"""
+        def request(deployment):
+            if deployment.name == "a":
+                raise RuntimeError("429")
+            return deployment.name
+        
+        result = self.pool.call(request, is_overloaded=lambda e: "429" in str(e))
+        
+        self.assertEqual(result, "b")
+        self.assertEqual(self.pool.healthy(), ["b"])
+    
+    def test_all_deployments_failing(self):
+        """Test the last error is raised once every deployment was tried"""
+        def request(deployment):
+            raise RuntimeError(f"{deployment.name} down")
+        
+        with self.assertRaises(RuntimeError):
+            self.pool.call(request)
+        self.assertEqual(self.pool.states["a"].failures + self.pool.states["b"].failures, 2)
+    
+    def test_all_unhealthy_uses_first_to_recover(self):
+        """Test an all-unhealthy pool still routes instead of failing outright"""
+        self.pool.record_failure(self.a, immediate=True)
+        self.clock.now += 10
+        self.pool.record_failure(self.b, immediate=True)
+        
+        self.assertEqual(self.pool.select().name, "a")
+    
+    def test_unknown_strategy(self):
+        """Test invalid routing strategies are rejected"""
+        with self.assertRaises(ValueError):
+            DeploymentPool([self.a], strategy="random")
+
+
+if __name__ == '__main__':
+    unittest.main()
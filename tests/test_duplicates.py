@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Unit tests for duplicate-content detection"""
+
+import unittest
+from unittest.mock import Mock, patch
+from src.duplicates import BANDS, ROWS, Duplicate, _estimated_similarity, find_duplicates, minhash, remap_review
+from src.llm_client import LLMClient
+from src.review_orchestrator import ReviewEventType, ReviewOrchestrator
+from src.review_scheduler import ReviewBudget
+from src.source_collector import SourceFile
+
+
+def _file(path: str, content: str, is_diff: bool = False) -> SourceFile:
+    return SourceFile(path=path, content=content, size=len(content), lines=len(content.splitlines()), is_diff=is_diff)
+
+
+MODULE = "\n".join(f"def handler_{i}(request):\n    return process(request, retries={i})\n" for i in range(20))
+
+
+class TestFindDuplicates(unittest.TestCase):
+    
+    def test_exact_duplicates_ignore_blank_lines_and_trailing_space(self):
+        """Test copies equal up to whitespace map each line to its counterpart"""
+        files = [
+            _file("a.py", "x = 1\ny = 2\n"),
+            _file("vendor/a.py", "\n\nx = 1   \n\ny = 2\n"),
+            _file("b.py", "x = 1\ny = 3\n"),
+        ]
+        
+        duplicates = find_duplicates(files)
+        
+        self.assertEqual(list(duplicates), [1])
+        self.assertEqual(duplicates[1].original, 0)
+        self.assertEqual(duplicates[1].line_map, {1: 3, 2: 5})
+        self.assertTrue(duplicates[1].exact)
+    
+    def test_indentation_is_significant(self):
+        """Test code that differs only in indentation is not an exact copy"""
+        files = [_file("a.py", "if x:\n    y()\nz()\n"), _file("b.py", "if x:\n    y()\n    z()\n")]
+        
+        self.assertEqual(find_duplicates(files), {})
+    
+    def test_diffs_use_embedded_line_numbers(self):
+        """Test diff copies at other positions map to their own line numbers"""
+        files = [
+            _file("a.py", "File: a.py\n\n=== ADDED LINES ===\n+ 10: x = 1\n+ 11: y = 2\n", is_diff=True),
+            _file("b.py", "File: b.py\n\n=== ADDED LINES ===\n+ 40: x = 1\n+ 41: y = 2\n", is_diff=True),
+        ]
+        
+        self.assertEqual(find_duplicates(files)[1].line_map, {10: 40, 11: 41})
+    
+    def test_near_duplicates(self):
+        """Test lightly edited copies are found only when near matching is enabled"""
+        edited = MODULE.replace("retries=7)", "retries=7, timeout=5)")
+        files = [_file("client.py", MODULE), _file("copy/client.py", edited), _file("other.py", "print('hi')\n" * 5)]
+        
+        self.assertEqual(find_duplicates(files), {})
+        duplicates = find_duplicates(files, threshold=0.8)
+        self.assertEqual(list(duplicates), [1])
+        self.assertFalse(duplicates[1].exact)
+        self.assertNotIn(30, duplicates[1].line_map)
+        self.assertEqual(duplicates[1].line_map[31], 31)
+    
+    def test_single_file_skips_detection(self):
+        """Test a one-file review returns before normalizing or hashing"""
+        with patch("src.duplicates.normalized_lines") as normalized:
+            self.assertEqual(find_duplicates([_file("a.py", MODULE)], threshold=0.5), {})
+        normalized.assert_not_called()
+    
+    def test_signature_estimates_similarity(self):
+        """Test signatures are stable and agree more the more content is shared"""
+        lines = MODULE.splitlines()
+        half = lines[:20] + [line.replace("process", "handle") for line in lines[20:]]
+        other = [f"value_{i} = compute({i}) * {i}" for i in range(60)]
+        
+        self.assertEqual(minhash(lines), minhash(list(lines)))
+        self.assertEqual(len(minhash(lines)), BANDS * ROWS)
+        self.assertGreater(_estimated_similarity(minhash(lines), minhash(half)),
+                           _estimated_similarity(minhash(lines), minhash(other)))
+        self.assertIsNone(minhash(["x = 1"]))
+
+
+class TestRemapReview(unittest.TestCase):
+    
+    def test_line_references_rewritten(self):
+        """Test single lines and ranges are remapped"""
+        duplicate = Duplicate(0, {3: 13, 4: 14, 5: 15})
+        
+        self.assertEqual(remap_review("Line 3: Bug\nLines 4-5: Duplicated block", duplicate),
+                         "Line 13: Bug\nLines 14-15: Duplicated block")
+    
+    def test_near_duplicates_drop_findings_on_changed_lines(self):
+        """Test findings about code that differs in a near copy are not copied"""
+        duplicate = Duplicate(0, {3: 3}, similarity=0.9, exact=False)
+        
+        self.assertEqual(remap_review("Line 3: Bug\nLine 8: Typo\nGeneral note", duplicate), "Line 3: Bug\nGeneral note")
+
+
+class TestOrchestratorDeduplication(unittest.TestCase):
+    
+    def setUp(self):
+        self.llm_client = Mock(spec=LLMClient)
+        self.llm_client.code_review.return_value = "Line 2: Division by zero"
+        self.llm_client.last_call_cached.return_value = False
+        self.events = []
+    
+    def test_copies_reviewed_once(self):
+        """Test each distinct body costs one request and copies get remapped findings"""
+        files = [_file("a.py", "x = 1\ny = 1 / 0\n"), _file("b.py", "z = 2\n"), _file("c.py", "\nx = 1\ny = 1 / 0\n")]
+        orchestrator = ReviewOrchestrator(self.llm_client, on_event=self.events.append, duplicate_threshold=1.0)
+        
+        results = orchestrator.review(files)
+        
+        self.assertEqual(self.llm_client.code_review.call_count, 2)
+        self.assertEqual([r.file_path for r in results], ["a.py", "b.py", "c.py"])
+        self.assertEqual(results[2].review_content, "Line 3: Division by zero")
+        self.assertEqual(results[2].duplicate_of, "a.py")
+        copied = [e for e in self.events if e.file_path == "c.py" and e.event_type == ReviewEventType.CACHED]
+        self.assertEqual(copied[0].reason, "duplicate of a.py")
+    
+    def test_disabled_by_default(self):
+        """Test every file is reviewed without a duplicate threshold"""
+        files = [_file("a.py", "x = 1\n"), _file("b.py", "x = 1\n")]
+        
+        ReviewOrchestrator(self.llm_client).review(files)
+        
+        self.assertEqual(self.llm_client.code_review.call_count, 2)
+    
+    def test_copies_skipped_with_their_original(self):
+        """Test copies of a file the budget skipped are skipped too"""
+        files = [_file("a.py", "x = 1\n"), _file("b.py", "x = 1\n")]
+        orchestrator = ReviewOrchestrator(self.llm_client, budget=ReviewBudget(max_seconds=0),
+                                          duplicate_threshold=1.0)
+        
+        self.assertEqual(orchestrator.review(files), [])
+        self.assertEqual(sorted(orchestrator.skipped), ["a.py", "b.py"])
+
+
+if __name__ == "__main__":
+    unittest.main()
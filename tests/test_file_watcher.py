@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Unit tests for watch mode"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from src.file_watcher import (
+    Debouncer, InotifyWatcher, PollingWatcher, WatchReviewer, WatchStatus, watched_files
+)
+from src.review_orchestrator import ReviewResult
+
+
+class FakeClock:
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestDebouncer(unittest.TestCase):
+    
+    def test_path_due_after_quiet_window(self):
+        """Test repeated saves delay the review until the file settles"""
+        clock = FakeClock()
+        debouncer = Debouncer(1.0, clock=clock)
+        debouncer.add("a.py")
+        clock.now = 0.8
+        debouncer.add("a.py")
+        clock.now = 1.5
+        
+        self.assertEqual(debouncer.due(), [])
+        self.assertAlmostEqual(debouncer.next_deadline(), 0.3)
+        clock.now = 1.8
+        self.assertEqual(debouncer.due(), ["a.py"])
+        self.assertIsNone(debouncer.next_deadline())
+
+
+class TestWatchReviewer(unittest.TestCase):
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "app.py")
+        self._write("x = 1\n")
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+    
+    def _write(self, content):
+        with open(self.path, "w") as f:
+            f.write(content)
+    
+    def test_unchanged_content_is_not_reviewed(self):
+        """Test saves that do not change the content are skipped"""
+        reviewed = []
+        reviewer = WatchReviewer(lambda f: reviewed.append(f.content) or ReviewResult(f.path, "", True))
+        reviewer.prime([self.path])
+        
+        self.assertFalse(reviewer.submit(self.path))
+        self._write("x = 2\n")
+        self.assertTrue(reviewer.submit(self.path))
+        self.assertFalse(reviewer.submit(self.path))
+        reviewer.close()
+        
+        self.assertEqual(reviewed, ["x = 2\n"])
+        self.assertEqual(reviewer.entries[self.path].status, WatchStatus.DONE)
+    
+    def test_newer_save_supersedes_running_review(self):
+        """Test the result of a review made stale by a newer save is discarded"""
+        started, release = threading.Event(), threading.Event()
+        updates = []
+        
+        def review(source_file):
+            if source_file.content == "x = 2\n":
+                started.set()
+                release.wait(5)
+            return ReviewResult(source_file.path, f"Line 1: reviewed {source_file.content.strip()}", True)
+        
+        reviewer = WatchReviewer(review, on_update=lambda e: updates.append(e.result), max_workers=2)
+        self._write("x = 2\n")
+        reviewer.submit(self.path)
+        started.wait(5)
+        self._write("x = 3\n")
+        reviewer.submit(self.path)
+        time.sleep(0.1)
+        release.set()
+        reviewer.close()
+        
+        entry = reviewer.entries[self.path]
+        self.assertEqual(entry.result.review_content, "Line 1: reviewed x = 3")
+        self.assertEqual([r.review_content for r in updates if r], ["Line 1: reviewed x = 3"])
+        self.assertEqual(entry.reviews, 2)
+    
+    def test_failed_review_retried_on_identical_save(self):
+        """Test a failed review does not mark the content as reviewed"""
+        calls = []
+        
+        def review(source_file):
+            calls.append(source_file.path)
+            raise RuntimeError("provider down")
+        
+        reviewer = WatchReviewer(review)
+        self._write("x = 2\n")
+        reviewer.submit(self.path)
+        reviewer._executor.submit(lambda: None).result()
+        
+        self.assertTrue(reviewer.submit(self.path))
+        reviewer._executor.submit(lambda: None).result()
+        reviewer.close()
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(reviewer.entries[self.path].status, WatchStatus.FAILED)
+
+
+class TestWatchers(unittest.TestCase):
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.temp_dir, ".git"))
+        self.path = os.path.join(self.temp_dir, "app.py")
+        with open(self.path, "w") as f:
+            f.write("x = 1\n")
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+    
+    def test_watched_files_skip_hidden_and_binary(self):
+        """Test only text files outside hidden directories are watched"""
+        open(os.path.join(self.temp_dir, ".git", "config.py"), "w").close()
+        open(os.path.join(self.temp_dir, "image.png"), "w").close()
+        
+        self.assertEqual(watched_files(self.temp_dir), [self.path])
+    
+    def test_polling_watcher_detects_changes(self):
+        """Test the polling watcher reports modified and new files"""
+        watcher = PollingWatcher(self.temp_dir, interval=0.01)
+        new_path = os.path.join(self.temp_dir, "new.py")
+        with open(new_path, "w") as f:
+            f.write("y = 1\n")
+        
+        self.assertEqual(watcher.poll(0.5), {new_path})
+        self.assertEqual(watcher.poll(0.05), set())
+    
+    def test_inotify_watcher_detects_writes(self):
+        """Test the inotify watcher reports written files"""
+        try:
+            watcher = InotifyWatcher(self.temp_dir)
+        except OSError:
+            self.skipTest("inotify not available")
+        try:
+            with open(self.path, "w") as f:
+                f.write("x = 2\n")
+            
+            self.assertEqual(watcher.poll(1.0), {self.path})
+        finally:
+            watcher.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Unit tests for parsing review findings"""
+
+import unittest
+from src.findings import Finding, findings_from_text, parse_json_findings, render_findings, structured_section
+
+
+class TestParseJsonFindings(unittest.TestCase):
+    
+    def test_object_with_findings(self):
+        """Test fields are validated and loosely typed values normalized"""
+        response = ('Here you go:\n```json\n{"findings": ['
+                    '{"line": "7", "severity": "Critical", "category": "Security", "message": "SQL  injection"},'
+                    '{"line": "3-5", "severity": "odd", "message": "Duplicated block"},'
+                    '{"line": null, "severity": "info", "description": "Typo in module docstring"}'
+                    ']}\n```')
+        
+        self.assertEqual(parse_json_findings(response), [
+            Finding(7, "SQL injection", severity="error", category="security"),
+            Finding(3, "Duplicated block", end_line=5, severity="warning"),
+            Finding(None, "Typo in module docstring", severity="info"),
+        ])
+    
+    def test_tolerates_broken_elements(self):
+        """Test malformed and truncated elements cost only themselves"""
+        response = ('{"findings": [{"line": 1, "message": "Uses } and \\"quotes\\"",}, '
+                    '{"line": 2, "message": }, {"line": 4}, '
+                    '{"line": 9, "message": "Cut off at the tok')
+        
+        self.assertEqual(parse_json_findings(response), [Finding(1, 'Uses } and "quotes"', severity="warning")])
+    
+    def test_bare_array_and_empty(self):
+        """Test a bare array is accepted and an empty one means no findings"""
+        self.assertEqual(parse_json_findings('[{"line": 2, "severity": "info", "message": "Rename x"}]'),
+                         [Finding(2, "Rename x", severity="info")])
+        self.assertEqual(parse_json_findings('{"findings": []}'), [])
+    
+    def test_text_response_is_not_structured(self):
+        """Test responses without a findings array are left to the text parser"""
+        self.assertIsNone(parse_json_findings("Line 3: Unused import [os]"))
+
+
+class TestFindingsFromText(unittest.TestCase):
+    
+    def test_free_form_review(self):
+        """Test line references, ranges and continuation lines are parsed"""
+        review = ("Issues found:\n"
+                  "- **Line 3:** Unused import\n"
+                  "Lines 10-12: Duplicated logic\n"
+                  "  extract a helper\n"
+                  "\n"
+                  "Overall the code is fine.")
+        
+        self.assertEqual(findings_from_text(review), [
+            Finding(3, "Unused import"),
+            Finding(10, "Duplicated logic\nextract a helper", end_line=12),
+        ])
+    
+    def test_several_references_on_one_line(self):
+        """Test each reference on a line starts its own finding"""
+        review = "**Line 5:** Issue here. **Lines 10-11:** [error] Another issue. No line reference here."
+        
+        self.assertEqual(findings_from_text(review), [
+            Finding(5, "Issue here."),
+            Finding(10, "Another issue. No line reference here.", end_line=11, severity="error"),
+        ])
+    
+    def test_rendered_findings_round_trip(self):
+        """Test findings rendered as text parse back to the same findings"""
+        findings = [
+            Finding(4, "Off by one", severity="error", category="bugs"),
+            Finding(8, "Slow loop", end_line=11, severity="warning"),
+            Finding(None, "Misspelled name in comments", severity="info", category="language"),
+        ]
+        
+        self.assertEqual(findings_from_text(render_findings(findings)), findings)
+    
+    def test_structured_section(self):
+        """Test JSON instructions are only added in structured mode"""
+        self.assertEqual(structured_section(False), "")
+        self.assertIn('{"findings": []}', structured_section(True))
+
+
+if __name__ == "__main__":
+    unittest.main()
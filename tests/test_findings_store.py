@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Unit tests for Findings Store"""
+
+import sqlite3
+import subprocess
+import tempfile
+import unittest
+from unittest.mock import Mock
+from src.findings import Finding, findings_from_text
+from src.findings_store import FindingsStore, git_blob_sha
+from src.llm_client import LLMClient
+from src.review_orchestrator import ReviewEventType, ReviewOrchestrator, ReviewResult
+from src.source_collector import SourceFile
+
+
+class TestFindingsStore(unittest.TestCase):
+    
+    def setUp(self):
+        self.store = FindingsStore(":memory:")
+        self.source = SourceFile("app.py", "x = 1\n", 6, 1)
+    
+    def tearDown(self):
+        self.store.close()
+    
+    def test_blob_sha_matches_git(self):
+        """Test content hashes equal git's blob ids"""
+        try:
+            expected = subprocess.run(
+                ["git", "hash-object", "--stdin"], input="x = 1\n",
+                capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            self.skipTest("git not available")
+        self.assertEqual(git_blob_sha("x = 1\n"), expected)
+    
+    def test_parse_findings(self):
+        """Test review text is split into line findings"""
+        findings = findings_from_text("Intro\nLine 3: Unused import\n- line 10: Typo in comment")
+        self.assertEqual(findings, [Finding(3, "Unused import"), Finding(10, "Typo in comment")])
+    
+    def test_recorded_result_is_reused_for_same_blob(self):
+        """Test stored results act as a cache across runs"""
+        first = self.store.start_run("/repo", "git_branch", "model-a", target="feature", commit_sha="abc")
+        first.record(self.source, ReviewResult("app.py", "Line 1: Bad name", True))
+        
+        second = self.store.start_run("/repo", "git_branch", "model-a", target="other", commit_sha="def")
+        
+        self.assertEqual(second.lookup(self.source).review_content, "Line 1: Bad name")
+        self.assertIsNone(second.lookup(SourceFile("app.py", "x = 2\n", 6, 1)))
+        other_model = self.store.start_run("/repo", "git_branch", "model-b")
+        self.assertIsNone(other_model.lookup(self.source))
+    
+    def test_failed_results_are_not_reused(self):
+        """Test errors are stored but never served as cache hits"""
+        run = self.store.start_run("/repo", "single_file", "model-a")
+        run.record(self.source, ReviewResult("app.py", "Review failed: timeout", False))
+        
+        self.assertIsNone(run.lookup(self.source))
+    
+    def test_get_run_and_history(self):
+        """Test runs can be re-displayed and per-file history listed"""
+        run = self.store.start_run("/repo", "git_commit", "model-a", target="abc", commit_sha="abc123")
+        run.record(self.source, ReviewResult("app.py", "Line 2: Off by one", True, True, {"type": "commit"}))
+        
+        metadata, results = self.store.get_run(run.run_id[:6])
+        history = self.store.history("app.py")
+        
+        self.assertEqual(metadata["commit_sha"], "abc123")
+        self.assertEqual(results[0].diff_info, {"type": "commit"})
+        self.assertEqual(self.store.latest_run_id(), run.run_id)
+        self.assertEqual(history[0]["findings"], [(2, "Off by one")])
+        with self.assertRaises(ValueError):
+            self.store.get_run("zzz")
+    
+    def test_structured_fields_stored(self):
+        """Test severity, category and line ranges of findings are kept"""
+        run = self.store.start_run("/repo", "single_file", "model-a")
+        run.record(self.source, ReviewResult("app.py", "- Lines 2-4: [error/bugs] Off by one", True))
+        
+        row = self.store._connection.execute("SELECT line, end_line, severity, category FROM findings").fetchone()
+        
+        self.assertEqual(tuple(row), (2, 4, "error", "bugs"))
+    
+    def test_duplicate_of_restored(self):
+        """Test results copied from a duplicate's review say so when read back"""
+        run = self.store.start_run("/repo", "git_branch", "model-a")
+        run.record(self.source, ReviewResult("app.py", "Line 1: Bad name", True, duplicate_of="lib/app.py"))
+        
+        _, results = self.store.get_run(run.run_id)
+        
+        self.assertEqual(results[0].duplicate_of, "lib/app.py")
+        self.assertEqual(run.lookup(self.source).duplicate_of, "lib/app.py")
+    
+    def test_older_database_upgraded(self):
+        """Test tables without the columns added later get them on open"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = f"{temp_dir}/findings.db"
+            connection = sqlite3.connect(path)
+            connection.execute("CREATE TABLE findings (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                               "result_id INTEGER NOT NULL, path TEXT NOT NULL, line INTEGER, message TEXT NOT NULL)")
+            connection.execute("CREATE TABLE results (id INTEGER PRIMARY KEY AUTOINCREMENT, run_id TEXT NOT NULL, "
+                               "repo TEXT NOT NULL, path TEXT NOT NULL, blob_sha TEXT NOT NULL, model TEXT NOT NULL, "
+                               "prompt_version TEXT NOT NULL, commit_sha TEXT, success INTEGER NOT NULL, "
+                               "is_diff INTEGER NOT NULL, diff_info TEXT, review_content TEXT NOT NULL, "
+                               "created_at REAL NOT NULL)")
+            connection.close()
+            
+            store = FindingsStore(path)
+            run = store.start_run("/repo", "single_file", "model-a")
+            run.record(self.source, ReviewResult("app.py", "Line 1: [warning] Bad name", True))
+            
+            self.assertEqual(store.history("app.py")[0]["findings"], [(1, "Bad name")])
+            self.assertIsNone(run.lookup(self.source).duplicate_of)
+            store.close()
+    
+    def test_store_in_repo_state_dir(self):
+        """Test the on-disk store lives in the state directory"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = FindingsStore.for_repo(temp_dir)
+            store.start_run(temp_dir, "single_file", "model-a")
+            store.close()
+            self.assertIsNotNone(FindingsStore.for_repo(temp_dir).latest_run_id())
+
+
+class TestOrchestratorWithStore(unittest.TestCase):
+    
+    def test_unchanged_files_are_not_sent_to_llm(self):
+        """Test stored results are served as cached events"""
+        store = FindingsStore(":memory:")
+        source_files = [SourceFile("a.py", "a = 1", 5, 1), SourceFile("b.py", "b = 1", 5, 1)]
+        store.start_run("/repo", "git_branch", "m").record(source_files[0], ReviewResult("a.py", "Line 1: Old", True))
+        mock_client = Mock(spec=LLMClient)
+        mock_client.code_review.return_value = "Line 1: New"
+        mock_client.last_call_cached.return_value = False
+        events = []
+        run = store.start_run("/repo", "git_branch", "m")
+        
+        results = ReviewOrchestrator(mock_client, on_event=events.append, result_store=run).review(source_files)
+        
+        self.assertEqual([r.review_content for r in results], ["Line 1: Old", "Line 1: New"])
+        mock_client.code_review.assert_called_once_with("b = 1", "b.py")
+        cached = [e.file_path for e in events if e.event_type == ReviewEventType.CACHED]
+        self.assertEqual(cached, ["a.py"])
+        self.assertEqual(len(store.get_run(run.run_id)[1]), 2)
+        store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -170,6 +170,25 @@ index 2345678..bcdefgh 100644
             check=True
         )
 
+    
+    @patch('subprocess.run')
+    def test_resolve_ref(self, mock_run):
+        """Test resolving a ref to a commit hash"""
+        mock_run.return_value = MagicMock(stdout="abc123def\n", stderr="", returncode=0)
+        
+        self.assertEqual(self.git_ops.resolve_ref("main"), "abc123def")
+        self.assertEqual(mock_run.call_args[0][0], ["git", "rev-parse", "--verify", "main^{commit}"])
+    
+    @patch('subprocess.run')
+    def test_resolve_ref_unknown(self, mock_run):
+        """Test resolving an unknown ref"""
+        mock_run.side_effect = subprocess.CalledProcessError(128, "git", stderr="fatal: bad revision")
+        
+        with self.assertRaises(ValueError) as context:
+            self.git_ops.resolve_ref("nope")
+        
+        self.assertIn("Failed to resolve ref", str(context.exception))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Unit tests for Hedging"""
+
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+from src.hedging import LatencyWindow, hedged_call
+from src.llm_client import LLMClient
+from src.usage import UsageTracker
+
+
+class TestLatencyWindow(unittest.TestCase):
+    
+    def test_percentile_needs_enough_samples(self):
+        """Test no threshold is reported before min_samples"""
+        window = LatencyWindow(min_samples=3)
+        window.add(1.0)
+        window.add(2.0)
+        self.assertIsNone(window.percentile(95))
+        
+        window.add(3.0)
+        self.assertEqual(window.percentile(50), 2.0)
+        self.assertEqual(window.percentile(95), 3.0)
+    
+    def test_window_keeps_recent_samples(self):
+        """Test old samples fall out of the window"""
+        window = LatencyWindow(size=2, min_samples=1)
+        for latency in (10.0, 1.0, 1.0):
+            window.add(latency)
+        self.assertEqual(window.percentile(100), 1.0)
+
+
+class TestHedgedCall(unittest.TestCase):
+    
+    def test_fast_primary_is_not_hedged(self):
+        """Test requests finishing before the delay send no duplicate"""
+        calls = []
+        
+        def request(is_hedge, cancelled):
+            calls.append(is_hedge)
+            return "primary"
+        
+        self.assertEqual(hedged_call(request, 1.0), ("primary", False, False))
+        self.assertEqual(calls, [False])
+    
+    def test_slow_primary_loses_to_hedge(self):
+        """Test the hedge answer is used and the late primary reported"""
+        release = threading.Event()
+        abandoned = []
+        done = threading.Event()
+        
+        def request(is_hedge, cancelled):
+            if not is_hedge:
+                release.wait(5)
+                return "slow primary"
+            return "hedge"
+        
+        def on_abandoned(response):
+            abandoned.append(response)
+            done.set()
+        
+        result = hedged_call(request, 0.01, on_abandoned)
+        release.set()
+        done.wait(5)
+        
+        self.assertEqual(result, ("hedge", True, True))
+        self.assertEqual(abandoned, ["slow primary"])
+    
+    def test_failed_hedge_waits_for_primary(self):
+        """Test a failing duplicate does not fail the call"""
+        def request(is_hedge, cancelled):
+            if is_hedge:
+                raise RuntimeError("hedge failed")
+            time.sleep(0.05)
+            return "primary"
+        
+        self.assertEqual(hedged_call(request, 0.01), ("primary", True, False))
+    
+    def test_both_failing_raises_primary_error(self):
+        """Test the primary's error is raised when both copies fail"""
+        def request(is_hedge, cancelled):
+            time.sleep(0.02 if not is_hedge else 0)
+            raise RuntimeError("hedge" if is_hedge else "primary")
+        
+        with self.assertRaisesRegex(RuntimeError, "primary"):
+            hedged_call(request, 0.01)
+
+
+class TestClientHedging(unittest.TestCase):
+    
+    @patch('src.llm_client.completion')
+    def test_losing_request_tokens_are_reported(self, mock_completion):
+        """Test hedge overhead shows up in usage totals"""
+        release = threading.Event()
+        
+        def completion(**kwargs):
+            response = MagicMock()
+            response.usage.prompt_tokens = 100
+            response.usage.completion_tokens = 10
+            if mock_completion.call_count == 1:
+                release.wait(5)
+                response.choices[0].message.content = "slow"
+            else:
+                response.choices[0].message.content = "fast"
+            return response
+        
+        mock_completion.side_effect = completion
+        client = LLMClient(hedge_percentile=50)
+        for _ in range(20):
+            client.latency.add(0.01)
+        tracker = UsageTracker()
+        
+        with tracker.file_scope("a.py"):
+            result = client.send_message("Message")
+        release.set()
+        for _ in range(100):
+            if tracker.totals().hedge_requests:
+                break
+            time.sleep(0.01)
+        
+        self.assertEqual(result, "fast")
+        totals = tracker.totals()
+        self.assertEqual((totals.hedge_requests, totals.hedge_tokens), (1, 110))
+        self.assertEqual(tracker.file_totals("a.py").requests, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,7 +4,10 @@
 import unittest
 import os
 from unittest.mock import patch, MagicMock
+from src.deployment_pool import Deployment, DeploymentPool
 from src.llm_client import LLMClient
+from src.response_cache import ResponseCache
+from src.usage import UsageTracker
 
 
 class TestLLMClient(unittest.TestCase):
@@ -71,6 +74,59 @@ class TestLLMClient(unittest.TestCase):
         
         self.assertIn("LLM API error", str(context.exception))
     
+    @patch('src.llm_client.completion')
+    def test_send_message_uses_cache(self, mock_completion):
+        """Test repeated requests are served from the response cache"""
+        mock_response = MagicMock()
+        mock_response.choices[0].message.content = "Cached response"
+        mock_completion.return_value = mock_response
+        client = LLMClient(cache=ResponseCache())
+        
+        first = client.send_message("Same message")
+        self.assertFalse(client.last_call_cached())
+        second = client.send_message("Same message")
+        
+        self.assertEqual(first, second)
+        self.assertTrue(client.last_call_cached())
+        mock_completion.assert_called_once()
+    
+    @patch('src.llm_client.completion')
+    def test_send_message_records_usage(self, mock_completion):
+        """Test token usage and latency are recorded for the active file"""
+        mock_response = MagicMock()
+        mock_response.choices[0].message.content = "Response"
+        mock_response.usage.prompt_tokens = 120
+        mock_response.usage.completion_tokens = 30
+        mock_completion.return_value = mock_response
+        tracker = UsageTracker()
+        
+        with tracker.file_scope("a.py"):
+            self.client.send_message("Message")
+        
+        record = tracker.records[0]
+        self.assertEqual((record.prompt_tokens, record.completion_tokens), (120, 30))
+        self.assertEqual(record.file_path, "a.py")
+        self.assertEqual(record.model, self.client.get_model())
+        self.assertFalse(record.cache_hit)
+    
+    @patch('src.llm_client.completion')
+    def test_send_message_fails_over_between_deployments(self, mock_completion):
+        """Test pool requests move to the next deployment when one errors"""
+        mock_response = MagicMock()
+        mock_response.choices[0].message.content = "From backup"
+        mock_completion.side_effect = [Exception("503 unavailable"), mock_response]
+        pool = DeploymentPool([
+            Deployment("primary", "gemini/gemini-2.5-flash", api_key="key-1", weight=2),
+            Deployment("backup", "openai/gpt-4o-mini", api_key="key-2"),
+        ])
+        client = LLMClient(pool=pool)
+        
+        result = client.send_message("Message")
+        
+        self.assertEqual(result, "From backup")
+        calls = [(c.kwargs["model"], c.kwargs["api_key"]) for c in mock_completion.call_args_list]
+        self.assertEqual(calls, [("gemini/gemini-2.5-flash", "key-1"), ("openai/gpt-4o-mini", "key-2")])
+    
     def test_set_model(self):
         """Test model setting"""
         new_model = "gemini/gemini-1.5-pro"
@@ -4,13 +4,22 @@
 import unittest
 import tempfile
 import os
-from unittest.mock import patch
+import json
+import subprocess
+from io import StringIO
+from unittest.mock import MagicMock, patch
+from rich.console import Console
 from typer.testing import CliRunner
-from src.main import app
+from src.main import _daemon_review, _prompt_label, _show_plan, _store_repo, app
+from src.config import config
 from src.llm_client import LLMClient
-from src.code_context import parse_line_references, extract_line_feedback
+from src.code_context import display_code_with_feedback
+from src.findings import findings_from_text
+from src.findings_store import RunRecorder
+from src.input_parser import ReviewInput, ReviewType
 from src.source_collector import SourceFile
 from src.review_orchestrator import ReviewResult
+from src.tracing import tracer
 
 
 class TestCodeReview(unittest.TestCase):
@@ -33,13 +42,35 @@ class TestCodeReview(unittest.TestCase):
         try:
             with patch('src.llm_client.LLMClient.code_review') as mock_review:
                 mock_review.return_value = "Line 1: Missing docstring"
-                result = self.runner.invoke(app, ["cr", temp_file])
+                result = self.runner.invoke(app, ["cr", temp_file, "--no-store"])
                 self.assertEqual(result.exit_code, 0)
                 self.assertIn("File Information", result.stdout)
                 self.assertIn("CODE REVIEW RESULTS", result.stdout)
         finally:
             os.unlink(temp_file)
     
+    def test_cr_with_trace(self):
+        """Test --trace writes pipeline stage spans"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = os.path.join(temp_dir, "sample.py")
+            trace_path = os.path.join(temp_dir, "trace.json")
+            with open(source, "w") as f:
+                f.write("def test(): pass")
+            
+            try:
+                with patch('src.llm_client.LLMClient.code_review') as mock_review:
+                    mock_review.return_value = "No issues"
+                    result = self.runner.invoke(app, ["cr", source, "--no-daemon", "--no-store", "--trace", trace_path])
+            finally:
+                tracer.reset()
+            
+            self.assertEqual(result.exit_code, 0)
+            with open(trace_path) as f:
+                names = {event["name"] for event in json.load(f)["traceEvents"]}
+            self.assertIn("input_parser.parse", names)
+            self.assertIn("source_collector.collect", names)
+            self.assertIn("render.review_result", names)
+    
     def test_cr_with_directory_fails(self):
         """Test cr command with directory (should fail)"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -69,14 +100,99 @@ class TestCodeReview(unittest.TestCase):
     def test_parse_line_references(self):
         """Test parsing line references from review text"""
         review_text = "Line 5: Issue here. Line 10: Another issue. No line reference here."
-        line_refs = parse_line_references(review_text)
+        line_refs = [finding.line for finding in findings_from_text(review_text)]
         self.assertEqual(line_refs, [5, 10])
     
     def test_extract_line_feedback(self):
         """Test extracting feedback for specific line"""
         review_text = "Line 5: Missing docstring. Line 10: Use is None instead of == None."
-        feedback = extract_line_feedback(review_text, 5)
+        feedback = findings_from_text(review_text)[0].message
         self.assertIn("Missing docstring", feedback)
+        self.assertNotIn("is None", feedback)
+    
+    def test_feedback_without_line_references_is_shown(self):
+        """Test reviews describing issues without line numbers are not reported as clean"""
+        review_text = ("The module mixes I/O with parsing, which makes it hard to test.\n\n"
+                       "Error handling swallows exceptions from the network layer.")
+        for text, expected, unexpected in [
+            (review_text, "swallows exceptions", "No specific issues"),
+            ("No issues found.", "No specific issues", "Without Line References"),
+        ]:
+            output = StringIO()
+            display_code_with_feedback(Console(file=output, width=120), "x = 1\n", text, "a.py")
+            self.assertIn(expected, output.getvalue())
+            self.assertNotIn(unexpected, output.getvalue())
+    
+    def test_prompt_label_separates_prompt_variants(self):
+        """Test stored results and journals are keyed by aspects and structured output"""
+        with patch.object(config, "structured_findings", False):
+            self.assertEqual(_prompt_label(), "")
+            self.assertEqual(_prompt_label(["bugs"]), "+aspects:bugs")
+        with patch.object(config, "structured_findings", True):
+            self.assertEqual(_prompt_label(), "+structured")
+    
+    def test_daemon_drop_falls_back_to_local_review(self):
+        """Test files the daemon didn't finish are reviewed in-process when its connection drops"""
+        files = [SourceFile(path, "x = 1\n", 6, 1) for path in ("a.py", "b.py", "c.py")]
+        
+        def daemon_stream(source_files, **kwargs):
+            yield ReviewResult("b.py", "No issues", True)
+            raise ConnectionError("Review daemon unavailable: connection reset")
+        
+        client = MagicMock()
+        client.iter_review.side_effect = daemon_stream
+        local_review = MagicMock(side_effect=lambda remaining: (ReviewResult(f.path, "", True) for f in remaining))
+        
+        results = list(_daemon_review(client, files, local_review, journal=None))
+        
+        self.assertEqual([r.file_path for r in results], ["b.py", "a.py", "c.py"])
+        self.assertEqual([f.path for f in local_review.call_args[0][0]], ["a.py", "c.py"])
+    
+    def test_store_follows_reviewed_file(self):
+        """Test results of a file in another repository are stored in that repository and the store closed"""
+        with tempfile.TemporaryDirectory() as repo, tempfile.TemporaryDirectory() as cwd:
+            try:
+                subprocess.run(["git", "init", "-q", repo], capture_output=True, check=True)
+            except (OSError, subprocess.CalledProcessError):
+                self.skipTest("git not available")
+            os.makedirs(os.path.join(repo, "pkg"))
+            source = os.path.join(repo, "pkg", "app.py")
+            with open(source, "w") as f:
+                f.write("def test(): pass")
+            
+            previous_dir = os.getcwd()
+            os.chdir(cwd)
+            try:
+                with patch('src.llm_client.LLMClient.code_review', return_value="No issues"), \
+                        patch.object(RunRecorder, "close", autospec=True,
+                                     side_effect=lambda recorder: recorder.store.close()) as close:
+                    result = self.runner.invoke(app, ["cr", source, "--no-daemon", "--no-context"])
+            finally:
+                os.chdir(previous_dir)
+            
+            self.assertEqual(result.exit_code, 0)
+            self.assertEqual(_store_repo(source), os.path.realpath(repo))
+            self.assertTrue(os.path.exists(os.path.join(repo, config.get_state_dir(), "findings.db")))
+            self.assertEqual(os.listdir(cwd), [])
+            close.assert_called_once()
+    
+    def test_show_plan_closes_findings_store(self):
+        """Test planning closes the findings store it reads, even when planning fails"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            state_dir = os.path.join(temp_dir, config.get_state_dir())
+            os.makedirs(state_dir)
+            open(os.path.join(state_dir, "findings.db"), "w").close()
+            collector = MagicMock()
+            collector.git_ops.working_dir = temp_dir
+            
+            with patch("src.main.FindingsStore.for_repo") as for_repo:
+                for_repo.return_value.lookup.side_effect = RuntimeError("database is locked")
+                with self.assertRaises(RuntimeError):
+                    _show_plan([SourceFile("a.py", "x = 1\n", 6, 1)], [],
+                               ReviewInput(ReviewType.GIT_DIFF, temp_dir, {"diff": True}), collector, None,
+                               resume=False, store=True)
+            
+            for_repo.return_value.close.assert_called_once()
     
     @patch.dict(os.environ, {'GOOGLE_API_KEY': 'test_key'})
     def test_llm_client_initialization(self):
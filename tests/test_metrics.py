@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Unit tests for Metrics"""
+
+import os
+import tempfile
+import unittest
+import urllib.request
+from unittest.mock import Mock
+from src.llm_client import LLMClient
+from src.metrics import (
+    REVIEW_FILES, REVIEW_QUEUE_DEPTH, MetricsRegistry, start_metrics_server, timed
+)
+from src.review_orchestrator import ReviewOrchestrator
+from src.source_collector import SourceFile
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    
+    def setUp(self):
+        self.registry = MetricsRegistry()
+    
+    def test_counter_with_labels(self):
+        """Test counters accumulate per label set"""
+        counter = self.registry.counter("requests_total", "Requests")
+        counter.inc(model="a")
+        counter.inc(2, model="a")
+        counter.inc(model="b")
+        
+        self.assertEqual(counter.value(model="a"), 3)
+        self.assertEqual(counter.total(), 4)
+        self.assertIn('requests_total{model="a"} 3', self.registry.render_prometheus())
+    
+    def test_registry_returns_existing_metric(self):
+        """Test registering a name twice returns the same metric"""
+        first = self.registry.counter("c", "C")
+        self.assertIs(self.registry.counter("c", "C"), first)
+    
+    def test_gauge_up_down_and_function(self):
+        """Test gauges can move both ways or be computed at scrape time"""
+        gauge = self.registry.gauge("in_flight", "In flight")
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+        self.registry.gauge("ratio", "Ratio", lambda: 0.5)
+        
+        output = self.registry.render_prometheus()
+        
+        self.assertIn("in_flight 1", output)
+        self.assertIn("ratio 0.5", output)
+        self.assertIn("# TYPE ratio gauge", output)
+    
+    def test_histogram_buckets_are_cumulative(self):
+        """Test histogram exposition follows the Prometheus format"""
+        histogram = self.registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(5)
+        
+        output = self.registry.render_prometheus()
+        
+        self.assertIn('latency_seconds_bucket{le="0.1"} 1', output)
+        self.assertIn('latency_seconds_bucket{le="1.0"} 2', output)
+        self.assertIn('latency_seconds_bucket{le="+Inf"} 3', output)
+        self.assertIn("latency_seconds_sum 5.55", output)
+        self.assertIn("latency_seconds_count 3", output)
+    
+    def test_timed_decorator(self):
+        """Test durations are observed even when the call raises"""
+        histogram = self.registry.histogram("git_seconds", "Git")
+        
+        @timed(histogram, command="diff")
+        def failing():
+            raise ValueError("boom")
+        
+        with self.assertRaises(ValueError):
+            failing()
+        self.assertEqual(histogram.count(command="diff"), 1)
+    
+    def test_dump_writes_file(self):
+        """Test one-shot runs can dump metrics to a file"""
+        self.registry.counter("c", "C").inc()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "out", "metrics.prom")
+            self.registry.dump(path)
+            with open(path, encoding="utf-8") as f:
+                self.assertIn("c 1", f.read())
+
+
+class TestMetricsHooks(unittest.TestCase):
+    
+    def test_orchestrator_tracks_queue_and_outcomes(self):
+        """Test review events update queue depth and per-status counts"""
+        mock_client = Mock(spec=LLMClient)
+        mock_client.code_review.return_value = "Line 1: Issue"
+        mock_client.last_call_cached.return_value = False
+        depth = REVIEW_QUEUE_DEPTH.value()
+        done = REVIEW_FILES.value(status="done")
+        
+        ReviewOrchestrator(mock_client).review([SourceFile("a.py", "x", 1, 1), SourceFile("b.py", "y", 1, 1)])
+        
+        self.assertEqual(REVIEW_QUEUE_DEPTH.value(), depth)
+        self.assertEqual(REVIEW_FILES.value(status="done"), done + 2)
+    
+    def test_metrics_server(self):
+        """Test the global registry is served over HTTP"""
+        server = start_metrics_server(0)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+            with urllib.request.urlopen(url, timeout=5) as response:
+                body = response.read().decode("utf-8")
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        self.assertIn("coder_llm_request_seconds", body)
+        self.assertIn("coder_review_queue_depth", body)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Unit tests for the pre-commit hook"""
+
+import io
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+from src.pre_commit import HOOK_MARKER, format_findings, install_hook, run_hook, uninstall_hook
+from src.review_orchestrator import ReviewResult
+
+
+class TestPreCommitHook(unittest.TestCase):
+    
+    def setUp(self):
+        self.repo = tempfile.mkdtemp()
+        subprocess.run(["git", "init", "-q", self.repo], check=True)
+        self.hook = os.path.join(self.repo, ".git", "hooks", "pre-commit")
+    
+    def tearDown(self):
+        shutil.rmtree(self.repo)
+    
+    def _stage(self, name="app.py", content="x = 1\n"):
+        with open(os.path.join(self.repo, name), "w") as f:
+            f.write(content)
+        subprocess.run(["git", "add", name], cwd=self.repo, check=True)
+    
+    def test_install_and_uninstall(self):
+        """Test the hook is written executable and removed again"""
+        install_hook(self.repo, budget_seconds=5, block=True)
+        
+        with open(self.hook) as f:
+            script = f.read()
+        self.assertIn(HOOK_MARKER, script)
+        self.assertIn("-m src.pre_commit --budget 5 --block", script)
+        self.assertTrue(os.access(self.hook, os.X_OK))
+        self.assertTrue(uninstall_hook(self.repo))
+        self.assertFalse(os.path.exists(self.hook))
+    
+    def test_foreign_hook_kept_unless_forced(self):
+        """Test an existing hook from elsewhere is not overwritten by default"""
+        os.makedirs(os.path.dirname(self.hook), exist_ok=True)
+        with open(self.hook, "w") as f:
+            f.write("#!/bin/sh\nmake lint\n")
+        
+        with self.assertRaises(ValueError):
+            install_hook(self.repo)
+        self.assertFalse(uninstall_hook(self.repo))
+        install_hook(self.repo, force=True)
+        with open(self.hook) as f:
+            self.assertIn(HOOK_MARKER, f.read())
+    
+    def test_format_findings_one_line_each(self):
+        """Test findings are rendered as path:line: message"""
+        lines = format_findings([
+            ReviewResult("b.py", "Line 3: Unused import\nLine 7: Typo in comment", True),
+            ReviewResult("a.py", "Review failed: timeout", False),
+        ])
+        
+        self.assertEqual(lines, ["b.py:3: Unused import", "b.py:7: Typo in comment"])
+    
+    def test_nothing_staged_passes_silently(self):
+        """Test the hook allows commits without staged changes"""
+        out = io.StringIO()
+        
+        self.assertEqual(run_hook(self.repo, out=out), (0, True))
+        self.assertEqual(out.getvalue(), "")
+    
+    def test_findings_block_only_when_requested(self):
+        """Test findings are printed and block the commit only in blocking mode"""
+        self._stage()
+        results = [ReviewResult("app.py", "Line 1: Magic number", True, is_diff=True)]
+        
+        with patch("src.pre_commit._review_stream", return_value=iter(results)):
+            out = io.StringIO()
+            self.assertEqual(run_hook(self.repo, out=out), (0, True))
+        self.assertIn("app.py:1: Magic number", out.getvalue())
+        
+        with patch("src.pre_commit._review_stream", return_value=iter(results)):
+            self.assertEqual(run_hook(self.repo, block=True, out=io.StringIO()), (1, True))
+    
+    def test_budget_exceeded_fails_open(self):
+        """Test a slow review lets the commit through once the budget is spent"""
+        self._stage()
+        
+        def slow_stream(*args):
+            time.sleep(2)
+            yield ReviewResult("app.py", "Line 1: Late finding", True)
+        
+        out = io.StringIO()
+        with patch("src.pre_commit._review_stream", side_effect=slow_stream):
+            code, finished = run_hook(self.repo, budget_seconds=0.1, block=True, out=out)
+        
+        self.assertEqual((code, finished), (0, False))
+        self.assertIn("budget of 0.1s reached", out.getvalue())
+    
+    def test_review_error_fails_open(self):
+        """Test provider errors never block the commit"""
+        self._stage()
+        
+        with patch("src.pre_commit._review_stream", side_effect=RuntimeError("no API key")):
+            out = io.StringIO()
+            self.assertEqual(run_hook(self.repo, block=True, out=out), (0, True))
+        self.assertIn("review skipped (no API key)", out.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Unit tests for Profiler"""
+
+import os
+import tempfile
+import unittest
+from io import StringIO
+from rich.console import Console
+from src.profiler import RunProfiler, memory_checkpoint, module_for_path
+from src.results_formatter import ResultsFormatter
+from src import code_context
+
+
+class TestModuleForPath(unittest.TestCase):
+    
+    def test_buckets(self):
+        """Test mapping of frame paths to report buckets"""
+        self.assertEqual(module_for_path(code_context.__file__), "code_context")
+        self.assertEqual(module_for_path("/usr/lib/python3/site-packages/rich/console.py"), "rich")
+        self.assertEqual(module_for_path("/usr/lib/python3.12/json/decoder.py"), "stdlib")
+        self.assertEqual(module_for_path("<frozen importlib._bootstrap>"), "builtins")
+
+
+class TestRunProfiler(unittest.TestCase):
+    
+    def test_profile_writes_reports(self):
+        """Test CPU and allocation reports are written and attributed"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            prefix = os.path.join(temp_dir, "run")
+            
+            with RunProfiler(prefix) as profiler:
+                context = code_context.get_code_context("x = 1\n" * 2000, 1, 2000)
+            
+            report = profiler.report
+            self.assertEqual(context[1:], (1, 2000))
+            self.assertTrue(os.path.exists(report.pstats_path))
+            self.assertIn("code_context", report.module_cpu)
+            self.assertIn("code_context", report.module_memory)
+            with open(report.allocations_path) as f:
+                self.assertIn("By module (live at that snapshot):", f.read())
+    
+    def test_allocations_freed_before_exit_reported(self):
+        """Test allocations are attributed from the largest snapshot, not the end of the run"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with RunProfiler(os.path.join(temp_dir, "run"), sample_interval=0) as profiler:
+                context = code_context.get_code_context("x = 1\n" * 50000, 1, 50000)
+                memory_checkpoint()
+                del context
+            
+            report = profiler.report
+            self.assertGreater(report.module_memory["code_context"], 200_000)
+            self.assertGreaterEqual(report.snapshot_memory, report.module_memory["code_context"])
+            self.assertGreaterEqual(report.peak_memory, report.snapshot_memory)
+            # The checkpoint hook is inert outside a profiled run
+            memory_checkpoint()
+    
+    def test_report_written_when_run_fails(self):
+        """Test the report is still produced when profiled code raises"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            profiler = RunProfiler(os.path.join(temp_dir, "run"))
+            
+            with self.assertRaises(RuntimeError):
+                with profiler:
+                    raise RuntimeError("boom")
+            
+            self.assertIsNotNone(profiler.report)
+    
+    def test_summary_table(self):
+        """Test the profile summary renders module rows"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with RunProfiler(os.path.join(temp_dir, "run")) as profiler:
+                code_context.get_code_context("x = 1", 1)
+            
+            output = StringIO()
+            ResultsFormatter(Console(file=output, width=120)).display_profile_summary(profiler.report)
+            
+            self.assertIn("Profile", output.getvalue())
+            self.assertIn("code_context", output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Unit tests for Progress Display"""
+
+import unittest
+from rich.console import Console
+from src.progress_display import ReviewProgress, ProgressDashboard
+from src.review_orchestrator import ReviewEvent, ReviewEventType
+
+
+class FakeClock:
+    """Manually advanced clock"""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestReviewProgress(unittest.TestCase):
+    
+    def setUp(self):
+        self.clock = FakeClock()
+        self.progress = ReviewProgress(total=4, clock=self.clock)
+    
+    def test_counts_and_throughput(self):
+        """Test completed, in-flight and tokens/s statistics"""
+        self.progress.handle_event(ReviewEvent(ReviewEventType.IN_FLIGHT, "a.py"))
+        self.progress.handle_event(ReviewEvent(ReviewEventType.IN_FLIGHT, "b.py"))
+        self.clock.now = 10.0
+        self.progress.handle_event(ReviewEvent(ReviewEventType.DONE, "a.py", tokens=500))
+        
+        self.assertEqual(self.progress.completed, 1)
+        self.assertEqual(self.progress.in_flight, 1)
+        self.assertAlmostEqual(self.progress.tokens_per_second, 50.0)
+        self.assertAlmostEqual(self.progress.oldest_in_flight(), 10.0)
+    
+    def test_eta_and_cache_hit_rate(self):
+        """Test ETA extrapolation and cache hit rate"""
+        self.assertIsNone(self.progress.eta_seconds())
+        
+        self.clock.now = 4.0
+        self.progress.handle_event(ReviewEvent(ReviewEventType.DONE, "a.py"))
+        self.progress.handle_event(ReviewEvent(ReviewEventType.CACHED, "b.py"))
+        
+        self.assertAlmostEqual(self.progress.eta_seconds(), 4.0)
+        self.assertAlmostEqual(self.progress.cache_hit_rate, 0.5)
+    
+    def test_failed_counts_as_completed(self):
+        """Test that failures finish a file"""
+        self.progress.handle_event(ReviewEvent(ReviewEventType.FAILED, "a.py"))
+        self.assertEqual(self.progress.completed, 1)
+        self.assertEqual(self.progress.count(ReviewEventType.FAILED), 1)
+
+
+class TestProgressDashboard(unittest.TestCase):
+    
+    def test_render_shows_stats_and_active_files(self):
+        """Test dashboard rendering"""
+        console = Console(record=True, width=120)
+        progress = ReviewProgress(total=2)
+        dashboard = ProgressDashboard(console, progress)
+        
+        dashboard.handle_event(ReviewEvent(ReviewEventType.IN_FLIGHT, "slow.py"))
+        console.print(dashboard.render())
+        output = console.export_text()
+        
+        self.assertIn("0/2 files", output)
+        self.assertIn("1 in flight", output)
+        self.assertIn("slow.py", output)
+
+
+if __name__ == '__main__':
+    unittest.main()
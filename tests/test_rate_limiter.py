@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Unit tests for Rate Limiter"""
+
+import unittest
+from src.rate_limiter import RateLimiter
+
+
+class FakeTime:
+    """Clock whose sleep advances time"""
+    
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+    
+    def clock(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimiter(unittest.TestCase):
+    
+    def test_unlimited_never_waits(self):
+        """Test that 0 requests per minute disables limiting"""
+        limiter = RateLimiter(0)
+        for _ in range(100):
+            self.assertEqual(limiter.acquire(), 0.0)
+    
+    def test_waits_when_bucket_empty(self):
+        """Test that requests beyond the bucket wait for refill"""
+        fake = FakeTime()
+        limiter = RateLimiter(60, clock=fake.clock, sleep=fake.sleep)
+        
+        for _ in range(60):
+            self.assertEqual(limiter.acquire(), 0.0)
+        waited = limiter.acquire()
+        
+        self.assertAlmostEqual(waited, 1.0)
+        self.assertEqual(len(fake.sleeps), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
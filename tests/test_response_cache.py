@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""Unit tests for Response Cache"""
+
+import unittest
+from src.response_cache import ResponseCache
+
+
+class TestResponseCache(unittest.TestCase):
+    
+    def test_key_is_stable_and_request_specific(self):
+        """Test cache keys depend on model, messages and params"""
+        messages = [{"role": "user", "content": "hi"}]
+        key = ResponseCache.make_key("m", messages, {"temperature": 0.1})
+        
+        self.assertEqual(key, ResponseCache.make_key("m", messages, {"temperature": 0.1}))
+        self.assertNotEqual(key, ResponseCache.make_key("other", messages, {"temperature": 0.1}))
+        self.assertNotEqual(key, ResponseCache.make_key("m", messages, {"temperature": 0.5}))
+    
+    def test_get_put_tracks_hits_and_misses(self):
+        """Test hit/miss accounting"""
+        cache = ResponseCache()
+        
+        self.assertIsNone(cache.get("k"))
+        cache.put("k", "response")
+        
+        self.assertEqual(cache.get("k"), "response")
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+    
+    def test_evicts_least_recently_used(self):
+        """Test LRU eviction"""
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")
+        cache.put("c", "3")
+        
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), "1")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Unit tests for the on-disk result spool"""
+
+import io
+import tracemalloc
+import unittest
+from rich.console import Console
+from src.result_spool import ResultSpool
+from src.results_formatter import ResultsFormatter
+from src.review_orchestrator import ReviewResult
+from src.source_collector import SourceFile
+
+
+class TestResultSpool(unittest.TestCase):
+    
+    def test_results_read_back_in_key_order(self):
+        """Test results come back ordered by key, ties in append order"""
+        with ResultSpool() as spool:
+            spool.append(ReviewResult("c.py", "Line 3: Typo", True), key=2)
+            spool.append(ReviewResult("a.py", "", True), key=0)
+            spool.append(ReviewResult("b.py", "Review failed: timeout", False), key=2)
+            
+            self.assertEqual(len(spool), 3)
+            results = list(spool)
+            self.assertEqual([r.file_path for r in results], ["a.py", "c.py", "b.py"])
+            self.assertEqual(results[1].findings[0].line, 3)
+            self.assertFalse(results[2].success)
+            
+            # Appending after reading keeps earlier offsets valid
+            spool.append(ReviewResult("d.py", "", True), key=1)
+            self.assertEqual([r.file_path for r in spool], ["a.py", "d.py", "c.py", "b.py"])
+    
+    def test_release_keeps_metadata(self):
+        """Test reviewed files drop their content but keep what summaries use"""
+        source_file = SourceFile("a.py", "x = 1\n", 6, 1, is_diff=True, diff_info={"added_lines": 1},
+                                 context="def f(): ...", hints=["Line 1: hint"])
+        
+        source_file.release()
+        
+        self.assertIsNone(source_file.content)
+        self.assertIsNone(source_file.context)
+        self.assertIsNone(source_file.hints)
+        self.assertEqual((source_file.path, source_file.diff_info), ("a.py", {"added_lines": 1}))
+
+
+class TestStreamingSummaryTable(unittest.TestCase):
+    
+    def test_memory_bounded(self):
+        """Test spooling and summarizing many large results keeps little in memory"""
+        padding = "x" * 20_000
+        tracemalloc.start()
+        try:
+            with ResultSpool() as spool:
+                baseline = tracemalloc.get_traced_memory()[0]
+                for i in range(1000):
+                    spool.append(ReviewResult(f"f{i}.py", f"Line 1: {i} {padding}", True), key=i)
+                spooled = tracemalloc.get_traced_memory()[0] - baseline
+                ResultsFormatter(Console(file=io.StringIO(), width=120)).display_results_table(spool, max_rows=50)
+                peak = tracemalloc.get_traced_memory()[1] - baseline
+        finally:
+            tracemalloc.stop()
+        
+        # The review texts total 20 MB; a list of the results would hold all of it
+        self.assertLess(spooled, 1_000_000)
+        self.assertLess(peak, 2_000_000)
+    
+    def test_table_from_iterator(self):
+        """Test the summary table consumes a stream and summarizes rows past the limit"""
+        output = io.StringIO()
+        results = (ReviewResult(f"f{i}.py", "Line 1: Bug" if i % 2 else "", True) for i in range(5))
+        
+        ResultsFormatter(Console(file=output, width=120)).display_results_table(results, max_rows=3)
+        
+        text = output.getvalue()
+        self.assertIn("f2.py", text)
+        self.assertNotIn("f3.py", text)
+        self.assertIn("... 2 more files", text)
+        self.assertIn("5 files: 2 with issues (2 findings), 3 clean, 0 failed", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Unit tests for Review Journal"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock
+from src.input_parser import ReviewInput, ReviewType
+from src.llm_client import LLMClient
+from src.review_journal import ReviewJournal, ref_pair, run_identity
+from src.review_orchestrator import ReviewOrchestrator, ReviewResult, ReviewEventType
+from src.source_collector import SourceFile
+
+
+class TestRunIdentity(unittest.TestCase):
+    
+    def setUp(self):
+        self.git_ops = Mock()
+        self.git_ops.resolve_ref.side_effect = lambda ref: f"sha-{ref}"
+    
+    def test_ref_pair_for_review_types(self):
+        """Test base/head refs for each git review type"""
+        commit = ReviewInput(ReviewType.GIT_COMMIT, "abc", {"commit": "abc"})
+        branch = ReviewInput(ReviewType.GIT_BRANCH, "feature", {"branch": "feature"})
+        staged = ReviewInput(ReviewType.GIT_DIFF, ".", {"diff": True})
+        
+        self.assertEqual(ref_pair(commit, self.git_ops), ("sha-abc^", "sha-abc"))
+        self.assertEqual(ref_pair(branch, self.git_ops), ("sha-main", "sha-feature"))
+        self.assertEqual(ref_pair(staged, self.git_ops), ("sha-HEAD", "INDEX"))
+    
+    def test_ref_pair_falls_back_to_literal_refs(self):
+        """Test unresolvable refs are used as-is"""
+        self.git_ops.resolve_ref.side_effect = ValueError("bad ref")
+        branch = ReviewInput(ReviewType.GIT_BRANCH, "feature", {"branch": "feature"})
+        
+        self.assertEqual(ref_pair(branch, self.git_ops), ("main", "feature"))
+    
+    def test_run_identity_depends_on_all_parts(self):
+        """Test identity changes with repo, refs or model"""
+        base = run_identity("/repo", ("a", "b"), "m")
+        
+        self.assertEqual(base, run_identity("/repo", ("a", "b"), "m"))
+        self.assertNotEqual(base, run_identity("/other", ("a", "b"), "m"))
+        self.assertNotEqual(base, run_identity("/repo", ("a", "c"), "m"))
+        self.assertNotEqual(base, run_identity("/repo", ("a", "b"), "m2"))
+
+
+class TestReviewJournal(unittest.TestCase):
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.journal = ReviewJournal(os.path.join(self.temp_dir.name, "run.jsonl"))
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def test_completed_keeps_latest_success(self):
+        """Test failed results are not treated as completed"""
+        self.journal.append(ReviewResult("a.py", "Review failed: 429", False))
+        self.journal.append(ReviewResult("b.py", "Line 1: Issue", True, True, {"type": "branch"}))
+        
+        completed = self.journal.completed()
+        
+        self.assertEqual(list(completed), ["b.py"])
+        self.assertEqual(completed["b.py"].diff_info, {"type": "branch"})
+    
+    def test_reset(self):
+        """Test reset discards checkpoints"""
+        self.journal.append(ReviewResult("a.py", "ok", True))
+        self.journal.reset()
+        self.assertEqual(self.journal.completed(), {})
+    
+    def test_orchestrator_resumes_from_journal(self):
+        """Test that journaled files are skipped and new results checkpointed"""
+        self.journal.append(ReviewResult("a.py", "Line 1: Earlier finding", True))
+        mock_client = Mock(spec=LLMClient)
+        mock_client.code_review.return_value = "Line 2: New finding"
+        mock_client.last_call_cached.return_value = False
+        events = []
+        orchestrator = ReviewOrchestrator(mock_client, on_event=events.append, journal=self.journal)
+        
+        results = orchestrator.review([SourceFile("a.py", "x", 1, 1), SourceFile("b.py", "y", 1, 1)])
+        
+        self.assertEqual([r.review_content for r in results], ["Line 1: Earlier finding", "Line 2: New finding"])
+        mock_client.code_review.assert_called_once_with("y", "b.py")
+        self.assertIn(("a.py", ReviewEventType.CACHED), [(e.file_path, e.event_type) for e in events])
+        self.assertEqual(sorted(self.journal.completed()), ["a.py", "b.py"])
+
+
+if __name__ == '__main__':
+    unittest.main()
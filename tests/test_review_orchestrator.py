@@ -3,7 +3,7 @@
 
 import unittest
 from unittest.mock import Mock
-from src.review_orchestrator import ReviewOrchestrator, ReviewResult
+from src.review_orchestrator import ReviewOrchestrator, ReviewResult, ReviewEventType
 from src.source_collector import SourceFile
 from src.llm_client import LLMClient
 
@@ -12,6 +12,7 @@ class TestReviewOrchestrator(unittest.TestCase):
     
     def setUp(self):
         self.mock_llm_client = Mock(spec=LLMClient)
+        self.mock_llm_client.last_call_cached.return_value = False
         self.orchestrator = ReviewOrchestrator(self.mock_llm_client)
     
     def test_review_single_file(self):
@@ -139,6 +140,76 @@ class TestReviewOrchestrator(unittest.TestCase):
         # Verify both methods were called
         self.mock_llm_client.code_review.assert_called_once()
         self.mock_llm_client.send_message.assert_called_once()
+    
+    def test_review_emits_events(self):
+        """Test that orchestrator emits queued, in-flight and final events"""
+        self.mock_llm_client.code_review.side_effect = ["Line 1: Issue", Exception("API Error")]
+        events = []
+        orchestrator = ReviewOrchestrator(self.mock_llm_client, on_event=events.append)
+        
+        source_files = [
+            SourceFile("ok.py", "def test(): pass", 15, 1),
+            SourceFile("bad.py", "def test(): pass", 15, 1)
+        ]
+        
+        orchestrator.review(source_files)
+        
+        types = [(e.file_path, e.event_type) for e in events]
+        self.assertEqual(types[:2], [("ok.py", ReviewEventType.QUEUED), ("bad.py", ReviewEventType.QUEUED)])
+        self.assertIn(("ok.py", ReviewEventType.IN_FLIGHT), types)
+        self.assertIn(("ok.py", ReviewEventType.DONE), types)
+        self.assertIn(("bad.py", ReviewEventType.FAILED), types)
+        done = [e for e in events if e.event_type == ReviewEventType.DONE][0]
+        self.assertGreater(done.tokens, 0)
+        self.assertEqual(done.result.file_path, "ok.py")
+    
+    def test_iter_review_yields_incrementally(self):
+        """Test that iter_review yields results one at a time"""
+        self.mock_llm_client.code_review.return_value = "No issues"
+        source_files = [SourceFile(f"f{i}.py", "x = 1", 5, 1) for i in range(3)]
+        
+        iterator = self.orchestrator.iter_review(source_files)
+        first = next(iterator)
+        
+        self.assertEqual(first.file_path, "f0.py")
+        self.assertEqual(self.mock_llm_client.code_review.call_count, 1)
+        self.assertEqual(len(list(iterator)), 2)
+    
+    def test_concurrent_review_preserves_order(self):
+        """Test that concurrent reviews are returned in input order"""
+        self.mock_llm_client.code_review.side_effect = lambda content, path: f"Review of {path}"
+        orchestrator = ReviewOrchestrator(self.mock_llm_client, max_workers=4)
+        source_files = [SourceFile(f"f{i}.py", "x = 1", 5, 1) for i in range(8)]
+        
+        results = orchestrator.review(source_files)
+        
+        self.assertEqual([r.file_path for r in results], [f"f{i}.py" for i in range(8)])
+        self.assertEqual(results[3].review_content, "Review of f3.py")
+    
+    def test_structured_findings(self):
+        """Test structured mode asks for JSON and renders the parsed findings"""
+        self.mock_llm_client.code_review.return_value = (
+            '```json\n{"findings": [{"line": 2, "end_line": 3, "severity": "high", '
+            '"category": "bugs", "message": "Division by zero"}]}\n```'
+        )
+        orchestrator = ReviewOrchestrator(self.mock_llm_client, structured=True)
+        
+        result = orchestrator.review([SourceFile("test.py", "x = 1\ny = x / 0", 14, 2)])[0]
+        
+        self.mock_llm_client.code_review.assert_called_once_with("x = 1\ny = x / 0", "test.py", structured=True)
+        self.assertEqual(result.review_content, "- Lines 2-3: [error/bugs] Division by zero")
+        self.assertEqual((result.findings[0].line, result.findings[0].severity), (2, "error"))
+        self.assertEqual(ReviewResult.from_dict(result.to_dict()), result)
+    
+    def test_structured_findings_fall_back_to_text(self):
+        """Test free-form replies in structured mode are parsed as text"""
+        self.mock_llm_client.code_review.return_value = "Line 1: Unused variable"
+        orchestrator = ReviewOrchestrator(self.mock_llm_client, structured=True)
+        
+        result = orchestrator.review([SourceFile("test.py", "x = 1", 5, 1)])[0]
+        
+        self.assertEqual(result.review_content, "Line 1: Unused variable")
+        self.assertEqual([(f.line, f.message, f.severity) for f in result.findings], [(1, "Unused variable", None)])
 
 
 if __name__ == '__main__':
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Unit tests for review planning"""
+
+import unittest
+from src.review_plan import EXPECTED_COMPLETION_TOKENS, PlanStatus, build_plan, projected_seconds
+from src.source_collector import SourceFile
+
+
+def _file(path: str, content: str) -> SourceFile:
+    return SourceFile(path=path, content=content, size=len(content), lines=len(content.splitlines()))
+
+
+class TestBuildPlan(unittest.TestCase):
+    
+    def setUp(self):
+        self.files = [
+            _file("a.py", "x = 1\n" * 100),
+            _file("b.py", "y = 2\n"),
+            _file("copy/a.py", "x = 1\n" * 100),
+            _file("done.py", "z = 3\n"),
+        ]
+    
+    def test_statuses(self):
+        """Test resumed, duplicate and stored files cost no requests"""
+        plan = build_plan(self.files, "model", duplicate_threshold=1.0, completed={"done.py"},
+                          stored=lambda source_file: source_file.path == "b.py",
+                          skipped=[("README.md", "noop")])
+        
+        self.assertEqual([p.status for p in plan.files],
+                         [PlanStatus.REVIEW, PlanStatus.STORED, PlanStatus.DUPLICATE, PlanStatus.RESUMED])
+        self.assertEqual(plan.files[2].note, "copy of a.py")
+        self.assertEqual(plan.requests, 1)
+        self.assertEqual(plan.completion_tokens, EXPECTED_COMPLETION_TOKENS)
+        self.assertEqual(plan.skipped, [("README.md", "noop")])
+    
+    def test_duplicates_reviewed_without_threshold(self):
+        """Test copies are planned for review when deduplication is off"""
+        plan = build_plan(self.files, "model")
+        
+        self.assertEqual(plan.count(PlanStatus.REVIEW), 4)
+        self.assertEqual(plan.files[0].prompt_tokens, plan.files[2].prompt_tokens)
+    
+    def test_aspects_multiply_requests(self):
+        """Test each aspect is a separate request with the full prompt"""
+        single = build_plan(self.files[:1], "model")
+        aspects = build_plan(self.files[:1], "model", aspects=["security", "performance", "style"])
+        
+        self.assertEqual(aspects.requests, 3)
+        self.assertEqual(aspects.prompt_tokens, 3 * single.prompt_tokens)
+    
+    def test_cost(self):
+        """Test cost comes from the price function and is unknown for unpriced models"""
+        priced = build_plan(self.files, "model", price=lambda prompt, completion: (prompt + completion) / 1e6)
+        unpriced = build_plan(self.files, "model", price=lambda prompt, completion: 0.0)
+        
+        self.assertAlmostEqual(priced.cost, (priced.prompt_tokens + priced.completion_tokens) / 1e6)
+        self.assertIsNone(unpriced.cost)
+        self.assertIsNone(build_plan(self.files, "model").cost)
+    
+    def test_to_dict(self):
+        """Test the JSON form carries totals and per-file statuses"""
+        data = build_plan(self.files, "model", duplicate_threshold=1.0).to_dict()
+        
+        self.assertEqual(data["requests"], 3)
+        self.assertEqual(data["files"][2]["status"], "duplicate")
+        self.assertEqual(data["skipped"], [])
+
+
+class TestProjectedSeconds(unittest.TestCase):
+    
+    def test_concurrency(self):
+        """Test reviews are spread over the worker pool in order"""
+        self.assertEqual(projected_seconds([4, 4, 4, 4], 1), 16)
+        self.assertEqual(projected_seconds([4, 4, 4, 4], 2), 8)
+        self.assertEqual(projected_seconds([10, 1, 1, 1], 2), 10)
+        self.assertEqual(projected_seconds([], 4), 0)
+    
+    def test_rate_limit_bounds_duration(self):
+        """Test the rate limit caps throughput however many workers there are"""
+        self.assertEqual(projected_seconds([1] * 20, 10, requests_per_minute=10), 120)
+
+
+if __name__ == "__main__":
+    unittest.main()
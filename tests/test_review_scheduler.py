@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Unit tests for Review Scheduler"""
+
+import unittest
+from unittest.mock import Mock
+from src.llm_client import LLMClient
+from src.review_orchestrator import ReviewOrchestrator, ReviewEventType
+from src.review_scheduler import ReviewBudget, parse_budget, prioritize, estimate_value
+from src.source_collector import SourceFile
+
+
+def diff_file(path, added):
+    return SourceFile(path, "+ 1: x\n" * added, added * 7, added, is_diff=True,
+                      diff_info={"added_lines": added, "removed_lines": 0})
+
+
+class TestParseBudget(unittest.TestCase):
+    
+    def test_time_and_token_budgets(self):
+        """Test wall-clock and token budget specifications"""
+        self.assertEqual(parse_budget("90s"), ReviewBudget(max_seconds=90))
+        self.assertEqual(parse_budget("15m"), ReviewBudget(max_seconds=900))
+        self.assertEqual(parse_budget("50k tokens"), ReviewBudget(max_tokens=50000))
+        self.assertEqual(parse_budget("1h, 2000t"), ReviewBudget(max_seconds=3600, max_tokens=2000))
+    
+    def test_invalid_budget(self):
+        """Test invalid budget specifications"""
+        with self.assertRaises(ValueError):
+            parse_budget("fast")
+    
+    def test_exhausted(self):
+        """Test budget exhaustion checks"""
+        budget = ReviewBudget(max_seconds=10, max_tokens=100)
+        self.assertFalse(budget.exhausted(5, 50))
+        self.assertTrue(budget.exhausted(10, 50))
+        self.assertTrue(budget.exhausted(5, 100))
+
+
+class TestPrioritize(unittest.TestCase):
+    
+    def test_risky_paths_and_code_first(self):
+        """Test risk patterns and file types drive ordering"""
+        files = [
+            diff_file("README.md", 20),
+            diff_file("src/utils.py", 20),
+            diff_file("src/auth/login.py", 20),
+        ]
+        
+        ordered = [f.path for f in prioritize(files)]
+        
+        self.assertEqual(ordered, ["src/auth/login.py", "src/utils.py", "README.md"])
+    
+    def test_more_added_lines_is_more_valuable(self):
+        """Test value grows with added lines"""
+        self.assertGreater(estimate_value(diff_file("a.py", 50)), estimate_value(diff_file("a.py", 5)))
+
+
+class TestBudgetedOrchestration(unittest.TestCase):
+    
+    def setUp(self):
+        self.mock_llm_client = Mock(spec=LLMClient)
+        self.mock_llm_client.code_review.return_value = "No issues"
+        self.mock_llm_client.send_message.return_value = "No issues"
+        self.mock_llm_client.last_call_cached.return_value = False
+    
+    def test_token_budget_stops_with_partial_results(self):
+        """Test that files beyond the budget are skipped, highest priority first"""
+        events = []
+        orchestrator = ReviewOrchestrator(
+            self.mock_llm_client, on_event=events.append,
+            budget=ReviewBudget(max_tokens=1), prioritized=True
+        )
+        files = [diff_file("docs/guide.md", 10), diff_file("src/crypto.py", 10)]
+        
+        results = orchestrator.review(files)
+        
+        self.assertEqual([r.file_path for r in results], ["src/crypto.py"])
+        self.assertEqual(orchestrator.skipped, ["docs/guide.md"])
+        self.assertIn(("docs/guide.md", ReviewEventType.SKIPPED), [(e.file_path, e.event_type) for e in events])
+    
+    def test_concurrent_budget(self):
+        """Test budget enforcement with concurrent workers"""
+        orchestrator = ReviewOrchestrator(
+            self.mock_llm_client, max_workers=2, budget=ReviewBudget(max_seconds=0)
+        )
+        
+        results = orchestrator.review([diff_file(f"f{i}.py", 1) for i in range(4)])
+        
+        self.assertEqual(results, [])
+        self.assertEqual(len(orchestrator.skipped), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
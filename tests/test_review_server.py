@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Unit tests for the review daemon and its client"""
+
+import threading
+import unittest
+import urllib.request
+from unittest.mock import Mock, patch
+from src.config import config
+from src.llm_client import LLMClient
+from src.review_client import DaemonClient
+from src.review_orchestrator import ReviewEventType
+from src.review_server import ReviewService, create_server
+from src.source_collector import SourceFile
+from src.usage import UsageRecord, UsageTracker, record_usage
+
+
+class TestReviewDaemon(unittest.TestCase):
+    
+    def setUp(self):
+        self.service = ReviewService()
+        self.mock_client = Mock(spec=LLMClient)
+        self.mock_client.code_review.return_value = "Line 1: Issue from daemon"
+        self.mock_client.last_call_cached.return_value = False
+        self.service.get_client = Mock(return_value=self.mock_client)
+        
+        self.server = create_server("127.0.0.1", 0, self.service)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        host, port = self.server.server_address[:2]
+        self.client = DaemonClient(host, port)
+    
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+    
+    def test_health_check(self):
+        """Test daemon availability probe"""
+        self.assertTrue(self.client.is_available())
+    
+    def test_metrics_endpoint(self):
+        """Test the daemon serves Prometheus metrics"""
+        host, port = self.server.server_address[:2]
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as response:
+            body = response.read().decode("utf-8")
+        
+        self.assertIn("# TYPE coder_llm_request_seconds histogram", body)
+    
+    def test_review_streams_results_and_events(self):
+        """Test forwarding a review and receiving results and events"""
+        events = []
+        source_files = [SourceFile("a.py", "x = 1", 5, 1), SourceFile("b.py", "y = 2", 5, 1)]
+        
+        results = list(self.client.iter_review(source_files, on_event=events.append))
+        
+        self.assertEqual(sorted(r.file_path for r in results), ["a.py", "b.py"])
+        self.assertIn("Issue from daemon", results[0].review_content)
+        self.assertTrue(results[0].success)
+        self.assertIn(ReviewEventType.DONE, [e.event_type for e in events])
+    
+    def test_review_forwards_usage(self):
+        """Test usage recorded in the daemon reaches the client's tracker"""
+        def review(content, path):
+            record_usage(UsageRecord("m", 10, 3, 0.1))
+            return "No issues"
+        
+        self.mock_client.code_review.side_effect = review
+        tracker = UsageTracker()
+        
+        list(self.client.iter_review([SourceFile("a.py", "x = 1", 5, 1)], usage_tracker=tracker))
+        
+        self.assertEqual(tracker.file_totals("a.py").total_tokens, 13)
+    
+    def test_review_uses_client_settings(self):
+        """Test the daemon reviews with the client's model and output format, not its own"""
+        self.service.stream_review = Mock(wraps=self.service.stream_review)
+        
+        with patch.object(config, "llm_model", "client-model"), patch.object(config, "structured_findings", True):
+            list(self.client.iter_review([SourceFile("a.py", "x = 1", 5, 1)]))
+        
+        args = self.service.stream_review.call_args[0]
+        self.assertEqual(args[1], "client-model")
+        self.assertIs(args[4], True)
+        self.service.get_client.assert_called_with("client-model")
+    
+    def test_unavailable_daemon(self):
+        """Test probe against a port with nothing listening"""
+        self.server.shutdown()
+        self.server.server_close()
+        host, port = self.server.server_address[:2]
+        
+        self.assertFalse(DaemonClient(host, port).is_available())
+        with self.assertRaises(ConnectionError):
+            list(DaemonClient(host, port).iter_review([SourceFile("a.py", "x", 1, 1)]))
+        
+        # Prevent tearDown from shutting down twice
+        self.server = Mock()
+
+
+class TestReviewService(unittest.TestCase):
+    
+    def test_clients_share_cache_and_limiter(self):
+        """Test that warm clients are reused and share state"""
+        service = ReviewService()
+        
+        client = service.get_client("model-a")
+        
+        self.assertIs(client, service.get_client("model-a"))
+        self.assertIsNot(client, service.get_client("model-b"))
+        self.assertIs(client.cache, service.cache)
+        self.assertIs(service.get_client("model-b").rate_limiter, service.rate_limiter)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Unit tests for Sharding"""
+
+import os
+import tempfile
+import unittest
+from src.review_orchestrator import ReviewResult
+from src.review_scheduler import estimate_request_tokens
+from src.sharding import assign_shards, merge_results, parse_shard, select_shard
+from src.source_collector import SourceFile
+from src.tool_ops import append_jsonl
+
+
+def source(path, size):
+    return SourceFile(path, "x" * size, size, 1)
+
+
+class TestParseShard(unittest.TestCase):
+    
+    def test_valid_shard(self):
+        """Test i/N specifications"""
+        self.assertEqual(parse_shard("2/4"), (2, 4))
+        self.assertEqual(parse_shard("1/1"), (1, 1))
+    
+    def test_invalid_shard(self):
+        """Test malformed and out-of-range specifications"""
+        for spec in ["0/3", "4/3", "1/0", "a/b", "3"]:
+            with self.assertRaises(ValueError):
+                parse_shard(spec)
+
+
+class TestAssignShards(unittest.TestCase):
+    
+    def setUp(self):
+        self.files = [source(f"src/file_{i}.py", (i % 7 + 1) * 800) for i in range(40)]
+    
+    def test_every_file_in_exactly_one_shard(self):
+        """Test shards partition the input"""
+        shards = assign_shards(self.files, 3)
+        
+        paths = sorted(f.path for shard in shards for f in shard)
+        self.assertEqual(paths, sorted(f.path for f in self.files))
+    
+    def test_assignment_is_deterministic_and_order_independent(self):
+        """Test runners that collect files in any order agree on shards"""
+        first = [[f.path for f in shard] for shard in assign_shards(self.files, 4)]
+        reordered = [sorted(f.path for f in shard) for shard in assign_shards(list(reversed(self.files)), 4)]
+        
+        self.assertEqual([sorted(shard) for shard in first], reordered)
+    
+    def test_shards_are_balanced_by_tokens(self):
+        """Test estimated token load is spread evenly"""
+        loads = [sum(estimate_request_tokens(f) for f in shard) for shard in assign_shards(self.files, 4)]
+        
+        self.assertLess(max(loads) - min(loads), max(estimate_request_tokens(f) for f in self.files))
+    
+    def test_select_shard_keeps_collection_order(self):
+        """Test a shard lists its files in collection order"""
+        shard = select_shard(self.files, 2, 3)
+        positions = [self.files.index(f) for f in shard]
+        
+        self.assertEqual(positions, sorted(positions))
+    
+    def test_more_shards_than_files(self):
+        """Test surplus shards are empty"""
+        shards = assign_shards(self.files[:2], 5)
+        self.assertEqual(sum(len(shard) for shard in shards), 2)
+
+
+class TestMergeResults(unittest.TestCase):
+    
+    def test_merge_prefers_successful_results(self):
+        """Test shard outputs are combined and sorted by path"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            first = os.path.join(temp_dir, "shard1.jsonl")
+            second = os.path.join(temp_dir, "shard2.jsonl")
+            append_jsonl(first, ReviewResult("b.py", "Line 1: Bug", True).to_dict())
+            append_jsonl(first, ReviewResult("a.py", "Review failed: timeout", False).to_dict())
+            append_jsonl(second, ReviewResult("a.py", "Clean", True).to_dict())
+            append_jsonl(second, ReviewResult("b.py", "Review failed: timeout", False).to_dict())
+            
+            results = merge_results([first, second])
+        
+        self.assertEqual([r.file_path for r in results], ["a.py", "b.py"])
+        self.assertTrue(all(r.success for r in results))
+    
+    def test_missing_input(self):
+        """Test missing shard outputs are reported"""
+        with self.assertRaises(ValueError):
+            merge_results(["/nonexistent/shard.jsonl"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""Unit tests for the cross-file symbol index"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from unittest.mock import Mock
+from src.llm_client import LLMClient
+from src.review_orchestrator import ReviewOrchestrator
+from src.source_collector import SourceFile
+from src.symbol_index import SymbolIndex, extract_python_symbols, extract_regex_symbols, repository_root
+
+
+UTILS = '''
+def normalize(path: str, strict=False) -> str:
+    """Normalize a path.
+
+    Long explanation that is not kept.
+    """
+    return path
+
+
+class Cache:
+    """In-memory cache"""
+
+    def get(self, key):
+        """Return a cached value"""
+
+    def _evict(self):
+        pass
+'''
+
+
+def _source_file(path: str, content: str) -> SourceFile:
+    return SourceFile(path=path, content=content, size=len(content), lines=len(content.splitlines()))
+
+
+class TestExtraction(unittest.TestCase):
+    
+    def test_python_signatures_and_docs(self):
+        """Test functions, classes and public methods are extracted with doc summaries"""
+        symbols = {s.qualname: s for s in extract_python_symbols("utils.py", UTILS)}
+        
+        self.assertEqual(set(symbols), {"normalize", "Cache", "Cache.get"})
+        self.assertEqual(symbols["normalize"].signature, "def normalize(path: str, strict=False) -> str")
+        self.assertEqual(symbols["normalize"].doc, "Normalize a path.")
+        self.assertEqual(symbols["Cache.get"].kind, "method")
+    
+    def test_python_syntax_error_yields_nothing(self):
+        """Test unparsable files are skipped"""
+        self.assertEqual(extract_python_symbols("broken.py", "def broken(:\n"), [])
+    
+    def test_regex_languages(self):
+        """Test ctags-style patterns find definitions and their leading comments"""
+        go = "// Parse reads a config\nfunc Parse(data []byte) (*Config, error) {\n}\ntype Config struct {\n"
+        symbols = extract_regex_symbols("config.go", go, "go")
+        
+        self.assertEqual([(s.name, s.kind, s.line) for s in symbols], [("Parse", "function", 2), ("Config", "type", 4)])
+        self.assertEqual(symbols[0].doc, "Parse reads a config")
+        
+        js = "export async function loadUser(id) {\n}\nconst save = async (user) => {\n"
+        self.assertEqual([s.name for s in extract_regex_symbols("user.js", js, "js")], ["loadUser", "save"])
+
+
+class TestSymbolIndex(unittest.TestCase):
+    
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        try:
+            subprocess.run(["git", "init", "-q", self.root], capture_output=True, check=True)
+        except (OSError, subprocess.CalledProcessError):
+            self.skipTest("git not available")
+        self._write("lib/utils.py", UTILS)
+        self._write("app.py", "from lib.utils import normalize\n\ndef main():\n    return normalize('a')\n")
+        self._write(".coder/ignored.py", "def hidden():\n    pass\n")
+        self.index = SymbolIndex(":memory:", self.root)
+    
+    def tearDown(self):
+        self.index.close()
+    
+    def _write(self, path: str, content: str) -> None:
+        full_path = os.path.join(self.root, path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, "w", encoding="utf-8") as f:
+            f.write(content)
+    
+    def test_update_is_incremental(self):
+        """Test only added, changed or removed files are re-indexed"""
+        self.assertEqual(self.index.update(), 2)
+        self.assertEqual(self.index.update(), 0)
+        self.assertEqual(self.index.lookup(["hidden"]), {})
+        
+        self._write("app.py", "def main():\n    return 1\n")
+        os.remove(os.path.join(self.root, "lib/utils.py"))
+        self.assertEqual(self.index.update(), 2)
+        self.assertEqual(self.index.lookup(["normalize"]), {})
+        self.assertEqual(list(self.index.lookup(["main"])), ["main"])
+    
+    def test_only_files_git_would_track_are_indexed(self):
+        """Test ignored files are skipped and directories outside git are not indexed at all"""
+        self._write(".gitignore", "build/\n")
+        self._write("build/generated.py", "def generated():\n    pass\n")
+        
+        self.index.update()
+        
+        self.assertEqual(self.index.lookup(["generated"]), {})
+        self.assertEqual(list(self.index.lookup(["main"])), ["main"])
+        with tempfile.TemporaryDirectory() as outside:
+            self.assertIsNone(repository_root(outside))
+            self.assertIsNone(SymbolIndex.for_repo(os.path.join(outside, "notes.py")))
+            self.assertEqual(os.listdir(outside), [])
+    
+    def test_touch_without_change_is_not_reparsed(self):
+        """Test a new mtime with identical content keeps the indexed symbols"""
+        self.index.update()
+        path = os.path.join(self.root, "app.py")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        
+        self.assertEqual(self.index.update(), 0)
+    
+    def test_context_for_referenced_names(self):
+        """Test context holds referenced definitions from other files only"""
+        self.index.update()
+        app = _source_file("app.py", "from lib.utils import normalize\n\ndef main():\n    return normalize('a')\n")
+        
+        context = self.index.context_for(app, 500)
+        
+        self.assertIn("# lib/utils.py:2\ndef normalize(path: str, strict=False) -> str", context)
+        self.assertNotIn("def main", context)
+        self.assertNotIn("Cache", context)
+    
+    def test_methods_need_their_class(self):
+        """Test a method name alone does not pull in unrelated class methods"""
+        self.index.update()
+        
+        self.assertEqual(self.index.context_for(_source_file("other.py", "value = store.get(key)\n"), 500), "")
+        context = self.index.context_for(_source_file("other.py", "cache = Cache()\ncache.get(key)\n"), 500)
+        self.assertIn("class Cache", context)
+        self.assertIn("def get(self, key)", context)
+    
+    def test_context_respects_token_budget(self):
+        """Test definitions that don't fit the budget are left out"""
+        self.index.update()
+        code = "cache = Cache()\nnormalize(cache.get(key))\nnormalize(path)\n"
+        
+        full = self.index.context_for(_source_file("other.py", code), 500)
+        small = self.index.context_for(_source_file("other.py", code), 25)
+        
+        self.assertIn("def normalize", small)
+        self.assertLess(len(small), len(full))
+        self.assertEqual(self.index.context_for(_source_file("other.py", code), 0), "")
+
+
+class TestContextInPrompts(unittest.TestCase):
+    
+    def test_code_review_prompt_includes_context(self):
+        """Test context is presented to the model as reference material"""
+        client = LLMClient()
+        client.send_message = Mock(return_value="ok")
+        
+        client.code_review("x = normalize(p)", "app.py", context="def normalize(path) -> str")
+        
+        user_message = client.send_message.call_args[0][0]
+        self.assertIn("do not review them", user_message)
+        self.assertIn("def normalize(path) -> str", user_message)
+    
+    def test_orchestrator_passes_context(self):
+        """Test the orchestrator hands a file's context to the client"""
+        llm_client = Mock(spec=LLMClient)
+        llm_client.code_review.return_value = "No issues"
+        llm_client.last_call_cached.return_value = False
+        source_file = _source_file("app.py", "x = normalize(p)")
+        source_file.context = "def normalize(path) -> str"
+        
+        list(ReviewOrchestrator(llm_client).iter_review([source_file]))
+        
+        llm_client.code_review.assert_called_once_with(
+            "x = normalize(p)", "app.py", context="def normalize(path) -> str", hints=None
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Unit tests for Tool Operations"""
+
+import os
+import tempfile
+import unittest
+from src.tool_ops import append_jsonl, read_jsonl, is_text_file
+
+
+class TestJsonl(unittest.TestCase):
+    
+    def test_append_and_read_round_trip(self):
+        """Test records appended to JSONL are read back in order"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "nested", "out.jsonl")
+            append_jsonl(path, {"n": 1})
+            append_jsonl(path, {"n": 2})
+            
+            self.assertEqual([r["n"] for r in read_jsonl(path)], [1, 2])
+    
+    def test_read_skips_truncated_line(self):
+        """Test a partial trailing line from a crash is ignored"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "out.jsonl")
+            with open(path, "w") as f:
+                f.write('{"n": 1}\n{"n": ')
+            
+            self.assertEqual(list(read_jsonl(path)), [{"n": 1}])
+    
+    def test_read_missing_file(self):
+        """Test reading a missing file yields nothing"""
+        self.assertEqual(list(read_jsonl("/nonexistent/out.jsonl")), [])
+
+
+class TestIsTextFile(unittest.TestCase):
+    
+    def test_is_text_file(self):
+        """Test extension-based text detection"""
+        self.assertTrue(is_text_file("module.py"))
+        self.assertFalse(is_text_file("image.png"))
+
+
+if __name__ == '__main__':
+    unittest.main()
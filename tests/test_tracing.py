@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Unit tests for Tracing"""
+
+import json
+import os
+import tempfile
+import unittest
+from src.tracing import Tracer, traced, tracer
+
+
+class TestTracer(unittest.TestCase):
+    
+    def setUp(self):
+        self.tracer = Tracer()
+    
+    def test_disabled_tracer_records_nothing(self):
+        """Test spans are free when tracing is off"""
+        with self.tracer.span("stage", key="value") as attributes:
+            attributes["extra"] = 1
+        
+        self.assertEqual(self.tracer.spans, [])
+    
+    def test_span_records_duration_and_attributes(self):
+        """Test attributes passed in and added inside the block are kept"""
+        self.tracer.enable()
+        
+        with self.tracer.span("llm.send_message", model="m") as attributes:
+            attributes["prompt_tokens"] = 10
+        
+        span = self.tracer.spans[0]
+        self.assertEqual(span["name"], "llm.send_message")
+        self.assertEqual(span["attributes"], {"model": "m", "prompt_tokens": 10})
+        self.assertGreaterEqual(span["duration"], 0)
+    
+    def test_span_records_errors(self):
+        """Test failing blocks are recorded with the error"""
+        self.tracer.enable()
+        
+        with self.assertRaises(ValueError):
+            with self.tracer.span("git.diff"):
+                raise ValueError("boom")
+        
+        self.assertEqual(self.tracer.spans[0]["attributes"]["error"], "boom")
+    
+    def test_export_chrome_trace(self):
+        """Test Chrome trace event export"""
+        self.tracer.enable()
+        with self.tracer.span("render.results_table", rows=object()):
+            pass
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "trace.json")
+            self.tracer.export_chrome_trace(path)
+            with open(path) as f:
+                trace = json.load(f)
+        
+        event = trace["traceEvents"][0]
+        self.assertEqual(event["ph"], "X")
+        self.assertEqual(event["cat"], "render")
+        self.assertIsInstance(event["args"]["rows"], str)
+
+
+class TestTracedDecorator(unittest.TestCase):
+    
+    def tearDown(self):
+        tracer.reset()
+    
+    def test_traced_function(self):
+        """Test decorator records a span on the global tracer"""
+        @traced("custom.stage")
+        def work(x):
+            return x * 2
+        
+        tracer.enable()
+        
+        self.assertEqual(work(2), 4)
+        self.assertEqual([span["name"] for span in tracer.spans], ["custom.stage"])
+
+
+if __name__ == '__main__':
+    unittest.main()
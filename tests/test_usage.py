@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Unit tests for Usage Accounting"""
+
+import json
+import os
+import tempfile
+import unittest
+from io import StringIO
+from unittest.mock import Mock
+from rich.console import Console
+from src.llm_client import LLMClient
+from src.results_formatter import ResultsFormatter
+from src.review_orchestrator import ReviewOrchestrator, ReviewEventType
+from src.source_collector import SourceFile
+from src.usage import UsageRecord, UsageTracker, record_usage
+
+
+class TestUsageTracker(unittest.TestCase):
+    
+    def setUp(self):
+        self.tracker = UsageTracker()
+    
+    def test_records_are_attributed_to_file_scope(self):
+        """Test usage inside a file scope is attributed to that file"""
+        with self.tracker.file_scope("src/a.py"):
+            record_usage(UsageRecord("m", 100, 20, 1.5, cost=0.01))
+            record_usage(UsageRecord("m", 0, 0, 0.0, cache_hit=True))
+        record_usage(UsageRecord("m", 999, 999, 9.9))
+        
+        totals = self.tracker.file_totals("src/a.py")
+        
+        self.assertEqual((totals.requests, totals.total_tokens, totals.cache_hits), (2, 120, 1))
+        self.assertEqual(self.tracker.totals().requests, 2)
+    
+    def test_grouping_by_file_type(self):
+        """Test aggregation per file extension"""
+        for path, tokens in [("a.py", 10), ("b.py", 20), ("c.js", 5)]:
+            with self.tracker.file_scope(path):
+                record_usage(UsageRecord("m", tokens, 0, 0.1))
+        
+        by_type = self.tracker.by_file_type()
+        
+        self.assertEqual(by_type[".py"].prompt_tokens, 30)
+        self.assertEqual(by_type[".js"].requests, 1)
+    
+    def test_dump_json(self):
+        """Test JSON usage report"""
+        with self.tracker.file_scope("a.py"):
+            record_usage(UsageRecord("m", 10, 5, 0.2))
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "usage.json")
+            self.tracker.dump_json(path)
+            with open(path) as f:
+                report = json.load(f)
+        
+        self.assertEqual(report["run"]["total_tokens"], 15)
+        self.assertEqual(report["by_file"]["a.py"]["requests"], 1)
+        self.assertEqual(report["requests"][0]["file_path"], "a.py")
+    
+    def test_orchestrator_reports_real_tokens(self):
+        """Test orchestrator events carry tracked token counts"""
+        mock_client = Mock(spec=LLMClient)
+        mock_client.last_call_cached.return_value = False
+        
+        def review(content, path):
+            record_usage(UsageRecord("m", 40, 2, 0.5))
+            return "No issues"
+        
+        mock_client.code_review.side_effect = review
+        events = []
+        orchestrator = ReviewOrchestrator(mock_client, on_event=events.append, usage_tracker=self.tracker)
+        
+        orchestrator.review([SourceFile("a.py", "x = 1", 5, 1)])
+        
+        done = [e for e in events if e.event_type == ReviewEventType.DONE][0]
+        self.assertEqual(done.tokens, 42)
+        self.assertEqual(self.tracker.file_totals("a.py").requests, 1)
+    
+    def test_usage_summary_table(self):
+        """Test usage summary rendering"""
+        with self.tracker.file_scope("a.py"):
+            record_usage(UsageRecord("m", 1234, 56, 0.5, cost=0.0021))
+        output = StringIO()
+        
+        ResultsFormatter(Console(file=output, width=120)).display_usage_summary(self.tracker)
+        
+        self.assertIn("LLM Usage", output.getvalue())
+        self.assertIn("1234", output.getvalue())
+        self.assertIn("$0.0021", output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
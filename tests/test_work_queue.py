@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Unit tests for Work Queue"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock
+from src.llm_client import LLMClient
+from src.review_orchestrator import ReviewResult
+from src.source_collector import SourceFile
+from src.work_queue import QueueWorker, WorkQueue
+
+
+class FakeClock:
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestWorkQueue(unittest.TestCase):
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.clock = FakeClock()
+        self.queue = WorkQueue(os.path.join(self.temp_dir.name, "queue.db"), lease_seconds=60,
+                               max_attempts=2, clock=self.clock)
+        self.files = [SourceFile("a.py", "a = 1", 5, 1), SourceFile("b.py", "b = 1", 5, 1)]
+    
+    def tearDown(self):
+        self.queue.close()
+        self.temp_dir.cleanup()
+    
+    def test_claims_are_exclusive_and_fifo(self):
+        """Test each task is leased to one worker at a time"""
+        batch_id = self.queue.enqueue(self.files, model="m")
+        
+        first = self.queue.claim("w1")
+        second = self.queue.claim("w2")
+        
+        self.assertEqual((first.source_file.path, second.source_file.path), ("a.py", "b.py"))
+        self.assertEqual(first.model, "m")
+        self.assertIsNone(self.queue.claim("w3"))
+        self.assertEqual(self.queue.counts(batch_id), {"leased": 2})
+    
+    def test_expired_lease_is_reclaimed(self):
+        """Test tasks of dead workers return to the queue"""
+        self.queue.enqueue(self.files[:1])
+        task = self.queue.claim("dead")
+        
+        self.clock.now += 61
+        retry = self.queue.claim("alive")
+        
+        self.assertEqual(retry.task_id, task.task_id)
+        self.assertEqual(retry.attempts, 2)
+        self.assertFalse(self.queue.renew(task.task_id, "dead"))
+    
+    def test_renew_keeps_lease(self):
+        """Test renewing prevents reclaiming a slow but alive worker"""
+        self.queue.enqueue(self.files[:1])
+        task = self.queue.claim("slow")
+        
+        self.clock.now += 50
+        self.assertTrue(self.queue.renew(task.task_id, "slow"))
+        self.clock.now += 50
+        
+        self.assertIsNone(self.queue.claim("other"))
+    
+    def test_lease_expiring_too_often_fails_task(self):
+        """Test tasks are given up after max_attempts lost leases"""
+        batch_id = self.queue.enqueue(self.files[:1])
+        for _ in range(2):
+            self.queue.claim("dead")
+            self.clock.now += 61
+        
+        self.assertIsNone(self.queue.claim("alive"))
+        results = self.queue.results(batch_id)
+        self.assertEqual(self.queue.counts(batch_id), {"failed": 1})
+        self.assertFalse(results[0].success)
+    
+    def test_failed_review_is_retried_then_failed(self):
+        """Test failures release the task until attempts run out"""
+        batch_id = self.queue.enqueue(self.files[:1])
+        error = ReviewResult("a.py", "Review failed: 500", False)
+        
+        self.queue.fail(self.queue.claim("w").task_id, "w", error)
+        self.assertEqual(self.queue.counts(batch_id), {"pending": 1})
+        self.queue.fail(self.queue.claim("w").task_id, "w", error)
+        
+        self.assertEqual(self.queue.counts(batch_id), {"failed": 1})
+    
+    def test_straggler_result_kept_once(self):
+        """Test a task completes once even if two workers finish it"""
+        batch_id = self.queue.enqueue(self.files[:1])
+        task = self.queue.claim("straggler")
+        self.clock.now += 61
+        self.queue.claim("retry")
+        
+        self.assertTrue(self.queue.complete(task.task_id, "straggler", ReviewResult("a.py", "first", True)))
+        self.assertFalse(self.queue.complete(task.task_id, "retry", ReviewResult("a.py", "second", True)))
+        self.assertEqual(self.queue.results(batch_id)[0].review_content, "first")
+
+
+class TestQueueWorker(unittest.TestCase):
+    
+    def test_worker_drains_queue(self):
+        """Test a worker reviews every task and writes results back"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            queue = WorkQueue(os.path.join(temp_dir, "queue.db"))
+            batch_id = queue.enqueue([SourceFile("a.py", "a = 1", 5, 1), SourceFile("b.py", "b = 1", 5, 1)])
+            mock_client = Mock(spec=LLMClient)
+            mock_client.code_review.return_value = "Line 1: Issue"
+            mock_client.last_call_cached.return_value = False
+            service = Mock()
+            service.get_client.return_value = mock_client
+            
+            processed = QueueWorker(queue, service=service, worker_id="w").run(drain=True)
+            
+            self.assertEqual(processed, 2)
+            self.assertEqual([r.file_path for r in queue.results(batch_id)], ["a.py", "b.py"])
+            self.assertEqual(queue.counts(batch_id), {"done": 2})
+            queue.close()
+
+
+if __name__ == '__main__':
+    unittest.main()